@@ -0,0 +1,66 @@
+"""m3u_change_logs: composite (change_type, change_time DESC) index
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17 12:00:00.000000
+
+Backs the "filter by change type" view of ``GET /api/m3u/changes``
+(``WHERE change_type=? ORDER BY change_time DESC LIMIT/OFFSET``). The
+baseline only has a single-column ``idx_m3u_change_type``, so SQLite
+either walked ``idx_m3u_change_time`` testing every row's type or
+filtered on the type index and then sorted the matches in a temp
+B-tree. With the equality column leading and ``change_time DESC``
+trailing, the page is read straight off the index in order.
+
+The account-filtered view is already covered by the baseline's
+``idx_m3u_change_account_time``. ``idx_m3u_change_type`` is kept: it
+is a prefix of the new index but dropping it is not needed for the
+plan, and keeping it makes downgrade a pure drop.
+
+Idempotency: ``M3UChangeLog.__table_args__`` declares the index in
+``models.py``, so an install whose ``init_db`` ran
+``Base.metadata.create_all()`` may already have it. The upgrade skips
+creation when present (same guard as 0004).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, Sequence[str], None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_names(connection, table_name: str) -> set[str]:
+    if not inspect(connection).has_table(table_name):
+        return set()
+    return {idx["name"] for idx in inspect(connection).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Add idx_m3u_change_type_time to m3u_change_logs."""
+    conn = op.get_bind()
+    if "idx_m3u_change_type_time" in _index_names(conn, "m3u_change_logs"):
+        return
+
+    # literal_column keeps the DESC (matching the baseline's
+    # idx_m3u_change_account_time pattern).
+    with op.batch_alter_table("m3u_change_logs", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_m3u_change_type_time",
+            ["change_type", sa.literal_column("change_time DESC")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop idx_m3u_change_type_time."""
+    conn = op.get_bind()
+    if "idx_m3u_change_type_time" in _index_names(conn, "m3u_change_logs"):
+        with op.batch_alter_table("m3u_change_logs", schema=None) as batch_op:
+            batch_op.drop_index("idx_m3u_change_type_time")
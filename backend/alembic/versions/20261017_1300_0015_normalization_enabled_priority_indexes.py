@@ -0,0 +1,68 @@
+"""normalization rules/groups: enabled + priority composite indexes
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 13:00:00.000000
+
+Backs NormalizationEngine._load_rules(), which every normalize() on a
+cold ruleset runs:
+
+- ``normalization_rule_groups WHERE enabled = 1 ORDER BY priority``
+- ``normalization_rules WHERE enabled = 1 ORDER BY group_id, priority``
+
+The baseline only has single-column ``enabled`` indexes on both tables,
+so SQLite filtered on those and then sorted the matches in a temp
+B-tree. With ``enabled`` leading and the sort columns trailing, both
+loads read rows straight off the index in order.
+
+Per-group reads (``WHERE group_id = ? ORDER BY priority``) are already
+served by the baseline's ``idx_norm_rule_priority (group_id, priority)``,
+so no duplicate is added for them. The single-column indexes are kept,
+which keeps downgrade a pure drop.
+
+Idempotency: both indexes are declared in ``models.py``, so an install
+whose ``init_db`` ran ``Base.metadata.create_all()`` may already have
+them. The upgrade skips any that are present (same guard as 0004).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, Sequence[str], None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = (
+    ("normalization_rule_groups", "idx_norm_group_enabled_priority", ["enabled", "priority"]),
+    ("normalization_rules", "idx_norm_rule_enabled_group_priority", ["enabled", "group_id", "priority"]),
+)
+
+
+def _index_names(connection, table_name: str) -> set[str]:
+    if not inspect(connection).has_table(table_name):
+        return set()
+    return {idx["name"] for idx in inspect(connection).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Add the enabled/priority composite indexes."""
+    conn = op.get_bind()
+    for table_name, index_name, columns in _INDEXES:
+        if index_name in _index_names(conn, table_name):
+            continue
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.create_index(index_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop the enabled/priority composite indexes."""
+    conn = op.get_bind()
+    for table_name, index_name, _columns in _INDEXES:
+        if index_name in _index_names(conn, table_name):
+            with op.batch_alter_table(table_name, schema=None) as batch_op:
+                batch_op.drop_index(index_name)
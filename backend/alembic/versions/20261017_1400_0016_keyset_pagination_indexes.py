@@ -0,0 +1,77 @@
+"""notifications / unique_client_connections: (ts DESC, id DESC) keyset indexes
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17 14:00:00.000000
+
+Backs cursor pagination on ``GET /api/notifications`` and
+``GET /api/stats/watch-history``
+(``WHERE (ts, id) < (?, ?) ORDER BY ts DESC, id DESC LIMIT ?``).
+
+- ``idx_unique_client_connected_id`` on ``(connected_at DESC, id DESC)``.
+  The baseline has no ``connected_at`` index at all, so every watch
+  history page sorted the whole (filtered) table in a temp B-tree.
+- ``idx_notification_created_id`` on ``(created_at DESC, id DESC)``.
+  The baseline's ``idx_notification_created_at`` covers the seek but not
+  the ``id`` tie-break, leaving a temp B-tree for the right part of the
+  ORDER BY.
+
+With both columns in the index the page is a single range seek read in
+order, however deep the cursor. ``idx_notification_created_at`` is kept
+so downgrade is a pure drop.
+
+Idempotency: both indexes are declared in ``models.py``
+``__table_args__``, so an install whose ``init_db`` ran
+``Base.metadata.create_all()`` may already have them. The upgrade skips
+each one when present (same guard as 0014).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, Sequence[str], None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = (
+    ("unique_client_connections", "idx_unique_client_connected_id", "connected_at"),
+    ("notifications", "idx_notification_created_id", "created_at"),
+)
+
+
+def _index_names(connection, table_name: str) -> set[str]:
+    if not inspect(connection).has_table(table_name):
+        return set()
+    return {idx["name"] for idx in inspect(connection).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Add the (ts DESC, id DESC) keyset pagination indexes."""
+    conn = op.get_bind()
+    for table_name, index_name, ts_column in _INDEXES:
+        if not inspect(conn).has_table(table_name):
+            continue
+        if index_name in _index_names(conn, table_name):
+            continue
+        # literal_column keeps the DESC (matching 0014).
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.create_index(
+                index_name,
+                [sa.literal_column(f"{ts_column} DESC"), sa.literal_column("id DESC")],
+                unique=False,
+            )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    conn = op.get_bind()
+    for table_name, index_name, _ in _INDEXES:
+        if index_name in _index_names(conn, table_name):
+            with op.batch_alter_table(table_name, schema=None) as batch_op:
+                batch_op.drop_index(index_name)
@@ -2704,6 +2704,23 @@ def get_session():
     return _SessionLocal()
 
 
+async def get_db():
+    """FastAPI dependency: a session that is closed once the request is done.
+
+    Use as ``db: Session = Depends(get_db)`` in place of a hand-written
+    ``get_session()`` / ``try`` / ``finally: db.close()`` block. It is an
+    async generator so FastAPI opens and closes the session on the event
+    loop; a sync generator's close would run on a threadpool thread, and on
+    the shared StaticPool connection its rollback would discard other
+    sessions' uncommitted writes.
+    """
+    db = get_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_engine():
     """Get the database engine."""
     if _engine is None:
@@ -1,11 +1,28 @@
 import asyncio
 import httpx
 import logging
+import time
 from typing import Optional
 from config import get_settings, DispatcharrSettings
 
 logger = logging.getLogger(__name__)
 
+# Server groups are re-read by every update/delete for journal context; a
+# short memo lets back-to-back bulk edits share one upstream fetch.
+SERVER_GROUPS_CACHE_TTL_SECONDS = 0.5
+
+# Single M3U accounts are read first by most M3U endpoints (and again for
+# journal context); a short per-account memo lets a page load or a burst of
+# edits share one fetch. Writes for that account clear it; pollers waiting on
+# a refresh bypass it.
+M3U_ACCOUNT_CACHE_TTL_SECONDS = 3.0
+
+# Channel-group id -> name map used for journal descriptions and post-refresh
+# change capture. Writes through this client clear it; callers that may see
+# groups Dispatcharr created on its own (e.g. during an M3U refresh) invalidate
+# it when an ID is missing, and the TTL bounds staleness from upstream renames.
+CHANNEL_GROUP_NAMES_CACHE_TTL_SECONDS = 300.0
+
 
 class DispatcharrClient:
     """API client for Dispatcharr with JWT authentication."""
@@ -19,13 +36,26 @@ class DispatcharrClient:
             timeout=30.0,
             limits=httpx.Limits(
                 max_connections=20,
-                max_keepalive_connections=5,
+                # Routers fan out up to 8 concurrent upstream calls; keep that
+                # many connections warm between bursts instead of re-handshaking
+                max_keepalive_connections=10,
                 keepalive_expiry=5.0,
             ),
         )
         # Lock to prevent multiple concurrent authentication attempts
         # This prevents race conditions when many requests arrive simultaneously
         self._auth_lock = asyncio.Lock()
+        # (fetched_at monotonic timestamp, server groups list) or None
+        self._server_groups_cache: Optional[tuple[float, list]] = None
+        self._server_groups_by_id: dict[int, dict] = {}
+        # (fetched_at monotonic timestamp, {group_id: group_name}) or None
+        self._channel_group_names_cache: Optional[tuple[float, dict[int, str]]] = None
+        # Single-flight rebuilds: concurrent callers on a cold or expired memo
+        # wait for one upstream fetch instead of each issuing their own
+        self._server_groups_lock = asyncio.Lock()
+        self._channel_group_names_lock = asyncio.Lock()
+        # account_id -> (fetched_at monotonic timestamp, account dict)
+        self._m3u_account_cache: dict[int, tuple[float, dict]] = {}
 
     @property
     def _uses_api_key(self) -> bool:
@@ -241,6 +271,32 @@ class DispatcharrClient:
         response.raise_for_status()
         return response.json()
 
+    async def channel_group_names(self) -> dict[int, str]:
+        """Get a cached ``{group_id: group_name}`` map of all channel groups.
+
+        Rebuilt at most every CHANNEL_GROUP_NAMES_CACHE_TTL_SECONDS, or sooner
+        after a channel-group write through this client.
+        """
+        cached = self._channel_group_names_cache
+        if cached is not None and time.monotonic() - cached[0] < CHANNEL_GROUP_NAMES_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        async with self._channel_group_names_lock:
+            # Another caller may have rebuilt it while we waited
+            now = time.monotonic()
+            cached = self._channel_group_names_cache
+            if cached is not None and now - cached[0] < CHANNEL_GROUP_NAMES_CACHE_TTL_SECONDS:
+                return cached[1]
+
+            groups = await self.get_channel_groups()
+            names = {g["id"]: g["name"] for g in groups}
+            self._channel_group_names_cache = (now, names)
+            return names
+
+    def invalidate_channel_group_names(self) -> None:
+        """Drop the cached channel-group name map."""
+        self._channel_group_names_cache = None
+
     async def create_channel_group(self, name: str) -> dict:
         """Create a new channel group.
 
@@ -250,6 +306,7 @@ class DispatcharrClient:
         response = await self._request(
             "POST", "/api/channels/groups/", json={"name": name}
         )
+        self.invalidate_channel_group_names()
         if response.status_code >= 400:
             # Include response body in exception for better error handling
             error_body = response.text
@@ -261,12 +318,16 @@ class DispatcharrClient:
         response = await self._request(
             "PATCH", f"/api/channels/groups/{group_id}/", json=data
         )
+        self.invalidate_channel_group_names()
         response.raise_for_status()
         return response.json()
 
     async def delete_channel_group(self, group_id: int) -> None:
         """Delete a channel group."""
         response = await self._request("DELETE", f"/api/channels/groups/{group_id}/")
+        self.invalidate_channel_group_names()
+        # Accounts embed their channel-group settings
+        self.invalidate_m3u_account_cache()
         response.raise_for_status()
 
     # -------------------------------------------------------------------------
@@ -422,11 +483,30 @@ class DispatcharrClient:
         logger.info("[DISPATCHARR]   Unique channel group IDs extracted: %s", len(all_settings))
         return all_settings
 
-    async def get_m3u_account(self, account_id: int) -> dict:
-        """Get a single M3U account by ID."""
+    async def get_m3u_account(self, account_id: int, *, use_cache: bool = True) -> dict:
+        """Get a single M3U account by ID.
+
+        Results are memoized per account for M3U_ACCOUNT_CACHE_TTL_SECONDS.
+        Pass use_cache=False when the caller needs to observe upstream changes
+        (e.g. polling for refresh completion).
+        """
+        now = time.monotonic()
+        cached = self._m3u_account_cache.get(account_id)
+        if use_cache and cached is not None and now - cached[0] < M3U_ACCOUNT_CACHE_TTL_SECONDS:
+            return cached[1]
+
         response = await self._request("GET", f"/api/m3u/accounts/{account_id}/")
         response.raise_for_status()
-        return response.json()
+        account = response.json()
+        self._m3u_account_cache[account_id] = (now, account)
+        return account
+
+    def invalidate_m3u_account_cache(self, account_id: Optional[int] = None) -> None:
+        """Drop the memoized M3U account (all accounts when account_id is None)."""
+        if account_id is None:
+            self._m3u_account_cache.clear()
+        else:
+            self._m3u_account_cache.pop(account_id, None)
 
     async def create_m3u_account(self, data: dict) -> dict:
         """Create a new M3U account."""
@@ -439,20 +519,29 @@ class DispatcharrClient:
         response = await self._request(
             "PUT", f"/api/m3u/accounts/{account_id}/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
-        return response.json()
+        account = response.json()
+        # The response is the updated account; seed the memo with it
+        self._m3u_account_cache[account_id] = (time.monotonic(), account)
+        return account
 
     async def patch_m3u_account(self, account_id: int, data: dict) -> dict:
         """Partially update an M3U account (e.g., toggle is_active)."""
         response = await self._request(
             "PATCH", f"/api/m3u/accounts/{account_id}/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
-        return response.json()
+        account = response.json()
+        # The response is the updated account; seed the memo with it
+        self._m3u_account_cache[account_id] = (time.monotonic(), account)
+        return account
 
     async def delete_m3u_account(self, account_id: int) -> None:
         """Delete an M3U account."""
         response = await self._request("DELETE", f"/api/m3u/accounts/{account_id}/")
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
 
     async def refresh_m3u_account(self, account_id: int) -> dict:
@@ -460,12 +549,14 @@ class DispatcharrClient:
         response = await self._request(
             "POST", f"/api/m3u/refresh/{account_id}/"
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json() if response.content else {"success": True, "message": "Refresh initiated"}
 
     async def refresh_all_m3u_accounts(self) -> dict:
         """Trigger refresh for all active M3U accounts."""
         response = await self._request("POST", "/api/m3u/refresh/")
+        self.invalidate_m3u_account_cache()
         response.raise_for_status()
         return response.json() if response.content else {"success": True, "message": "Refresh initiated"}
 
@@ -474,6 +565,7 @@ class DispatcharrClient:
         response = await self._request(
             "POST", f"/api/m3u/accounts/{account_id}/refresh-vod/"
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json() if response.content else {"success": True, "message": "VOD refresh initiated"}
 
@@ -494,6 +586,7 @@ class DispatcharrClient:
         response = await self._request(
             "POST", f"/api/m3u/accounts/{account_id}/filters/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json()
 
@@ -504,6 +597,7 @@ class DispatcharrClient:
         response = await self._request(
             "PUT", f"/api/m3u/accounts/{account_id}/filters/{filter_id}/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json()
 
@@ -512,6 +606,7 @@ class DispatcharrClient:
         response = await self._request(
             "DELETE", f"/api/m3u/accounts/{account_id}/filters/{filter_id}/"
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
 
     # -------------------------------------------------------------------------
@@ -529,6 +624,7 @@ class DispatcharrClient:
         response = await self._request(
             "POST", f"/api/m3u/accounts/{account_id}/profiles/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json()
 
@@ -547,6 +643,7 @@ class DispatcharrClient:
         response = await self._request(
             "PATCH", f"/api/m3u/accounts/{account_id}/profiles/{profile_id}/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json()
 
@@ -555,6 +652,7 @@ class DispatcharrClient:
         response = await self._request(
             "DELETE", f"/api/m3u/accounts/{account_id}/profiles/{profile_id}/"
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
 
     # -------------------------------------------------------------------------
@@ -574,6 +672,7 @@ class DispatcharrClient:
         response = await self._request(
             "PATCH", f"/api/m3u/accounts/{account_id}/group-settings/", json=data
         )
+        self.invalidate_m3u_account_cache(account_id)
         response.raise_for_status()
         return response.json()
 
@@ -581,15 +680,55 @@ class DispatcharrClient:
     # Server Groups
     # -------------------------------------------------------------------------
 
-    async def get_server_groups(self) -> list:
-        """Get all server groups."""
+    async def get_server_groups(self, *, use_cache: bool = True) -> list:
+        """Get all server groups.
+
+        Results are memoized for SERVER_GROUPS_CACHE_TTL_SECONDS so a burst of
+        update/delete calls shares one fetch. Any server-group write clears it.
+        """
+        if not use_cache:
+            return await self._fetch_server_groups(time.monotonic())
+
+        async with self._server_groups_lock:
+            now = time.monotonic()
+            cached = self._server_groups_cache
+            if cached is not None and now - cached[0] < SERVER_GROUPS_CACHE_TTL_SECONDS:
+                logger.debug("[DISPATCHARR] Server groups served from memo (age %.3fs)", now - cached[0])
+                return cached[1]
+            return await self._fetch_server_groups(now)
+
+    async def _fetch_server_groups(self, now: float) -> list:
         response = await self._request("GET", "/api/m3u/server-groups/")
         response.raise_for_status()
+        groups = response.json()
+        self._server_groups_cache = (now, groups)
+        self._server_groups_by_id = {g.get("id"): g for g in groups}
+        return groups
+
+    async def get_server_group(self, group_id: int) -> dict:
+        """Get a single server group by ID, or {} if it does not exist.
+
+        Served from the get_server_groups() memo when it is fresh; otherwise
+        fetches just this group rather than the whole list.
+        """
+        cached = self._server_groups_cache
+        if cached is not None and time.monotonic() - cached[0] < SERVER_GROUPS_CACHE_TTL_SECONDS:
+            return self._server_groups_by_id.get(group_id, {})
+
+        response = await self._request("GET", f"/api/m3u/server-groups/{group_id}/")
+        if response.status_code == 404:
+            return {}
+        response.raise_for_status()
         return response.json()
 
+    def invalidate_server_groups_cache(self) -> None:
+        """Drop the memoized server groups list."""
+        self._server_groups_cache = None
+
     async def create_server_group(self, data: dict) -> dict:
         """Create a new server group."""
         response = await self._request("POST", "/api/m3u/server-groups/", json=data)
+        self.invalidate_server_groups_cache()
         response.raise_for_status()
         return response.json()
 
@@ -598,12 +737,14 @@ class DispatcharrClient:
         response = await self._request(
             "PATCH", f"/api/m3u/server-groups/{group_id}/", json=data
         )
+        self.invalidate_server_groups_cache()
         response.raise_for_status()
         return response.json()
 
     async def delete_server_group(self, group_id: int) -> None:
         """Delete a server group."""
         response = await self._request("DELETE", f"/api/m3u/server-groups/{group_id}/")
+        self.invalidate_server_groups_cache()
         response.raise_for_status()
 
     # -------------------------------------------------------------------------
@@ -1035,6 +1176,10 @@ class DispatcharrClient:
 # Singleton instance
 _client: Optional[DispatcharrClient] = None
 _client_settings_hash: Optional[str] = None
+# Settings object the singleton was last checked against; load_settings()
+# returns the same cached object until settings are saved, so an identity
+# match skips rebuilding the hash on every call
+_client_settings: Optional[DispatcharrSettings] = None
 
 
 def _settings_hash(settings: DispatcharrSettings) -> str:
@@ -1043,21 +1188,32 @@ def _settings_hash(settings: DispatcharrSettings) -> str:
 
 
 def get_client() -> DispatcharrClient:
-    """Get the Dispatcharr client, recreating if settings changed."""
-    global _client, _client_settings_hash
+    """Get the Dispatcharr client, recreating if settings changed.
+
+    The client (and its pooled keep-alive connections) is shared by every
+    caller; it is only rebuilt when the connection settings change. A
+    replaced client is never closed here: long-lived holders (the bandwidth
+    tracker, stream prober, refresh pollers) may still be using it, and its
+    pool is released when the last reference goes away.
+    """
+    global _client, _client_settings_hash, _client_settings
 
     settings = get_settings()
-    current_hash = _settings_hash(settings)
+    if _client is not None and settings is _client_settings:
+        return _client
 
+    current_hash = _settings_hash(settings)
     if _client is None or _client_settings_hash != current_hash:
         _client = DispatcharrClient(settings)
         _client_settings_hash = current_hash
+    _client_settings = settings
 
     return _client
 
 
 def reset_client() -> None:
     """Reset the client (call after settings change)."""
-    global _client, _client_settings_hash
+    global _client, _client_settings_hash, _client_settings
     _client = None
     _client_settings_hash = None
+    _client_settings = None
@@ -1,10 +1,12 @@
 """
 Journal service layer for logging and querying change entries.
 """
-import json
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Any
+
+import orjson
 from sqlalchemy import func, desc
 from sqlalchemy.orm import Session
 
@@ -14,6 +16,18 @@ from models import JournalEntry
 logger = logging.getLogger(__name__)
 
 
+# log_entry_background() buffer of (timestamp, log_entry kwargs), drained
+# by a single task that commits everything queued so far in one transaction
+JOURNAL_BATCH_MAX_ENTRIES = 200
+_pending_entries: list[tuple[datetime, dict]] = []
+_drain_task: Optional[asyncio.Task] = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a before/after payload; int dict keys become strings like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def log_entry(
     category: str,
     action_type: str,
@@ -42,24 +56,29 @@ def log_entry(
     Returns:
         The created JournalEntry or None if failed
     """
+    return _insert_entry(
+        category, action_type, entity_name, description, entity_id,
+        before_value, after_value, user_initiated, batch_id,
+    )
+
+
+def _insert_entry(
+    category: str,
+    action_type: str,
+    entity_name: str,
+    description: str,
+    entity_id: Optional[int] = None,
+    before_value: Optional[dict] = None,
+    after_value: Optional[dict] = None,
+    user_initiated: bool = True,
+    batch_id: Optional[str] = None,
+    timestamp: Optional[datetime] = None,
+) -> Optional[JournalEntry]:
     try:
         session: Session = get_session()
-        logger.debug(
-            "[JOURNAL] Creating entry: category=%s action=%s entity=%r (id=%s) user_initiated=%s%s",
-            category, action_type, entity_name, entity_id, user_initiated,
-            (" batch_id=%s" % batch_id) if batch_id else ""
-        )
-        entry = JournalEntry(
-            timestamp=datetime.utcnow(),
-            category=category,
-            action_type=action_type,
-            entity_id=entity_id,
-            entity_name=entity_name,
-            description=description,
-            before_value=json.dumps(before_value) if before_value else None,
-            after_value=json.dumps(after_value) if after_value else None,
-            user_initiated=user_initiated,
-            batch_id=batch_id,
+        entry = _build_entry(
+            category, action_type, entity_name, description, entity_id,
+            before_value, after_value, user_initiated, batch_id, timestamp,
         )
         session.add(entry)
         session.commit()
@@ -71,6 +90,96 @@ def log_entry(
         return None
 
 
+def _build_entry(
+    category: str,
+    action_type: str,
+    entity_name: str,
+    description: str,
+    entity_id: Optional[int] = None,
+    before_value: Optional[dict] = None,
+    after_value: Optional[dict] = None,
+    user_initiated: bool = True,
+    batch_id: Optional[str] = None,
+    timestamp: Optional[datetime] = None,
+) -> JournalEntry:
+    logger.debug(
+        "[JOURNAL] Creating entry: category=%s action=%s entity=%r (id=%s) user_initiated=%s%s",
+        category, action_type, entity_name, entity_id, user_initiated,
+        (" batch_id=%s" % batch_id) if batch_id else ""
+    )
+    return JournalEntry(
+        timestamp=timestamp or datetime.utcnow(),
+        category=category,
+        action_type=action_type,
+        entity_id=entity_id,
+        entity_name=entity_name,
+        description=description,
+        before_value=_dumps(before_value) if before_value else None,
+        after_value=_dumps(after_value) if after_value else None,
+        user_initiated=user_initiated,
+        batch_id=batch_id,
+    )
+
+
+def log_entry_background(**kwargs: Any) -> None:
+    """
+    Queue a journal entry for a batched write after the current handler.
+
+    For async request handlers that should not hold their response on the
+    journal's DB write. Takes the same keyword arguments as log_entry(); the
+    entry keeps the time it was queued. The write runs in a task on the
+    event loop, like every other session on the shared SQLite connection
+    (StaticPool); entries queued before it runs are committed together in
+    one batch. Must be called from the event loop.
+    """
+    global _drain_task
+    _pending_entries.append((datetime.utcnow(), kwargs))
+    loop = asyncio.get_running_loop()
+    if _drain_task is None or _drain_task.done() or _drain_task.get_loop() is not loop:
+        _drain_task = loop.create_task(_drain_pending_entries())
+
+
+async def _drain_pending_entries() -> None:
+    while _pending_entries:
+        batch = _pending_entries[:JOURNAL_BATCH_MAX_ENTRIES]
+        del _pending_entries[:JOURNAL_BATCH_MAX_ENTRIES]
+        _write_entries(batch)
+        # Let handlers queue more before the next batch
+        await asyncio.sleep(0)
+
+
+def _write_entries(batch: list[tuple[datetime, dict]]) -> None:
+    """Commit a batch of queued entries; falls back to one-by-one writes on failure."""
+    try:
+        session: Session = get_session()
+    except Exception as e:
+        logger.exception("[JOURNAL] Failed to log %s queued entries: %s", len(batch), e)
+        return
+    try:
+        session.add_all([
+            _build_entry(timestamp=timestamp, **kwargs)
+            for timestamp, kwargs in batch
+        ])
+        session.commit()
+        logger.debug("[JOURNAL] Logged %s queued entries", len(batch))
+        return
+    except Exception as e:
+        session.rollback()
+        logger.warning("[JOURNAL] Batch write of %s entries failed, retrying individually: %s", len(batch), e)
+    finally:
+        session.close()
+
+    for timestamp, kwargs in batch:
+        _insert_entry(timestamp=timestamp, **kwargs)
+
+
+async def flush_background_entries() -> None:
+    """Wait for queued log_entry_background() writes (called on app shutdown)."""
+    task = _drain_task
+    if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+        await asyncio.gather(task, return_exceptions=True)
+
+
 def get_entries(
     page: int = 1,
     page_size: int = 50,
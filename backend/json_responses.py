@@ -0,0 +1,35 @@
+"""
+orjson-encoded JSON responses shared by the routers.
+
+For read endpoints whose payloads are already plain JSON types (upstream
+Dispatcharr data, cached dicts), these skip FastAPI's jsonable_encoder walk
+and stdlib json encoding.
+"""
+import hashlib
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def json_response(content) -> Response:
+    """Encode a plain-JSON payload with orjson and return it as-is."""
+    return Response(orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS), media_type="application/json")
+
+
+def etag_json_response(request: Request, content) -> Response:
+    """Like json_response(), with a weak ETag so polling clients can revalidate.
+
+    A matching If-None-Match gets an empty 304. "no-cache" makes browsers
+    revalidate every time rather than reuse a copy that a write just made stale.
+    """
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: ignore W/ prefixes on either side
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
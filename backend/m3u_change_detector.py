@@ -8,12 +8,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from cache import get_cache
 from models import M3USnapshot, M3UChangeLog
 
 logger = logging.getLogger(__name__)
 
+# Cache-key prefix for the encoded GET /api/m3u/snapshots pages
+SNAPSHOT_LIST_CACHE_PREFIX = "m3u_snapshots:"
+
 
 @dataclass
 class GroupChange:
@@ -154,6 +159,7 @@ class M3UChangeDetector:
         self.db.add(snapshot)
         self.db.commit()
         self.db.refresh(snapshot)
+        get_cache().invalidate_prefix(SNAPSHOT_LIST_CACHE_PREFIX)
 
         logger.info(
             "[M3U-CHANGE] Created snapshot %s for account %s: %s groups, %s streams",
@@ -474,10 +480,22 @@ class M3UChangeDetector:
         Returns:
             Summary dict with counts by type
         """
-        changes = self.get_changes_since(since, m3u_account_id)
+        # Let the database aggregate: one row per (account, change type)
+        # instead of every change log row
+        query = self.db.query(
+            M3UChangeLog.m3u_account_id,
+            M3UChangeLog.change_type,
+            func.count(),
+            func.coalesce(func.sum(M3UChangeLog.count), 0),
+        ).filter(M3UChangeLog.change_time >= since)
+
+        if m3u_account_id is not None:
+            query = query.filter(M3UChangeLog.m3u_account_id == m3u_account_id)
+
+        rows = query.group_by(M3UChangeLog.m3u_account_id, M3UChangeLog.change_type).all()
 
         summary = {
-            "total_changes": len(changes),
+            "total_changes": 0,
             "groups_added": 0,
             "groups_removed": 0,
             "streams_added": 0,
@@ -486,16 +504,17 @@ class M3UChangeDetector:
             "since": since.isoformat() + "Z",
         }
 
-        for change in changes:
-            summary["accounts_affected"].add(change.m3u_account_id)
-            if change.change_type == "group_added":
-                summary["groups_added"] += 1
-            elif change.change_type == "group_removed":
-                summary["groups_removed"] += 1
-            elif change.change_type == "streams_added":
-                summary["streams_added"] += change.count
-            elif change.change_type == "streams_removed":
-                summary["streams_removed"] += change.count
+        for account_id, change_type, row_count, item_count in rows:
+            summary["total_changes"] += row_count
+            summary["accounts_affected"].add(account_id)
+            if change_type == "group_added":
+                summary["groups_added"] += row_count
+            elif change_type == "group_removed":
+                summary["groups_removed"] += row_count
+            elif change_type == "streams_added":
+                summary["streams_added"] += item_count
+            elif change_type == "streams_removed":
+                summary["streams_removed"] += item_count
 
         summary["accounts_affected"] = list(summary["accounts_affected"])
 
@@ -1074,6 +1074,21 @@ async def shutdown_event():
     if prober:
         await prober.stop()
 
+    # Stop M3U refresh pollers and close the shared M3U playlist HTTP client
+    try:
+        from routers.m3u import cancel_refresh_poll_tasks, close_playlist_http_client
+        await cancel_refresh_poll_tasks()
+        await close_playlist_http_client()
+    except Exception as e:
+        logger.warning("[MAIN] Error shutting down M3U refresh resources: %s", e)
+
+    # Let journal entries queued by request handlers finish writing
+    try:
+        import journal
+        await journal.flush_background_entries()
+    except Exception as e:
+        logger.warning("[MAIN] Error flushing journal entries: %s", e)
+
     # Shut down the CPU-bound thread pool (bd-w3z4h)
     try:
         from concurrency import shutdown_cpu_pool
@@ -4,6 +4,8 @@ SQLAlchemy ORM models for the Journal and Bandwidth tracking features.
 import json
 import logging
 from datetime import datetime, date
+
+import orjson
 from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, DateTime, Date, Float, Index, ForeignKey, UniqueConstraint, CheckConstraint
 from sqlalchemy.orm import relationship
 from db_base import Base
@@ -523,6 +525,8 @@ class Notification(Base):
     __table_args__ = (
         Index("idx_notification_read", read),
         Index("idx_notification_created_at", created_at.desc()),
+        # Keyset pagination (created_at, id) cursor seek
+        Index("idx_notification_created_id", created_at.desc(), id.desc()),
         Index("idx_notification_type", type),
         Index("idx_notification_source", source),
     )
@@ -573,6 +577,7 @@ class NormalizationRuleGroup(Base):
     __table_args__ = (
         Index("idx_norm_group_enabled", enabled),
         Index("idx_norm_group_priority", priority),
+        Index("idx_norm_group_enabled_priority", enabled, priority),
     )
 
     def to_dict(self) -> dict:
@@ -665,6 +670,7 @@ class NormalizationRule(Base):
         Index("idx_norm_rule_group", group_id),
         Index("idx_norm_rule_enabled", enabled),
         Index("idx_norm_rule_priority", group_id, priority),
+        Index("idx_norm_rule_enabled_group_priority", enabled, group_id, priority),
         Index("idx_norm_rule_tag_group", tag_group_id),
     )
 
@@ -673,10 +679,14 @@ class NormalizationRule(Base):
         if not self.conditions:
             return []
         try:
-            return json.loads(self.conditions)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(self.conditions)
+        except (orjson.JSONDecodeError, TypeError):
             return []
 
+    def set_conditions(self, conditions: list | None) -> None:
+        """Set conditions from list; an empty list clears them (legacy fields apply)."""
+        self.conditions = orjson.dumps(conditions).decode() if conditions else None
+
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
         return {
@@ -949,17 +959,23 @@ class M3UChangeLog(Base):
         Index("idx_m3u_change_time", change_time.desc()),
         Index("idx_m3u_change_account_time", m3u_account_id, change_time.desc()),
         Index("idx_m3u_change_type", change_type),
+        Index("idx_m3u_change_type_time", change_type, change_time.desc()),
     )
 
-    def get_stream_names(self) -> list:
-        """Parse stream_names JSON into list."""
-        if not self.stream_names:
+    @staticmethod
+    def parse_stream_names(raw: str | None) -> list:
+        """Parse a stored stream_names JSON value into a list."""
+        if not raw:
             return []
         try:
-            return json.loads(self.stream_names)
+            return json.loads(raw)
         except (ValueError, TypeError):
             return []
 
+    def get_stream_names(self) -> list:
+        """Parse stream_names JSON into list."""
+        return self.parse_stream_names(self.stream_names)
+
     def set_stream_names(self, names: list) -> None:
         """Set stream_names from list."""
         self.stream_names = json.dumps(names) if names else None
@@ -1108,6 +1124,8 @@ class UniqueClientConnection(Base):
         Index("idx_unique_client_ip_date", ip_address, date),
         # Composite for finding unique viewers per channel per day
         Index("idx_unique_client_channel_ip_date", channel_id, ip_address, date),
+        # Watch history keyset pagination (connected_at, id) cursor seek
+        Index("idx_unique_client_connected_id", connected_at.desc(), id.desc()),
     )
 
     def to_dict(self) -> dict:
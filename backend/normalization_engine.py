@@ -56,8 +56,10 @@ import unicodedata
 from typing import Optional
 from dataclasses import dataclass, field
 
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 
+from cache import get_cache
 import safe_regex  # bd-eio04.14: ReDoS-guarded wrapper for user-supplied regex
 from models import NormalizationRule, NormalizationRuleGroup, TagGroup, Tag
 
@@ -114,6 +116,36 @@ def invalidate_tag_cache():
     _tag_group_cache.clear()
     NormalizationEngine._tag_group_id_cache.clear()
     clear_abbreviation_cache()
+    # Rules embed their tag group's name in the cached list responses
+    invalidate_rules_cache()
+
+
+# Key prefix for the cached GET /api/normalization/rules and /groups
+# responses. Anything that writes rule groups, rules or tag group names
+# must call invalidate_rules_cache() after committing.
+RULES_RESPONSE_CACHE_PREFIX = "normalization_rules:"
+
+# Enabled ruleset shared by every engine from get_normalization_engine(), as
+# the (groups, rules-per-group) lists _load_rules() builds. It holds
+# session-less copies of the ORM objects so they outlive the loading
+# request. The generation counter keeps a load that raced an invalidation
+# from publishing rules read before the write.
+_ruleset_snapshot: Optional[tuple[list, list]] = None
+_ruleset_generation = 0
+
+
+def _detached_copy(obj):
+    """Copy a mapped object's column values into a new, session-less instance."""
+    mapper = sa_inspect(type(obj))
+    return mapper.class_(**{attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs})
+
+
+def invalidate_rules_cache():
+    """Drop the shared ruleset and cached rule/group list responses."""
+    global _ruleset_snapshot, _ruleset_generation
+    _ruleset_snapshot = None
+    _ruleset_generation += 1
+    get_cache().invalidate_prefix(RULES_RESPONSE_CACHE_PREFIX)
 
 
 # Unicode superscript to ASCII mapping. The historical split into
@@ -695,15 +727,26 @@ class NormalizationEngine:
     each group, rules are processed in priority order.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, shared_ruleset: bool = False):
         self.db = db
+        # Read and publish the module-level ruleset snapshot instead of
+        # querying the enabled rules for every engine instance
+        self.shared_ruleset = shared_ruleset
         self._rules_cache: Optional[list] = None
         self._groups_cache: Optional[list] = None
+        # Per-rule work that is the same for every text a rule is tested
+        # against, memoized for the rules × texts loops
+        self._pattern_cache: dict[tuple[NormalizationPolicy, str], str] = {}
+        self._conditions_cache: dict[str, list] = {}
 
     def invalidate_cache(self):
         """Clear cached rules to force reload from database."""
         self._rules_cache = None
         self._groups_cache = None
+        self._pattern_cache.clear()
+        self._conditions_cache.clear()
+        if self.shared_ruleset:
+            invalidate_rules_cache()
         # Also clear tag group cache
         global _tag_group_cache
         _tag_group_cache.clear()
@@ -741,9 +784,15 @@ class NormalizationEngine:
         Load all enabled rules from database, organized by group.
         Returns list of (group, rules) tuples ordered by group priority.
         """
+        global _ruleset_snapshot
+        if self._rules_cache is None and self.shared_ruleset:
+            snapshot = _ruleset_snapshot
+            if snapshot is not None:
+                self._groups_cache, self._rules_cache = snapshot
         if self._rules_cache is not None and self._groups_cache is not None:
             return list(zip(self._groups_cache, self._rules_cache))
 
+        generation = _ruleset_generation
         # Load enabled groups ordered by priority
         groups = (
             self.db.query(NormalizationRuleGroup)
@@ -752,21 +801,16 @@ class NormalizationEngine:
             .all()
         )
 
+        # Load every enabled rule in one query, ordered by priority within
+        # each group, then bucket them under their groups
+        rules_by_group = self._rules_by_group(NormalizationRule.enabled == True)
+
         result = []
         all_groups = []
         all_rules = []
 
         for group in groups:
-            # Load enabled rules for this group, ordered by priority
-            rules = (
-                self.db.query(NormalizationRule)
-                .filter(
-                    NormalizationRule.group_id == group.id,
-                    NormalizationRule.enabled == True
-                )
-                .order_by(NormalizationRule.priority)
-                .all()
-            )
+            rules = rules_by_group.get(group.id, [])
             result.append((group, rules))
             all_groups.append(group)
             all_rules.append(rules)
@@ -774,8 +818,57 @@ class NormalizationEngine:
         self._groups_cache = all_groups
         self._rules_cache = all_rules
 
+        if self.shared_ruleset and generation == _ruleset_generation:
+            _ruleset_snapshot = (
+                [_detached_copy(group) for group in all_groups],
+                [[_detached_copy(rule) for rule in rules] for rules in all_rules],
+            )
+
         return result
 
+    def _rules_by_group(self, *criteria) -> dict[int, list[NormalizationRule]]:
+        """
+        Load rules matching ``criteria`` in a single query, grouped by group_id.
+        Each group's list is in rule priority order.
+        """
+        rules_by_group: dict[int, list[NormalizationRule]] = {}
+        rules = (
+            self.db.query(NormalizationRule)
+            .filter(*criteria)
+            .order_by(NormalizationRule.group_id, NormalizationRule.priority)
+            .all()
+        )
+        for rule in rules:
+            rules_by_group.setdefault(rule.group_id, []).append(rule)
+        return rules_by_group
+
+    def _prepare_pattern(self, pattern: str) -> str:
+        """
+        Return a condition pattern run through the NormalizationPolicy.
+
+        Memoized per policy and pattern, so a rule tested against many texts
+        pays for NFC / superscript conversion of its pattern once.
+        """
+        policy = get_default_policy()
+        key = (policy, pattern)
+        prepared = self._pattern_cache.get(key)
+        if prepared is None:
+            prepared = self._pattern_cache[key] = policy.apply_to_text(pattern)
+        return prepared
+
+    def _rule_conditions(self, rule: NormalizationRule) -> list:
+        """
+        Return rule.get_conditions(), parsing each distinct conditions JSON
+        once rather than on every text the rule is matched against.
+        """
+        raw = rule.conditions
+        if not raw or not isinstance(raw, str):
+            return rule.get_conditions()
+        conditions = self._conditions_cache.get(raw)
+        if conditions is None:
+            conditions = self._conditions_cache[raw] = rule.get_conditions()
+        return conditions
+
     def _match_single_condition(
         self,
         text: str,
@@ -794,12 +887,34 @@ class NormalizationEngine:
         for test_rule / test_rules_batch; normalize() preprocesses once
         at the top of the loop and hands already-canonical text in.
         """
-        policy = get_default_policy()
-        text = policy.apply_to_text(text)
-        pattern = policy.apply_to_text(pattern)
+        return self._match_prepared_condition(
+            get_default_policy().apply_to_text(text),
+            condition_type,
+            self._prepare_pattern(pattern),
+            case_sensitive,
+        )
 
+    def _match_prepared_condition(
+        self,
+        text: str,
+        condition_type: str,
+        pattern: str,
+        case_sensitive: bool = False,
+        lowered_text: Optional[str] = None
+    ) -> RuleMatch:
+        """
+        _match_single_condition() for text and pattern that have already been
+        through the NormalizationPolicy. Lets bulk callers run the policy once
+        per text / pattern instead of once per pair.
+
+        Bulk callers may also pass lowered_text, text.lower() computed once,
+        so case-insensitive rules do not re-lowercase the same text.
+        """
         # Prepare text for matching
-        match_text = text if case_sensitive else text.lower()
+        if case_sensitive:
+            match_text = text
+        else:
+            match_text = lowered_text if lowered_text is not None else text.lower()
         match_pattern = pattern if case_sensitive else pattern.lower()
 
         if condition_type == "always":
@@ -975,7 +1090,7 @@ class NormalizationEngine:
         Returns RuleMatch with match details.
         """
         # Check for compound conditions first
-        conditions = rule.get_conditions()
+        conditions = self._rule_conditions(rule)
         if conditions:
             return self._match_compound_conditions(text, conditions, rule.condition_logic)
 
@@ -997,6 +1112,10 @@ class NormalizationEngine:
             rule.case_sensitive
         )
 
+    # Relative cost of evaluating one condition type, used to check cheap
+    # literal conditions before regexes when order cannot change the result.
+    _CONDITION_COST = {"always": 0, "contains": 1, "starts_with": 1, "ends_with": 1, "regex": 10}
+
     def _match_compound_conditions(
         self,
         text: str,
@@ -1006,51 +1125,57 @@ class NormalizationEngine:
         """
         Match text against multiple conditions with AND/OR logic.
         The first condition's match info is used for the action (primary condition).
+
+        Evaluation short-circuits. AND checks conditions cheapest first and
+        stops at the first failure. OR checks the non-negated conditions in
+        order and stops at the first match, which is the primary match;
+        negated conditions are only checked when none of those matched.
         """
         if not conditions:
             return RuleMatch(matched=False)
 
-        results = []
-        primary_match = None  # Match info from first condition for action application
-
-        for i, cond in enumerate(conditions):
-            cond_type = cond.get("type", "always")
-            cond_value = cond.get("value", "")
-            cond_case_sensitive = cond.get("case_sensitive", False)
-            cond_negate = cond.get("negate", False)
-
-            match = self._match_single_condition(text, cond_type, cond_value, cond_case_sensitive)
-
-            # Apply negation
-            if cond_negate:
-                matched = not match.matched
-            else:
-                matched = match.matched
-
-            results.append(matched)
+        def evaluate(cond) -> RuleMatch:
+            return self._match_single_condition(
+                text,
+                cond.get("type", "always"),
+                cond.get("value", ""),
+                cond.get("case_sensitive", False),
+            )
 
-            # Store the first *matching*, non-negated condition's span as the primary
-            # match for action application. Not pinned to i == 0: for an OR rule whose
-            # first condition mismatched but a later one matched, the old `i == 0` guard
-            # left primary_match=None, fell through to `match_end=len(text)` below, and a
-            # Strip Prefix / Remove / Replace action then wiped the whole name (gh #217).
-            # Also covers the AND case where condition 1 is a negated guard.
-            if primary_match is None and match.matched and not cond_negate:
-                primary_match = match
+        cost = self._CONDITION_COST
+        by_cost = sorted(conditions, key=lambda c: cost.get(c.get("type", "always"), 5))
 
-        # Combine results based on logic
         if logic == "OR":
-            final_matched = any(results)
-        else:  # AND (default)
-            final_matched = all(results)
-
-        if final_matched:
-            # Return primary match info if available, otherwise generic match
-            if primary_match:
-                return primary_match
-            return RuleMatch(matched=True, match_start=0, match_end=len(text))
+            # The primary match is the first *matching*, non-negated condition, not
+            # pinned to index 0: for an OR rule whose first condition mismatched but
+            # a later one matched, the old `i == 0` guard left primary_match=None,
+            # fell through to `match_end=len(text)`, and a Strip Prefix / Remove /
+            # Replace action then wiped the whole name (gh #217).
+            for cond in conditions:
+                if not cond.get("negate", False):
+                    match = evaluate(cond)
+                    if match.matched:
+                        return match
+            for cond in by_cost:
+                if cond.get("negate", False) and not evaluate(cond).matched:
+                    return RuleMatch(matched=True, match_start=0, match_end=len(text))
+            return RuleMatch(matched=False)
 
-        return RuleMatch(matched=False)
+        # AND (default)
+        matches = {}
+        for cond in by_cost:
+            match = evaluate(cond)
+            if match.matched == cond.get("negate", False):
+                return RuleMatch(matched=False)
+            matches[id(cond)] = match
+
+        # All passed, so every non-negated condition matched; the first one in
+        # rule order is the primary match. Also covers the case where condition
+        # 1 is a negated guard.
+        for cond in conditions:
+            if not cond.get("negate", False):
+                return matches[id(cond)]
+        return RuleMatch(matched=True, match_start=0, match_end=len(text))
 
     def _apply_action(self, text: str, rule: NormalizationRule, match: RuleMatch) -> str:
         """
@@ -1645,8 +1770,6 @@ class NormalizationEngine:
         Returns:
             Dict with matched, before, after, match_details
         """
-        import json
-
         # Create a temporary rule object for testing
         rule = NormalizationRule(
             id=0,
@@ -1661,9 +1784,9 @@ class NormalizationEngine:
             action_value=action_value,
             else_action_type=else_action_type,
             else_action_value=else_action_value,
-            conditions=json.dumps(conditions) if conditions else None,
             condition_logic=condition_logic
         )
+        rule.set_conditions(conditions)
 
         # bd-eio04.1: apply the unified NormalizationPolicy to the input
         # before matching + action so the Test Rules preview path
@@ -1727,6 +1850,84 @@ class NormalizationEngine:
 
         return result
 
+    def count_matches_bulk(
+        self,
+        texts: list[str],
+        rules: list[NormalizationRule]
+    ) -> dict[int, int]:
+        """
+        Count how many texts each rule's condition matches.
+
+        Same result as calling _match_condition() for every (rule, text) pair,
+        but the NormalizationPolicy runs once per text and once per legacy
+        single-condition pattern rather than twice per pair, and each text is
+        lowercased once for all case-insensitive rules. Compound and
+        tag-group rules go through _match_condition() on the preprocessed
+        text, as they do inside normalize().
+
+        Args:
+            texts: Stream names to test
+            rules: Rules to count matches for
+
+        Returns:
+            Dict mapping rule id to the number of matching texts
+        """
+        policy = get_default_policy()
+        prepared = [policy.apply_to_text(text) for text in texts]
+        lowered = None  # lowercased once, on the first case-insensitive rule
+
+        counts = {}
+        for rule in rules:
+            if self._rule_conditions(rule) or rule.condition_type == "tag_group":
+                match_condition = self._match_condition
+                counts[rule.id] = sum(
+                    1 for text in prepared if match_condition(text, rule).matched
+                )
+                continue
+
+            match_prepared = self._match_prepared_condition
+            condition_type = rule.condition_type or "always"
+            pattern = self._prepare_pattern(rule.condition_value or "")
+            if condition_type == "regex":
+                counts[rule.id] = self._count_regex_matches(
+                    pattern, rule.case_sensitive, prepared
+                )
+                continue
+
+            if rule.case_sensitive:
+                counts[rule.id] = sum(
+                    1 for text in prepared
+                    if match_prepared(text, condition_type, pattern, True).matched
+                )
+                continue
+
+            if lowered is None:
+                lowered = [text.lower() for text in prepared]
+            counts[rule.id] = sum(
+                1 for text, lowered_text in zip(prepared, lowered)
+                if match_prepared(text, condition_type, pattern, False, lowered_text).matched
+            )
+
+        return counts
+
+    @staticmethod
+    def _count_regex_matches(pattern: str, case_sensitive: bool, texts: list[str]) -> int:
+        """
+        Count the texts a regex condition matches, compiling the pattern once.
+
+        Scans through safe_regex's pre-compiled path (bd-eio04.15) instead of
+        re-dispatching the pattern string per text. Contract is the same as
+        the regex branch of _match_prepared_condition(): an oversize or
+        invalid pattern matches nothing, and a timed-out text is a no-match.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        try:
+            compiled = safe_regex.compile(pattern, flags=flags)
+        except safe_regex.SafeRegexError:
+            return 0
+        search = safe_regex.search
+        return sum(1 for text in texts if search(compiled, text) is not None)
+
     def test_rules_batch(self, texts: list[str]) -> list[NormalizationResult]:
         """
         Test all enabled rules against multiple sample texts.
@@ -1751,23 +1952,22 @@ class NormalizationEngine:
             .order_by(NormalizationRuleGroup.priority)
             .all()
         )
+        rules_by_group = self._rules_by_group()
 
-        result = []
-        for group in groups:
-            rules = (
-                self.db.query(NormalizationRule)
-                .filter(NormalizationRule.group_id == group.id)
-                .order_by(NormalizationRule.priority)
-                .all()
-            )
-            result.append({
+        return [
+            {
                 **group.to_dict(),
-                "rules": [rule.to_dict() for rule in rules]
-            })
-
-        return result
+                "rules": [rule.to_dict() for rule in rules_by_group.get(group.id, [])]
+            }
+            for group in groups
+        ]
 
 
 def get_normalization_engine(db: Session) -> NormalizationEngine:
-    """Factory function to get a NormalizationEngine instance."""
-    return NormalizationEngine(db)
+    """
+    Factory function to get a NormalizationEngine instance.
+
+    Engines from here share one loaded ruleset across requests until a
+    writer calls invalidate_rules_cache().
+    """
+    return NormalizationEngine(db, shared_ruleset=True)
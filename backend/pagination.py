@@ -0,0 +1,45 @@
+"""
+Keyset (cursor) pagination helpers for newest-first list endpoints.
+
+A cursor is the ``(timestamp, id)`` of the last row on the previous page,
+packed into an opaque URL-safe token. The next page is read with
+``WHERE (ts, id) < (:ts, :id) ORDER BY ts DESC, id DESC LIMIT n``, which a
+``(ts DESC, id DESC)`` index serves as a single range seek no matter how
+deep the client pages — unlike OFFSET, which walks and discards every
+skipped row.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+
+
+def encode_keyset_cursor(timestamp: datetime, row_id: int) -> str:
+    """Pack the last row's sort key into an opaque cursor token."""
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, int]:
+    """Unpack a cursor token into ``(timestamp, id)``.
+
+    Raises:
+        HTTPException: 400 if the token was not produced by
+            encode_keyset_cursor().
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def next_keyset_cursor(rows: list, page_size: int, timestamp_attr: str) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None when this page was the last."""
+    if len(rows) < page_size:
+        return None
+    last = rows[-1]
+    return encode_keyset_cursor(getattr(last, timestamp_attr), last.id)
@@ -143,6 +143,15 @@ class PopularityCalculator:
             # Sort by score descending to assign ranks
             sorted_channels = sorted(scores.items(), key=lambda x: x[1]["score"], reverse=True)
 
+            # Existing score records for every scored channel in one IN query,
+            # instead of a lookup (and autoflush) per channel
+            existing = {
+                record.channel_id: record
+                for record in session.query(ChannelPopularityScore).filter(
+                    ChannelPopularityScore.channel_id.in_(list(scores))
+                )
+            }
+
             for rank, (channel_id, score_data) in enumerate(sorted_channels, start=1):
                 metrics = current_metrics[channel_id]
                 prev_score = previous_scores.get(channel_id, {}).get("score", 0)
@@ -161,9 +170,7 @@ class PopularityCalculator:
                     trend = "stable"
 
                 # Get or create score record
-                record = session.query(ChannelPopularityScore).filter(
-                    ChannelPopularityScore.channel_id == channel_id
-                ).first()
+                record = existing.get(channel_id)
 
                 if record is None:
                     record = ChannelPopularityScore(
@@ -436,11 +443,18 @@ class PopularityCalculator:
         """
         session = get_session()
         try:
-            total = session.query(func.count(ChannelPopularityScore.id)).scalar() or 0
-
-            records = session.query(ChannelPopularityScore).order_by(
+            # The total rides along on every row as a window count instead
+            # of a separate COUNT(*) query
+            query = session.query(ChannelPopularityScore)
+            rows = query.add_columns(func.count().over().label("total")).order_by(
                 ChannelPopularityScore.rank.asc()
             ).offset(offset).limit(limit).all()
+            records = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Past the last page (or no scores yet) — no row to read it from
+                total = query.count() if offset else 0
 
             return {
                 "total": total,
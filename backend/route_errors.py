@@ -0,0 +1,37 @@
+"""
+Route-level conversion of unhandled exceptions into sanitized 500s.
+
+Routers opt in with ``APIRouter(..., route_class=InternalErrorRoute)`` and can
+then drop the per-handler ``try/except Exception -> HTTPException(500)``
+boilerplate. HTTPException and request-validation errors pass through
+untouched so their status codes and envelopes are preserved.
+"""
+import logging
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+logger = logging.getLogger(__name__)
+
+
+class InternalErrorRoute(APIRoute):
+    """APIRoute that logs unexpected handler errors and returns a generic 500."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.exception(
+                    "[ROUTE-ERROR] %s %s failed: %s", request.method, request.url.path, e
+                )
+                raise HTTPException(status_code=500, detail="Internal server error") from e
+
+        return route_handler
@@ -478,6 +478,9 @@ def _restore_from_zip(zf: zipfile.ZipFile, manifest: dict) -> list[str]:
 
     # Clear settings cache and reset client
     clear_settings_cache()
+    # The restored database brings its own tags and normalization rules
+    from normalization_engine import invalidate_tag_cache
+    invalidate_tag_cache()
     try:
         reset_client()
     except Exception as e:
@@ -631,7 +634,7 @@ def _gather_db_tables() -> dict:
                         "priority": r.priority,
                         "condition_type": r.condition_type,
                         "condition_value": r.condition_value,
-                        "conditions": json.loads(r.conditions) if r.conditions else None,
+                        "conditions": r.get_conditions() or None,
                         "condition_logic": r.condition_logic,
                         "action_type": r.action_type,
                         "action_value": r.action_value,
@@ -1088,7 +1091,6 @@ def _restore_normalization_rule_groups(items: list) -> dict:
                     priority=rule_data.get("priority", 0),
                     condition_type=rule_data.get("condition_type"),
                     condition_value=rule_data.get("condition_value"),
-                    conditions=json.dumps(rule_data["conditions"]) if rule_data.get("conditions") else None,
                     condition_logic=rule_data.get("condition_logic", "AND"),
                     action_type=rule_data["action_type"],
                     action_value=rule_data.get("action_value"),
@@ -1097,8 +1099,11 @@ def _restore_normalization_rule_groups(items: list) -> dict:
                     stop_processing=rule_data.get("stop_processing", False),
                     is_builtin=rule_data.get("is_builtin", False),
                 )
+                rule.set_conditions(rule_data.get("conditions"))
                 session.add(rule)
         session.commit()
+        from normalization_engine import invalidate_rules_cache
+        invalidate_rules_cache()
         return {"warnings": []}
     except Exception:
         session.rollback()
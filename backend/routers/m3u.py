@@ -5,29 +5,255 @@ group settings, and server groups.
 Extracted from main.py (Phase 2 of v0.13.0 backend refactor).
 """
 import asyncio
+import hashlib
 import logging
+import random
 import re
+import secrets
 import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
 
+import aiofiles
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException, Request, UploadFile, File
+from fastapi.responses import JSONResponse
 
 from cache import get_cache
+from concurrency import run_cpu_bound
 from config import CONFIG_DIR, get_settings, save_settings, validate_url_scheme
 from database import get_session
 from dispatcharr_client import get_client
+from json_responses import etag_json_response, json_response
+from route_errors import InternalErrorRoute
 from alert_methods import send_alert
+from tasks.auto_creation import run_auto_creation_after_refresh
 from tasks.m3u_digest import send_immediate_digest
 import journal
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/m3u", tags=["M3U"])
+router = APIRouter(prefix="/api/m3u", tags=["M3U"], route_class=InternalErrorRoute)
 
-# Polling configuration for manual refresh endpoints
-REFRESH_POLL_INTERVAL_SECONDS = 5
+# Polling configuration for manual refresh endpoints. The poll interval
+# backs off exponentially (with jitter) so fast refreshes are noticed
+# quickly and slow ones don't poll Dispatcharr every few seconds.
+REFRESH_POLL_INITIAL_SECONDS = 1.0
+REFRESH_POLL_MAX_SECONDS = 15.0
+REFRESH_POLL_BACKOFF_FACTOR = 1.6
+REFRESH_POLL_JITTER_SECONDS = 0.5
 M3U_REFRESH_MAX_WAIT_SECONDS = 300  # 5 minutes for M3U
 
+# Minimum gap between "assumed complete" success alerts for one account.
+# Accounts without a timestamp field can't confirm completion, so repeated
+# refreshes would otherwise each send an alert.
+M3U_ASSUMED_REFRESH_ALERT_INTERVAL_SECONDS = 30.0
+_last_refresh_alert: dict[tuple[str, int], float] = {}
+
+# Alerts sent off the request path; held here so they aren't garbage-collected
+_pending_alerts: set[asyncio.Task] = set()
+
+# In-flight refresh / VOD-refresh triggers keyed by (kind, account_id);
+# concurrent duplicate requests await the same upstream call
+_IN_FLIGHT_TRIGGERS: dict[tuple[str, int], asyncio.Task] = {}
+
+# In-flight refresh-completion pollers, one per account (a repeat refresh
+# reuses the running poller). Holding them here also keeps them from being
+# garbage-collected mid-poll; cancelled on shutdown.
+_REFRESH_POLL_TASKS: dict[int, asyncio.Task] = {}
+
+# Pollers allowed to run at once; the rest wait on the semaphore
+M3U_REFRESH_POLL_CONCURRENCY = 8
+_refresh_poll_semaphore = asyncio.Semaphore(M3U_REFRESH_POLL_CONCURRENCY)
+
+# Concurrent per-group stream-name fetches when capturing post-refresh changes
+M3U_CHANGE_FETCH_CONCURRENCY = 8
+
+# Characters replaced with "_" in uploaded playlist filenames
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r'[^\w\-.]')
+
+# Uploaded playlists are copied to disk in chunks and capped in size
+M3U_UPLOAD_CHUNK_BYTES = 1 << 20  # 1 MiB
+M3U_UPLOAD_MAX_BYTES = 500 * 1024 * 1024  # 500 MB
+
+# Concurrent orphaned channel-group deletes when deleting an M3U account
+M3U_GROUP_DELETE_CONCURRENCY = 4
+
+# An identical group-settings PATCH repeated within this window (UI autosave)
+# returns the previous response without another upstream round trip
+M3U_GROUP_SETTINGS_REPEAT_TTL_SECONDS = 10
+
+# Per-group settings fields snapshotted before a group-settings update
+_GROUP_SETTING_FIELDS = (
+    "enabled",
+    "auto_channel_sync",
+    "auto_sync_channel_start",
+    "custom_properties",
+)
+_TRACKED_GROUP_SETTING_FIELDS = frozenset(_GROUP_SETTING_FIELDS)
+# Reads all of them from an entry that submitted every field, in that order
+_group_setting_values = itemgetter(*_GROUP_SETTING_FIELDS)
+
+# Journal description segments for group-settings changes, in display order
+_GROUP_CHANGE_LABELS = (
+    "Enabled",
+    "Disabled",
+    "Auto-sync on",
+    "Auto-sync off",
+    "Start channel",
+    "Settings",
+)
+
+
+async def _read_json_object(request: Request) -> dict:
+    """Parse a request body that is forwarded to Dispatcharr as a JSON object.
+
+    The body is passed through as-is (Dispatcharr owns the schema), so it is
+    parsed once with orjson rather than through a request model; malformed or
+    non-object bodies are rejected with 400 instead of surfacing as a 500.
+    """
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return data
+
+
+# -------------------------------------------------------------------------
+# M3U playlist parsing (used by the stream-metadata endpoint)
+# -------------------------------------------------------------------------
+
+# EXTINF attributes returned by the stream-metadata endpoint (key="value" or key=value)
+_EXTINF_ATTR_KEYS = ("tvg-id", "tvc-guide-stationid", "tvg-name", "tvg-logo", "group-title")
+# The alternation lists _EXTINF_ATTR_KEYS; keep the two in step
+_EXTINF_ATTR_RE = re.compile(
+    r'(?<![\w-])(tvg-id|tvc-guide-stationid|tvg-name|tvg-logo|group-title)=["\']?([^"\'>\s,]+)["\']?'
+)
+# Maps each matched key to the shared constant so parsed entries don't each
+# carry their own copies of the key strings
+_EXTINF_ATTR_KEY_MAP = {key: key for key in _EXTINF_ATTR_KEYS}
+
+# Lines handed to the stream-metadata parser per CPU-pool batch
+M3U_PARSE_BATCH_LINES = 5000
+
+# Shared client for fetching provider playlists, so repeat fetches reuse
+# pooled keep-alive connections instead of a fresh TCP/TLS handshake each.
+# Lazily constructed; closed from main.py's shutdown hook.
+_playlist_http: httpx.AsyncClient | None = None
+
+
+def _get_playlist_http_client() -> httpx.AsyncClient:
+    global _playlist_http
+    if _playlist_http is None or _playlist_http.is_closed:
+        _playlist_http = httpx.AsyncClient(
+            timeout=60.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _playlist_http
+
+
+async def close_playlist_http_client() -> None:
+    """Close the shared playlist HTTP client. Called on app shutdown."""
+    global _playlist_http
+    if _playlist_http is not None:
+        await _playlist_http.aclose()
+        _playlist_http = None
+
+
+# Parsed stream metadata is cached per account and upstream ETag/Last-Modified
+M3U_METADATA_CACHE_TTL_SECONDS = 3600
+
+
+def _m3u_metadata_cache_prefix(account_id: int) -> str:
+    return f"m3u_metadata:{account_id}:"
+
+
+def _invalidate_m3u_metadata_cache(account_id: int) -> None:
+    """Drop cached stream metadata after the account or its playlist changes."""
+    get_cache().invalidate_prefix(_m3u_metadata_cache_prefix(account_id))
+
+
+def _group_settings_repeat_key(account_id: int) -> str:
+    return f"m3u_group_settings:{account_id}"
+
+
+def _forget_group_settings_payload(account_id: int) -> None:
+    """Drop the remembered last group-settings PATCH after the account changes."""
+    get_cache().invalidate(_group_settings_repeat_key(account_id))
+
+
+def _parse_m3u_metadata_lines(lines: list[bytes], metadata: dict[str, dict]) -> None:
+    """Parse a batch of raw M3U lines into ``metadata`` keyed by tvg-id (runs on the CPU pool).
+
+    Lines stay as bytes until they are known to be EXTINF, so URL and other
+    directive lines are skipped without being decoded.
+    """
+    key_map = _EXTINF_ATTR_KEY_MAP
+    for raw in lines:
+        if not raw.startswith(b'#EXTINF:'):
+            # Tolerate indented lines without stripping every line
+            if not raw[:1].isspace() or not raw.lstrip().startswith(b'#EXTINF:'):
+                continue
+        line = raw.decode('utf-8', 'replace')
+        # Only the attributes we return are captured
+        entry = {key_map[m[1]]: m[2] for m in _EXTINF_ATTR_RE.finditer(line)}
+        tvg_id = entry.pop('tvg-id', None)
+        # Only include entries that have a tvg-id (needed for matching)
+        # and at least one other attribute
+        if tvg_id and entry:
+            metadata[tvg_id] = entry
+
+
+async def _parse_m3u_metadata_chunks(chunks, metadata: dict[str, dict]) -> None:
+    """Split an async iterator of playlist bytes into lines and parse them in CPU-pool batches."""
+    batch = []
+    tail = b""
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        batch.extend(lines)
+        if len(batch) >= M3U_PARSE_BATCH_LINES:
+            await run_cpu_bound(_parse_m3u_metadata_lines, batch, metadata)
+            batch = []
+    if tail:
+        batch.append(tail)
+    if batch:
+        await run_cpu_bound(_parse_m3u_metadata_lines, batch, metadata)
+
+
+def _local_m3u_upload_path(account: dict) -> Path | None:
+    """Return the on-disk playlist for an account backed by an uploaded file.
+
+    Only files under CONFIG_DIR/m3u_uploads (where upload_m3u_file saves them)
+    are read directly; anything else is fetched over HTTP as before.
+    """
+    uploads_dir = (CONFIG_DIR / "m3u_uploads").resolve()
+    for location in (account.get("file_path"), account.get("server_url")):
+        if not location:
+            continue
+        if location.startswith("file://"):
+            location = location[len("file://"):]
+        path = Path(location)
+        if not path.is_absolute():
+            continue
+        path = path.resolve()
+        if path.is_relative_to(uploads_dir) and path.is_file():
+            return path
+    return None
+
+
+async def _read_file_chunks(path: Path):
+    async with aiofiles.open(path, 'rb') as f:
+        while chunk := await f.read(M3U_UPLOAD_CHUNK_BYTES):
+            yield chunk
+
 
 # -------------------------------------------------------------------------
 # Helper functions (used only by M3U refresh endpoints)
@@ -51,70 +277,85 @@ async def _capture_m3u_changes_after_refresh(account_id: int, account_name: str)
     try:
         api_client = get_client()
 
-        # Get the M3U account - channel_groups contains ALL groups from this M3U source
-        account_data = await api_client.get_m3u_account(account_id)
-        account_channel_groups = account_data.get("channel_groups", [])
-
-        # Get all channel groups to build ID -> name mapping
-        all_channel_groups = await api_client.get_channel_groups()
-        group_lookup = {
-            g["id"]: g["name"]
-            for g in all_channel_groups
-        }
-
-        # Get actual stream counts (only available for enabled groups with imported streams)
-        stream_counts = await api_client.get_stream_groups_with_counts(m3u_account_id=account_id)
+        # The three lookups are independent, so fetch them concurrently:
+        # - the M3U account; its channel_groups contains ALL groups from this M3U source
+        # - the (cached) channel-group ID -> name mapping
+        # - actual stream counts (only available for enabled groups with imported streams)
+        account_data, group_lookup, stream_counts = await asyncio.gather(
+            api_client.get_m3u_account(account_id, use_cache=False),
+            api_client.channel_group_names(),
+            api_client.get_stream_groups_with_counts(m3u_account_id=account_id),
+        )
+        account_channel_groups = account_data.get("channel_groups") or ()
+
+        # A refresh can create groups the cached map has never seen; rebuild it then
+        account_group_ids = {acg.get("channel_group") for acg in account_channel_groups}
+        account_group_ids.discard(None)
+        if not account_group_ids <= group_lookup.keys():
+            api_client.invalidate_channel_group_names()
+            group_lookup = await api_client.channel_group_names()
         stream_count_lookup = {
             g["name"]: g["count"]
             for g in stream_counts
         }
 
-        # Build list of all group names to fetch stream names for
+        # Single pass: for each group in this M3U account, get name and stream
+        # count, and collect the group names to fetch stream names for
         all_group_names = []
-        for acg in account_channel_groups:
-            group_id = acg.get("channel_group")
-            if group_id and group_id in group_lookup:
-                all_group_names.append(group_lookup[group_id])
-
-        # Fetch stream names for all groups (limit to first 500 per group)
-        stream_names_by_group = {}
-        MAX_STREAM_NAMES = 500
-        logger.info("[M3U-CHANGE] Fetching stream names for %s groups: %s%s", len(all_group_names), all_group_names[:5], '...' if len(all_group_names) > 5 else '')
-        for group_name in all_group_names:
-            try:
-                streams_response = await api_client.get_streams(
-                    page=1,
-                    page_size=MAX_STREAM_NAMES,
-                    channel_group_name=group_name,
-                    m3u_account=account_id,
-                )
-                results = streams_response.get("results", [])
-                stream_names = [s.get("name", "") for s in results]
-                logger.debug("[M3U-CHANGE] Group '%s': got %s streams, %s names", group_name, len(results), len(stream_names))
-                if stream_names:
-                    stream_names_by_group[group_name] = stream_names
-            except Exception as e:
-                logger.warning("[M3U-CHANGE] Could not fetch streams for group '%s': %s", group_name, e)
-
-        logger.info("[M3U-CHANGE] Captured stream names for %s groups", len(stream_names_by_group))
-
-        # Match up: for each group in this M3U account, get name and stream count
         current_groups = []
         total_streams = 0
 
         for acg in account_channel_groups:
-            group_id = acg.get("channel_group")
-            if group_id and group_id in group_lookup:
-                group_name = group_lookup[group_id]
-                # Get stream count if available (only for enabled groups), otherwise 0
-                stream_count = stream_count_lookup.get(group_name, 0)
-                enabled = acg.get("enabled", False)
-                current_groups.append({
-                    "name": group_name,
-                    "stream_count": stream_count,
-                    "enabled": enabled,
-                })
-                total_streams += stream_count
+            group_name = group_lookup.get(acg.get("channel_group"))
+            if group_name is None:
+                continue
+            # Get stream count if available (only for enabled groups), otherwise 0
+            stream_count = stream_count_lookup.get(group_name, 0)
+            all_group_names.append(group_name)
+            current_groups.append({
+                "name": group_name,
+                "stream_count": stream_count,
+                "enabled": acg.get("enabled", False),
+            })
+            total_streams += stream_count
+
+        # Fetch stream names for all groups (limit to first 500 per group),
+        # a bounded number of groups at a time
+        MAX_STREAM_NAMES = 500
+        if logger.isEnabledFor(logging.INFO):
+            sample = all_group_names[:5]
+            more = '...' if len(all_group_names) > 5 else ''
+            logger.info("[M3U-CHANGE] Fetching stream names for %s groups: %s%s", len(all_group_names), sample, more)
+        sem = asyncio.Semaphore(M3U_CHANGE_FETCH_CONCURRENCY)
+
+        async def fetch_stream_names(group_name: str) -> tuple[str, list[str]]:
+            async with sem:
+                try:
+                    streams_response = await api_client.get_streams(
+                        page=1,
+                        page_size=MAX_STREAM_NAMES,
+                        channel_group_name=group_name,
+                        m3u_account=account_id,
+                    )
+                except Exception as e:
+                    logger.warning("[M3U-CHANGE] Could not fetch streams for group '%s': %s", group_name, e)
+                    return group_name, []
+            stream_names = [s.get("name", "") for s in streams_response.get("results", [])]
+            return group_name, stream_names
+
+        fetched = await asyncio.gather(*(fetch_stream_names(g) for g in all_group_names))
+        stream_names_by_group = {
+            group_name: stream_names
+            for group_name, stream_names in fetched
+            if stream_names
+        }
+
+        logger.info("[M3U-CHANGE] Captured stream names for %s groups", len(stream_names_by_group))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[M3U-CHANGE] Stream names per group: %s",
+                {group_name: len(stream_names) for group_name, stream_names in fetched},
+            )
 
         logger.info(
             "[M3U-CHANGE] Capturing state for account %s (%s): "
@@ -156,17 +397,140 @@ async def _capture_m3u_changes_after_refresh(account_id: int, account_name: str)
         logger.exception("[M3U-CHANGE] Failed to capture changes for %s: %s", account_name, e)
 
 
+def _should_alert(alert_category: str, entity_id: int, min_interval: float) -> bool:
+    """Return True (and record the time) if no alert for this key was sent within min_interval."""
+    now = time.monotonic()
+    key = (alert_category, entity_id)
+    last = _last_refresh_alert.get(key)
+    if last is not None and now - last < min_interval:
+        return False
+    _last_refresh_alert[key] = now
+    return True
+
+
+def _send_alert_background(**kwargs) -> None:
+    """Send an alert on a tracked task so the caller's response doesn't wait on delivery."""
+    task = asyncio.create_task(send_alert(**kwargs))
+    _pending_alerts.add(task)
+
+    def done(finished: asyncio.Task) -> None:
+        _pending_alerts.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.warning("[M3U] Background alert %r failed: %s", kwargs.get("title"), finished.exception())
+
+    task.add_done_callback(done)
+
+
+async def _on_refresh_complete(account_id: int, account_name: str, wait_duration: float | None):
+    """
+    Run the post-refresh steps once an M3U refresh is known (or assumed) complete.
+
+    wait_duration is None when completion was assumed because the account has
+    no timestamp field; the journal and alert messages then omit the duration.
+    """
+    # Invalidate stream groups cache so UI picks up new/removed groups
+    cache = get_cache()
+    cache.invalidate_prefix("stream_groups_with_counts")
+    _invalidate_m3u_metadata_cache(account_id)
+    _forget_group_settings_payload(account_id)
+
+    # Capture M3U changes after refresh
+    await _capture_m3u_changes_after_refresh(account_id, account_name)
+
+    # Send immediate digest if configured
+    try:
+        await send_immediate_digest(account_id)
+    except Exception as e:
+        logger.warning("[M3U-REFRESH] Failed to send immediate digest for '%s': %s", account_name, e)
+
+    metadata = {"account_id": account_id, "account_name": account_name}
+    if wait_duration is None:
+        description = f"Refreshed M3U account '{account_name}'"
+        message = f"M3U account '{account_name}' refresh completed"
+    else:
+        description = f"Refreshed M3U account '{account_name}' in {wait_duration:.1f}s"
+        message = f"Successfully refreshed M3U account '{account_name}' in {wait_duration:.1f}s"
+        metadata["duration"] = wait_duration
+
+    journal.log_entry_background(
+        category="m3u",
+        action_type="refresh",
+        entity_id=account_id,
+        entity_name=account_name,
+        description=description,
+    )
+
+    if wait_duration is not None or _should_alert(
+        "m3u_refresh", account_id, M3U_ASSUMED_REFRESH_ALERT_INTERVAL_SECONDS
+    ):
+        await send_alert(
+            title=f"M3U Refresh: {account_name}",
+            message=message,
+            notification_type="success",
+            source="M3U Refresh",
+            metadata=metadata,
+            alert_category="m3u_refresh",
+            entity_id=account_id,
+        )
+    else:
+        logger.debug("[M3U-REFRESH] Suppressed repeat completion alert for '%s'", account_name)
+
+    # Run auto-creation rules if any have run_on_refresh=True
+    try:
+        await run_auto_creation_after_refresh(
+            m3u_account_ids=[account_id],
+            triggered_by="m3u_refresh",
+        )
+    except Exception as e:
+        logger.warning("[M3U-REFRESH] Auto-creation after refresh failed: %s", e)
+
+
+def _schedule_refresh_poll(account_id: int, account_name: str, initial_updated) -> str:
+    """Ensure a background poller is tracking this account's refresh and return its task ID.
+
+    At most one poller runs per account; if one is already in flight its ID is
+    returned instead of starting another.
+    """
+    existing = _REFRESH_POLL_TASKS.get(account_id)
+    if existing is not None and not existing.done():
+        logger.debug("[M3U-REFRESH] Reusing in-flight poller %s for account %s", existing.get_name(), account_id)
+        return existing.get_name()
+
+    async def run():
+        async with _refresh_poll_semaphore:
+            await _poll_m3u_refresh_completion(account_id, account_name, initial_updated)
+
+    task_id = uuid.uuid4().hex
+    task = asyncio.create_task(run(), name=task_id)
+    _REFRESH_POLL_TASKS[account_id] = task
+
+    def forget(done: asyncio.Task) -> None:
+        if _REFRESH_POLL_TASKS.get(account_id) is done:
+            del _REFRESH_POLL_TASKS[account_id]
+
+    task.add_done_callback(forget)
+    return task_id
+
+
+async def cancel_refresh_poll_tasks() -> None:
+    """Cancel any in-flight refresh-completion pollers (called on app shutdown)."""
+    tasks = list(_REFRESH_POLL_TASKS.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def _poll_m3u_refresh_completion(account_id: int, account_name: str, initial_updated):
     """
     Background task to poll Dispatcharr until M3U refresh completes.
 
-    Polls every REFRESH_POLL_INTERVAL_SECONDS for up to M3U_REFRESH_MAX_WAIT_SECONDS.
+    Polls with exponential backoff (REFRESH_POLL_INITIAL_SECONDS growing to
+    REFRESH_POLL_MAX_SECONDS, plus jitter) for up to M3U_REFRESH_MAX_WAIT_SECONDS.
     Sends success notification when updated_at changes, warning on timeout.
     """
-    from datetime import datetime
-
     client = get_client()
     wait_start = datetime.utcnow()
+    delay = REFRESH_POLL_INITIAL_SECONDS
 
     try:
         while True:
@@ -184,10 +548,11 @@ async def _poll_m3u_refresh_completion(account_id: int, account_name: str, initi
                 )
                 return
 
-            await asyncio.sleep(REFRESH_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(delay + random.uniform(0, REFRESH_POLL_JITTER_SECONDS))
+            delay = min(delay * REFRESH_POLL_BACKOFF_FACTOR, REFRESH_POLL_MAX_SECONDS)
 
             try:
-                current_account = await client.get_m3u_account(account_id)
+                current_account = await client.get_m3u_account(account_id, use_cache=False)
             except Exception as e:
                 # Account may have been deleted during refresh
                 logger.warning("[M3U-REFRESH] Could not fetch account %s during polling: %s", account_id, e)
@@ -198,95 +563,13 @@ async def _poll_m3u_refresh_completion(account_id: int, account_name: str, initi
             if current_updated and current_updated != initial_updated:
                 wait_duration = (datetime.utcnow() - wait_start).total_seconds()
                 logger.info("[M3U-REFRESH] '%s' refresh complete in %.1fs", account_name, wait_duration)
-
-                # Invalidate stream groups cache so UI picks up new/removed groups
-                cache = get_cache()
-                cache.invalidate_prefix("stream_groups_with_counts")
-
-                # Capture M3U changes after refresh
-                await _capture_m3u_changes_after_refresh(account_id, account_name)
-
-                # Send immediate digest if configured
-                try:
-                    await send_immediate_digest(account_id)
-                except Exception as e:
-                    logger.warning("[M3U-REFRESH] Failed to send immediate digest for '%s': %s", account_name, e)
-
-                journal.log_entry(
-                    category="m3u",
-                    action_type="refresh",
-                    entity_id=account_id,
-                    entity_name=account_name,
-                    description=f"Refreshed M3U account '{account_name}' in {wait_duration:.1f}s",
-                )
-
-                await send_alert(
-                    title=f"M3U Refresh: {account_name}",
-                    message=f"Successfully refreshed M3U account '{account_name}' in {wait_duration:.1f}s",
-                    notification_type="success",
-                    source="M3U Refresh",
-                    metadata={"account_id": account_id, "account_name": account_name, "duration": wait_duration},
-                    alert_category="m3u_refresh",
-                    entity_id=account_id,
-                )
-
-                # Run auto-creation rules if any have run_on_refresh=True
-                try:
-                    from tasks.auto_creation import run_auto_creation_after_refresh
-                    await run_auto_creation_after_refresh(
-                        m3u_account_ids=[account_id],
-                        triggered_by="m3u_refresh",
-                    )
-                except Exception as e:
-                    logger.warning("[M3U-REFRESH] Auto-creation after refresh failed: %s", e)
-
+                await _on_refresh_complete(account_id, account_name, wait_duration)
                 return
             elif elapsed > 30 and not initial_updated:
                 # After 30 seconds, assume complete if no timestamp field available
                 wait_duration = (datetime.utcnow() - wait_start).total_seconds()
                 logger.info("[M3U-REFRESH] '%s' - assuming complete after %.0fs (no timestamp field)", account_name, wait_duration)
-
-                # Invalidate stream groups cache so UI picks up new/removed groups
-                cache = get_cache()
-                cache.invalidate_prefix("stream_groups_with_counts")
-
-                # Capture M3U changes after refresh
-                await _capture_m3u_changes_after_refresh(account_id, account_name)
-
-                # Send immediate digest if configured
-                try:
-                    await send_immediate_digest(account_id)
-                except Exception as e:
-                    logger.warning("[M3U-REFRESH] Failed to send immediate digest for '%s': %s", account_name, e)
-
-                journal.log_entry(
-                    category="m3u",
-                    action_type="refresh",
-                    entity_id=account_id,
-                    entity_name=account_name,
-                    description=f"Refreshed M3U account '{account_name}'",
-                )
-
-                await send_alert(
-                    title=f"M3U Refresh: {account_name}",
-                    message=f"M3U account '{account_name}' refresh completed",
-                    notification_type="success",
-                    source="M3U Refresh",
-                    metadata={"account_id": account_id, "account_name": account_name},
-                    alert_category="m3u_refresh",
-                    entity_id=account_id,
-                )
-
-                # Run auto-creation rules if any have run_on_refresh=True
-                try:
-                    from tasks.auto_creation import run_auto_creation_after_refresh
-                    await run_auto_creation_after_refresh(
-                        m3u_account_ids=[account_id],
-                        triggered_by="m3u_refresh",
-                    )
-                except Exception as e:
-                    logger.warning("[M3U-REFRESH] Auto-creation after refresh failed: %s", e)
-
+                await _on_refresh_complete(account_id, account_name, None)
                 return
 
     except Exception as e:
@@ -302,14 +585,11 @@ async def get_m3u_account(account_id: int):
     """Get a single M3U account by ID."""
     logger.debug("[M3U] GET /api/m3u/accounts/%s", account_id)
     client = get_client()
-    start = time.time()
-    try:
-        result = await client.get_m3u_account(account_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Fetched M3U account id=%s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await client.get_m3u_account(account_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Fetched M3U account id=%s in %.1fms", account_id, elapsed_ms)
+    return json_response(result)
 
 
 @router.get("/accounts/{account_id}/stream-metadata")
@@ -323,11 +603,34 @@ async def get_m3u_stream_metadata(account_id: int):
     client = get_client()
     try:
         # Get the M3U account details
-        start = time.time()
+        start = time.perf_counter()
         account = await client.get_m3u_account(account_id)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U] Fetched M3U account %s in %.1fms", account_id, elapsed_ms)
 
+        # Parse EXTINF lines to extract metadata
+        # Format: #EXTINF:-1 tvg-id="ID" tvc-guide-stationid="12345" ...,Channel Name
+        metadata = {}
+        cache = get_cache()
+        cache_prefix = _m3u_metadata_cache_prefix(account_id)
+
+        # Uploaded playlists are already on local disk; read them directly,
+        # keyed on the file's mtime/size instead of an HTTP validator
+        local_path = _local_m3u_upload_path(account)
+        if local_path is not None:
+            stat = local_path.stat()
+            validator = f"file:{stat.st_mtime_ns}:{stat.st_size}"
+            cached = cache.get(cache_prefix + validator, ttl=M3U_METADATA_CACHE_TTL_SECONDS)
+            if cached is not None:
+                logger.debug("[M3U] Using cached M3U metadata for account %s", account_id)
+                return json_response(cached)
+            await _parse_m3u_metadata_chunks(_read_file_chunks(local_path), metadata)
+            logger.info("[M3U] Parsed local M3U metadata for account %s: %s entries with tvg-id", account_id, len(metadata))
+            result = {"metadata": metadata, "count": len(metadata)}
+            cache.invalidate_prefix(cache_prefix)
+            cache.set(cache_prefix + validator, result)
+            return json_response(result)
+
         # Construct the M3U URL based on account type
         account_type = account.get("account_type", "M3U")
         server_url = account.get("server_url")
@@ -346,48 +649,43 @@ async def get_m3u_stream_metadata(account_id: int):
             # Standard M3U: server_url is the direct URL
             m3u_url = server_url
 
-        # Fetch the M3U file
-        async with httpx.AsyncClient(timeout=60.0) as http_client:
-            response = await http_client.get(m3u_url, follow_redirects=True)
+        http_client = _get_playlist_http_client()
+        # Cheap HEAD to learn the playlist's ETag/Last-Modified; an
+        # unchanged playlist reuses the previously parsed result
+        validator = None
+        try:
+            head = await http_client.head(m3u_url)
+            if head.is_success:
+                validator = head.headers.get("etag") or head.headers.get("last-modified")
+        except httpx.HTTPError as e:
+            logger.debug("[M3U] HEAD for account %s playlist failed, fetching directly: %s", account_id, e)
+
+        if validator:
+            cached = cache.get(cache_prefix + validator, ttl=M3U_METADATA_CACHE_TTL_SECONDS)
+            if cached is not None:
+                logger.debug("[M3U] Using cached M3U metadata for account %s", account_id)
+                return json_response(cached)
+
+        # Stream the M3U file and hand fixed-size line batches to the CPU
+        # pool, so neither the whole playlist nor the regex work sits on
+        # the event loop
+        async with http_client.stream("GET", m3u_url) as response:
             response.raise_for_status()
-            m3u_content = response.text
-
-        # Parse EXTINF lines to extract metadata
-        # Format: #EXTINF:-1 tvg-id="ID" tvc-guide-stationid="12345" ...,Channel Name
-        metadata = {}
-
-        # Regex to match key="value" or key=value patterns in EXTINF lines
-        attr_pattern = re.compile(r'([\w-]+)=["\']?([^"\'>\s,]+)["\']?')
-
-        lines = m3u_content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('#EXTINF:'):
-                # Extract all attributes from the EXTINF line
-                attrs = dict(attr_pattern.findall(line))
-
-                tvg_id = attrs.get('tvg-id')
-                tvc_station_id = attrs.get('tvc-guide-stationid')
-
-                # Only include entries that have a tvg-id (needed for matching)
-                if tvg_id:
-                    entry = {}
-                    if tvc_station_id:
-                        entry['tvc-guide-stationid'] = tvc_station_id
-                    # Include other useful attributes
-                    if 'tvg-name' in attrs:
-                        entry['tvg-name'] = attrs['tvg-name']
-                    if 'tvg-logo' in attrs:
-                        entry['tvg-logo'] = attrs['tvg-logo']
-                    if 'group-title' in attrs:
-                        entry['group-title'] = attrs['group-title']
-
-                    if entry:  # Only add if we have at least one attribute
-                        metadata[tvg_id] = entry
+            validator = response.headers.get("etag") or response.headers.get("last-modified")
+            await _parse_m3u_metadata_chunks(response.aiter_bytes(), metadata)
 
         logger.info("[M3U] Parsed M3U metadata for account %s: %s entries with tvg-id", account_id, len(metadata))
-        return {"metadata": metadata, "count": len(metadata)}
+        result = {"metadata": metadata, "count": len(metadata)}
+
+        # Keep only the latest parse per account; without a validator there
+        # is no way to tell the playlist is unchanged, so nothing is cached
+        cache.invalidate_prefix(cache_prefix)
+        if validator:
+            cache.set(cache_prefix + validator, result)
+        return json_response(result)
 
+    except HTTPException:
+        raise
     except httpx.HTTPError as e:
         logger.error("[M3U] Failed to fetch M3U file for account %s: %s", account_id, e)
         raise HTTPException(status_code=502, detail=f"Failed to fetch M3U file: {str(e)}")
@@ -401,30 +699,25 @@ async def create_m3u_account(request: Request):
     """Create a new M3U account."""
     logger.debug("[M3U] POST /api/m3u/accounts")
     client = get_client()
-    start = time.time()
-    try:
-        data = await request.json()
-        if data.get("server_url"):
-            validate_url_scheme(data["server_url"], "server URL")
-        result = await client.create_m3u_account(data)
-        elapsed_ms = (time.time() - start) * 1000
-
-        # Log to journal
-        journal.log_entry(
-            category="m3u",
-            action_type="create",
-            entity_id=result.get("id"),
-            entity_name=result.get("name", data.get("name", "Unknown")),
-            description=f"Created M3U account '{result.get('name', data.get('name'))}'",
-            after_value={"name": result.get("name"), "server_url": data.get("server_url")},
-        )
-
-        logger.info("[M3U] Created M3U account id=%s name='%s' in %.1fms", result.get("id"), result.get("name"), elapsed_ms)
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    data = await _read_json_object(request)
+    if data.get("server_url"):
+        validate_url_scheme(data["server_url"], "server URL")
+    result = await client.create_m3u_account(data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Log to journal
+    journal.log_entry_background(
+        category="m3u",
+        action_type="create",
+        entity_id=result.get("id"),
+        entity_name=result.get("name", data.get("name", "Unknown")),
+        description=f"Created M3U account '{result.get('name', data.get('name'))}'",
+        after_value={"name": result.get("name"), "server_url": data.get("server_url")},
+    )
+
+    logger.info("[M3U] Created M3U account id=%s name='%s' in %.1fms", result.get("id"), result.get("name"), elapsed_ms)
+    return result
 
 
 @router.post("/upload")
@@ -435,9 +728,15 @@ async def upload_m3u_file(file: UploadFile = File(...)):
     Returns the full path that can be used as file_path when creating/updating M3U accounts.
     """
     logger.debug("[M3U] POST /api/m3u/upload - filename=%s", file.filename)
-    import aiofiles
-    from pathlib import Path
-    import uuid
+
+    # Reject oversized uploads before touching disk when the size is declared
+    declared_size = file.size
+    if declared_size is None:
+        content_length = file.headers.get("content-length", "")
+        declared_size = int(content_length) if content_length.isdigit() else None
+    if declared_size is not None and declared_size > M3U_UPLOAD_MAX_BYTES:
+        logger.warning("[M3U] Rejected M3U upload '%s': %s bytes exceeds %s", file.filename, declared_size, M3U_UPLOAD_MAX_BYTES)
+        raise HTTPException(status_code=413, detail="M3U file is too large")
 
     # Create uploads directory if it doesn't exist
     uploads_dir = CONFIG_DIR / "m3u_uploads"
@@ -452,33 +751,44 @@ async def upload_m3u_file(file: UploadFile = File(...)):
         )
 
     # Create a unique filename to avoid collisions
-    # Use original name with a short UUID prefix for uniqueness
-    safe_name = re.sub(r'[^\w\-_\.]', '_', original_name)
-    unique_prefix = str(uuid.uuid4())[:8]
+    # Use original name with a short random hex prefix for uniqueness
+    safe_name = _UNSAFE_FILENAME_CHAR_RE.sub('_', original_name)
+    unique_prefix = secrets.token_hex(4)
     final_name = f"{unique_prefix}_{safe_name}"
     file_path = uploads_dir / final_name
 
     try:
-        # Read and save the file
-        content = await file.read()
+        # Copy the file to disk in chunks so the whole playlist is never held in memory
+        total = 0
         async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+            while chunk := await file.read(M3U_UPLOAD_CHUNK_BYTES):
+                total += len(chunk)
+                if total > M3U_UPLOAD_MAX_BYTES:
+                    break
+                await f.write(chunk)
+
+        if total > M3U_UPLOAD_MAX_BYTES:
+            file_path.unlink(missing_ok=True)
+            logger.warning("[M3U] Rejected M3U upload '%s': exceeds %s bytes", original_name, M3U_UPLOAD_MAX_BYTES)
+            raise HTTPException(status_code=413, detail="M3U file is too large")
 
-        logger.info("[M3U] M3U file uploaded: %s (%s bytes)", file_path, len(content))
+        logger.info("[M3U] M3U file uploaded: %s (%s bytes)", file_path, total)
 
         # Log to journal
-        journal.log_entry(
+        journal.log_entry_background(
             category="m3u",
             action_type="upload",
             entity_name=original_name,
-            description=f"Uploaded M3U file '{original_name}' ({len(content)} bytes)",
+            description=f"Uploaded M3U file '{original_name}' ({total} bytes)",
         )
 
         return {
             "file_path": str(file_path),
             "original_name": original_name,
-            "size": len(content)
+            "size": total
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("[M3U] Failed to upload M3U file: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
@@ -489,32 +799,30 @@ async def update_m3u_account(account_id: int, request: Request):
     """Update an M3U account (full update)."""
     logger.debug("[M3U] PUT /api/m3u/accounts/%s", account_id)
     client = get_client()
-    start = time.time()
-    try:
-        before_account = await client.get_m3u_account(account_id)
-        data = await request.json()
-        if data.get("server_url"):
-            validate_url_scheme(data["server_url"], "server URL")
-        result = await client.update_m3u_account(account_id, data)
-
-        # Log to journal
-        journal.log_entry(
-            category="m3u",
-            action_type="update",
-            entity_id=account_id,
-            entity_name=result.get("name", before_account.get("name", "Unknown")),
-            description=f"Updated M3U account '{result.get('name', before_account.get('name'))}'",
-            before_value={"name": before_account.get("name")},
-            after_value={"name": data.get("name")},
-        )
-
-        elapsed_ms = (time.time() - start) * 1000
-        logger.info("[M3U] Updated M3U account id=%s name='%s' in %.1fms", account_id, result.get("name"), elapsed_ms)
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    data = await _read_json_object(request)
+    if data.get("server_url"):
+        validate_url_scheme(data["server_url"], "server URL")
+    # Usually served from the client's account memo
+    before_account = await client.get_m3u_account(account_id)
+    result = await client.update_m3u_account(account_id, data)
+    _invalidate_m3u_metadata_cache(account_id)
+    _forget_group_settings_payload(account_id)
+
+    # Log to journal
+    journal.log_entry_background(
+        category="m3u",
+        action_type="update",
+        entity_id=account_id,
+        entity_name=result.get("name", before_account.get("name", "Unknown")),
+        description=f"Updated M3U account '{result.get('name', before_account.get('name'))}'",
+        before_value={"name": before_account.get("name")},
+        after_value={"name": data.get("name")},
+    )
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info("[M3U] Updated M3U account id=%s name='%s' in %.1fms", account_id, result.get("name"), elapsed_ms)
+    return result
 
 
 @router.patch("/accounts/{account_id}")
@@ -522,39 +830,39 @@ async def patch_m3u_account(account_id: int, request: Request):
     """Partially update an M3U account (e.g., toggle is_active)."""
     logger.debug("[M3U] PATCH /api/m3u/accounts/%s", account_id)
     client = get_client()
-    try:
-        start = time.time()
-        before_account = await client.get_m3u_account(account_id)
-        data = await request.json()
-        if data.get("server_url"):
-            validate_url_scheme(data["server_url"], "server URL")
-        result = await client.patch_m3u_account(account_id, data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Patched M3U account %s in %.1fms", account_id, elapsed_ms)
-
-        # Log to journal
-        changes = []
-        if "is_active" in data:
-            changes.append(f"{'enabled' if data['is_active'] else 'disabled'}")
-        if "name" in data:
-            changes.append(f"renamed to '{data['name']}'")
-
-        if changes:
-            journal.log_entry(
-                category="m3u",
-                action_type="update",
-                entity_id=account_id,
-                entity_name=result.get("name", before_account.get("name", "Unknown")),
-                description=f"M3U account {', '.join(changes)}",
-                before_value={"is_active": before_account.get("is_active")},
-                after_value=data,
-            )
+    start = time.perf_counter()
+    data = await _read_json_object(request)
+    if data.get("server_url"):
+        validate_url_scheme(data["server_url"], "server URL")
+
+    changes = []
+    if "is_active" in data:
+        changes.append(f"{'enabled' if data['is_active'] else 'disabled'}")
+    if "name" in data:
+        changes.append(f"renamed to '{data['name']}'")
+
+    # The prior state is only needed for the journal entry, and is
+    # usually served from the client's account memo
+    before_account = await client.get_m3u_account(account_id) if changes else None
+    result = await client.patch_m3u_account(account_id, data)
+    _invalidate_m3u_metadata_cache(account_id)
+    _forget_group_settings_payload(account_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Patched M3U account %s in %.1fms", account_id, elapsed_ms)
+
+    # Log to journal
+    if changes:
+        journal.log_entry_background(
+            category="m3u",
+            action_type="update",
+            entity_id=account_id,
+            entity_name=result.get("name", before_account.get("name", "Unknown")),
+            description=f"M3U account {', '.join(changes)}",
+            before_value={"is_active": before_account.get("is_active")},
+            after_value=data,
+        )
 
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return result
 
 
 @router.delete("/accounts/{account_id}")
@@ -568,112 +876,124 @@ async def delete_m3u_account(account_id: int, delete_groups: bool = True):
     """
     logger.debug("[M3U] DELETE /api/m3u/accounts/%s - delete_groups=%s", account_id, delete_groups)
     client = get_client()
-    try:
-        # Get account info before deleting (includes channel_groups)
-        start = time.time()
-        account = await client.get_m3u_account(account_id)
-        account_name = account.get("name", "Unknown")
-
-        # Extract channel group IDs associated with this M3U account
-        channel_group_ids = []
-        shared_group_ids = set()
-        if delete_groups:
-            for group_setting in account.get("channel_groups", []):
-                group_id = group_setting.get("channel_group")
-                if group_id:
-                    channel_group_ids.append(group_id)
-            logger.info("[M3U] M3U account '%s' has %s associated channel groups", account_name, len(channel_group_ids))
-
-            # Check which groups are shared with other M3U accounts
-            if channel_group_ids:
-                all_accounts = await client.get_m3u_accounts()
-                group_id_set = set(channel_group_ids)
-                for other_account in all_accounts:
-                    if other_account.get("id") == account_id:
-                        continue
-                    for gs in other_account.get("channel_groups", []):
-                        gid = gs.get("channel_group")
-                        if gid in group_id_set:
-                            shared_group_ids.add(gid)
-                if shared_group_ids:
-                    logger.info("[M3U] %s groups shared with other accounts, will not delete: %s",
-                                len(shared_group_ids), sorted(shared_group_ids))
-
-        # Delete the M3U account first
-        await client.delete_m3u_account(account_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Deleted M3U account %s in %.1fms", account_id, elapsed_ms)
-
-        # Invalidate caches - streams from this M3U are now gone
-        cache = get_cache()
-        streams_cleared = cache.invalidate_prefix("streams:")
-        groups_cleared = cache.invalidate("channel_groups")
-        logger.info("[M3U] Invalidated cache after M3U deletion: %s stream entries, channel_groups=%s", streams_cleared, groups_cleared)
-
-        # Only delete orphaned groups (not referenced by any other account)
-        deleted_groups = []
-        failed_groups = []
-        skipped_groups = []
-        if delete_groups and channel_group_ids:
-            for group_id in channel_group_ids:
-                if group_id in shared_group_ids:
-                    skipped_groups.append(group_id)
-                    logger.info("[M3U] Skipped deletion of shared channel group %s", group_id)
+    # Get account info before deleting (includes channel_groups)
+    start = time.perf_counter()
+    account = await client.get_m3u_account(account_id)
+    account_name = account.get("name", "Unknown")
+
+    # Extract channel group IDs associated with this M3U account
+    channel_group_ids = []
+    shared_group_ids = set()
+    if delete_groups:
+        for group_setting in account.get("channel_groups") or ():
+            group_id = group_setting.get("channel_group")
+            if group_id:
+                channel_group_ids.append(group_id)
+        logger.info("[M3U] M3U account '%s' has %s associated channel groups", account_name, len(channel_group_ids))
+
+        # Check which groups are shared with other M3U accounts
+        if channel_group_ids:
+            all_accounts = await client.get_m3u_accounts()
+            group_id_set = set(channel_group_ids)
+            for other_account in all_accounts:
+                if other_account.get("id") == account_id:
                     continue
+                other_ids = {gs.get("channel_group") for gs in other_account.get("channel_groups") or ()}
+                shared_group_ids |= other_ids & group_id_set
+            if shared_group_ids:
+                logger.info("[M3U] %s groups shared with other accounts, will not delete: %s",
+                            len(shared_group_ids), sorted(shared_group_ids))
+
+    # Delete the M3U account first
+    await client.delete_m3u_account(account_id)
+    _invalidate_m3u_metadata_cache(account_id)
+    _forget_group_settings_payload(account_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Deleted M3U account %s in %.1fms", account_id, elapsed_ms)
+
+    # Invalidate caches - streams from this M3U are now gone
+    cache = get_cache()
+    streams_cleared = cache.invalidate_prefix("streams:")
+    groups_cleared = cache.invalidate("channel_groups")
+    client.invalidate_channel_group_names()
+    logger.info("[M3U] Invalidated cache after M3U deletion: %s stream entries, channel_groups=%s", streams_cleared, groups_cleared)
+
+    # Only delete orphaned groups (not referenced by any other account)
+    deleted_groups = []
+    failed_groups = []
+    skipped_groups = []
+    if delete_groups and channel_group_ids:
+        orphaned_group_ids = []
+        for group_id in channel_group_ids:
+            if group_id in shared_group_ids:
+                skipped_groups.append(group_id)
+                logger.info("[M3U] Skipped deletion of shared channel group %s", group_id)
+            else:
+                orphaned_group_ids.append(group_id)
+
+        sem = asyncio.Semaphore(M3U_GROUP_DELETE_CONCURRENCY)
+
+        async def delete_group(group_id):
+            async with sem:
                 try:
                     await client.delete_channel_group(group_id)
-                    deleted_groups.append(group_id)
-                    logger.info("[M3U] Deleted orphaned channel group %s (was associated with M3U '%s')", group_id, account_name)
                 except Exception as group_err:
-                    # Group might have channels or other issues - log but don't fail
-                    failed_groups.append({"id": group_id, "error": str(group_err)})
-                    logger.warning("[M3U] Failed to delete channel group %s: %s", group_id, group_err)
-
-        # Clean up linked_m3u_accounts in settings
-        try:
-            settings = get_settings()
-            if settings.linked_m3u_accounts:
-                cleaned = []
-                for link_group in settings.linked_m3u_accounts:
-                    filtered = [aid for aid in link_group if aid != account_id]
-                    # Only keep groups with 2+ accounts
-                    if len(filtered) >= 2:
-                        cleaned.append(filtered)
-                if cleaned != settings.linked_m3u_accounts:
-                    settings.linked_m3u_accounts = cleaned
-                    save_settings(settings)
-                    logger.info("[M3U] Cleaned up linked_m3u_accounts after deleting account %s", account_id)
-        except Exception as settings_err:
-            logger.warning("[M3U] Failed to clean up linked_m3u_accounts: %s", settings_err)
-
-        # Log to journal
-        journal.log_entry(
-            category="m3u",
-            action_type="delete",
-            entity_id=account_id,
-            entity_name=account_name,
-            description=f"Deleted M3U account '{account_name}'" +
-                       (f" and {len(deleted_groups)} orphaned channel groups" if deleted_groups else "") +
-                       (f" (kept {len(skipped_groups)} shared groups)" if skipped_groups else ""),
-            before_value={
-                "name": account_name,
-                "channel_groups": channel_group_ids,
-            },
-            after_value={
-                "deleted_groups": deleted_groups,
-                "skipped_groups": skipped_groups,
-                "failed_groups": failed_groups,
-            } if channel_group_ids else None,
-        )
+                    return group_err
+            return None
+
+        errors = await asyncio.gather(*(delete_group(gid) for gid in orphaned_group_ids))
+        for group_id, group_err in zip(orphaned_group_ids, errors):
+            if group_err is None:
+                deleted_groups.append(group_id)
+                logger.info("[M3U] Deleted orphaned channel group %s (was associated with M3U '%s')", group_id, account_name)
+            else:
+                # Group might have channels or other issues - log but don't fail
+                failed_groups.append({"id": group_id, "error": str(group_err)})
+                logger.warning("[M3U] Failed to delete channel group %s: %s", group_id, group_err)
 
-        return {
-            "status": "deleted",
+    # Clean up linked_m3u_accounts in settings
+    try:
+        settings = get_settings()
+        if settings.linked_m3u_accounts:
+            cleaned = []
+            for link_group in settings.linked_m3u_accounts:
+                filtered = [aid for aid in link_group if aid != account_id]
+                # Only keep groups with 2+ accounts
+                if len(filtered) >= 2:
+                    cleaned.append(filtered)
+            if cleaned != settings.linked_m3u_accounts:
+                settings.linked_m3u_accounts = cleaned
+                save_settings(settings)
+                logger.info("[M3U] Cleaned up linked_m3u_accounts after deleting account %s", account_id)
+    except Exception as settings_err:
+        logger.warning("[M3U] Failed to clean up linked_m3u_accounts: %s", settings_err)
+
+    # Log to journal
+    journal.log_entry_background(
+        category="m3u",
+        action_type="delete",
+        entity_id=account_id,
+        entity_name=account_name,
+        description=f"Deleted M3U account '{account_name}'" +
+                   (f" and {len(deleted_groups)} orphaned channel groups" if deleted_groups else "") +
+                   (f" (kept {len(skipped_groups)} shared groups)" if skipped_groups else ""),
+        before_value={
+            "name": account_name,
+            "channel_groups": channel_group_ids,
+        },
+        after_value={
             "deleted_groups": deleted_groups,
             "skipped_groups": skipped_groups,
             "failed_groups": failed_groups,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+        } if channel_group_ids else None,
+    )
+
+    return {
+        "status": "deleted",
+        "deleted_groups": deleted_groups,
+        "skipped_groups": skipped_groups,
+        "failed_groups": failed_groups,
+    }
 
 
 # -------------------------------------------------------------------------
@@ -685,59 +1005,83 @@ async def refresh_all_m3u_accounts():
     """Trigger refresh for all active M3U accounts."""
     logger.debug("[M3U-REFRESH] POST /api/m3u/refresh")
     client = get_client()
-    start = time.time()
-    try:
-        result = await client.refresh_all_m3u_accounts()
-        elapsed_ms = (time.time() - start) * 1000
-        logger.info("[M3U-REFRESH] Triggered refresh for all M3U accounts in %.1fms", elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await client.refresh_all_m3u_accounts()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info("[M3U-REFRESH] Triggered refresh for all M3U accounts in %.1fms", elapsed_ms)
+    return result
 
 
-@router.post("/refresh/{account_id}")
-async def refresh_m3u_account(account_id: int):
-    """Trigger refresh for a single M3U account.
+async def _coalesce_trigger(kind: str, account_id: int, trigger):
+    """Run trigger() once for concurrent identical requests and share its outcome.
 
-    Triggers the refresh and spawns a background task to poll for completion.
-    Success notification is sent only when refresh actually completes.
+    A duplicate request for the same kind/account that arrives while the first
+    is still in flight awaits that call instead of issuing another upstream
+    trigger. Shielded so one caller disconnecting doesn't cancel the others.
     """
-    logger.debug("[M3U-REFRESH] POST /api/m3u/refresh/%s", account_id)
+    key = (kind, account_id)
+    task = _IN_FLIGHT_TRIGGERS.get(key)
+    if task is None:
+        task = asyncio.create_task(trigger())
+        _IN_FLIGHT_TRIGGERS[key] = task
+
+        def forget(done: asyncio.Task) -> None:
+            if _IN_FLIGHT_TRIGGERS.get(key) is done:
+                del _IN_FLIGHT_TRIGGERS[key]
+
+        task.add_done_callback(forget)
+    else:
+        logger.debug("[M3U-REFRESH] Joining in-flight %s trigger for account %s", kind, account_id)
+    return await asyncio.shield(task)
+
+
+async def _trigger_m3u_refresh(account_id: int) -> dict:
+    """Trigger one account's refresh, schedule its completion poller and return the 202 body."""
     client = get_client()
     try:
         # Get account info and capture initial state for polling
-        start = time.time()
-        account = await client.get_m3u_account(account_id)
+        start = time.perf_counter()
+        account = await client.get_m3u_account(account_id, use_cache=False)
         account_name = account.get("name", "Unknown")
         initial_updated = account.get("updated_at") or account.get("last_refresh")
 
         # Trigger the refresh (returns immediately, refresh happens in background)
         result = await client.refresh_m3u_account(account_id)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U-REFRESH] Triggered refresh for account %s in %.1fms", account_id, elapsed_ms)
 
-        # Spawn background task to poll for completion and send notification
-        asyncio.create_task(
-            _poll_m3u_refresh_completion(account_id, account_name, initial_updated)
-        )
+        # Schedule background task to poll for completion and send notification
+        task_id = _schedule_refresh_poll(account_id, account_name, initial_updated)
 
-        logger.info("[M3U-REFRESH] Triggered refresh for '%s', polling for completion in background", account_name)
-        return result
+        logger.info("[M3U-REFRESH] Triggered refresh for '%s', polling for completion in background (task %s)", account_name, task_id)
+        return {"status": "scheduled", "task_id": task_id, "result": result}
     except Exception as e:
-        # Send error notification for trigger failure
-        try:
-            await send_alert(
-                title="M3U Refresh Failed",
-                message=f"Failed to trigger M3U refresh for account (ID: {account_id}): {str(e)}",
-                notification_type="error",
-                source="M3U Refresh",
-                metadata={"account_id": account_id, "error": str(e)},
-                alert_category="m3u_refresh",
-                entity_id=account_id,
-            )
-        except Exception:
-            pass  # Don't fail the request if notification fails
-        raise HTTPException(status_code=500, detail="Internal server error")
+        # Send error notification for trigger failure without holding the
+        # error response on notification delivery
+        _send_alert_background(
+            title="M3U Refresh Failed",
+            message=f"Failed to trigger M3U refresh for account (ID: {account_id}): {str(e)}",
+            notification_type="error",
+            source="M3U Refresh",
+            metadata={"account_id": account_id, "error": str(e)},
+            alert_category="m3u_refresh",
+            entity_id=account_id,
+        )
+        raise
+
+
+@router.post("/refresh/{account_id}", status_code=202)
+async def refresh_m3u_account(account_id: int):
+    """Trigger refresh for a single M3U account.
+
+    Triggers the refresh and schedules a tracked background task to poll for
+    completion, returning 202 with the poller's task_id. Success notification
+    is sent only when refresh actually completes. Concurrent requests for the
+    same account share one upstream trigger.
+    """
+    logger.debug("[M3U-REFRESH] POST /api/m3u/refresh/%s", account_id)
+    content = await _coalesce_trigger("refresh", account_id, lambda: _trigger_m3u_refresh(account_id))
+    return JSONResponse(status_code=202, content=content)
 
 
 @router.post("/accounts/{account_id}/refresh-vod")
@@ -745,14 +1089,11 @@ async def refresh_m3u_vod(account_id: int):
     """Refresh VOD content for an XtreamCodes account."""
     logger.debug("[M3U-REFRESH] POST /api/m3u/accounts/%s/refresh-vod", account_id)
     client = get_client()
-    start = time.time()
-    try:
-        result = await client.refresh_m3u_vod(account_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.info("[M3U-REFRESH] Triggered VOD refresh for account %s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await _coalesce_trigger("refresh_vod", account_id, lambda: client.refresh_m3u_vod(account_id))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info("[M3U-REFRESH] Triggered VOD refresh for account %s in %.1fms", account_id, elapsed_ms)
+    return result
 
 
 # -------------------------------------------------------------------------
@@ -760,18 +1101,15 @@ async def refresh_m3u_vod(account_id: int):
 # -------------------------------------------------------------------------
 
 @router.get("/accounts/{account_id}/filters")
-async def get_m3u_filters(account_id: int):
+async def get_m3u_filters(account_id: int, request: Request):
     """Get all filters for an M3U account."""
     logger.debug("[M3U] GET /api/m3u/accounts/%s/filters", account_id)
     client = get_client()
-    try:
-        start = time.time()
-        result = await client.get_m3u_filters(account_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Fetched filters for account %s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await client.get_m3u_filters(account_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Fetched filters for account %s in %.1fms", account_id, elapsed_ms)
+    return etag_json_response(request, result)
 
 
 @router.post("/accounts/{account_id}/filters")
@@ -779,15 +1117,12 @@ async def create_m3u_filter(account_id: int, request: Request):
     """Create a new filter for an M3U account."""
     logger.debug("[M3U] POST /api/m3u/accounts/%s/filters", account_id)
     client = get_client()
-    try:
-        data = await request.json()
-        start = time.time()
-        result = await client.create_m3u_filter(account_id, data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Created filter for account %s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    data = await _read_json_object(request)
+    start = time.perf_counter()
+    result = await client.create_m3u_filter(account_id, data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Created filter for account %s in %.1fms", account_id, elapsed_ms)
+    return result
 
 
 @router.put("/accounts/{account_id}/filters/{filter_id}")
@@ -795,15 +1130,12 @@ async def update_m3u_filter(account_id: int, filter_id: int, request: Request):
     """Update a filter for an M3U account."""
     logger.debug("[M3U] PUT /api/m3u/accounts/%s/filters/%s", account_id, filter_id)
     client = get_client()
-    try:
-        data = await request.json()
-        start = time.time()
-        result = await client.update_m3u_filter(account_id, filter_id, data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Updated filter %s for account %s in %.1fms", filter_id, account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    data = await _read_json_object(request)
+    start = time.perf_counter()
+    result = await client.update_m3u_filter(account_id, filter_id, data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Updated filter %s for account %s in %.1fms", filter_id, account_id, elapsed_ms)
+    return result
 
 
 @router.delete("/accounts/{account_id}/filters/{filter_id}")
@@ -811,14 +1143,11 @@ async def delete_m3u_filter(account_id: int, filter_id: int):
     """Delete a filter from an M3U account."""
     logger.debug("[M3U] DELETE /api/m3u/accounts/%s/filters/%s", account_id, filter_id)
     client = get_client()
-    try:
-        start = time.time()
-        await client.delete_m3u_filter(account_id, filter_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Deleted filter %s for account %s in %.1fms", filter_id, account_id, elapsed_ms)
-        return {"status": "deleted"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    await client.delete_m3u_filter(account_id, filter_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Deleted filter %s for account %s in %.1fms", filter_id, account_id, elapsed_ms)
+    return {"status": "deleted"}
 
 
 # -------------------------------------------------------------------------
@@ -826,18 +1155,15 @@ async def delete_m3u_filter(account_id: int, filter_id: int):
 # -------------------------------------------------------------------------
 
 @router.get("/accounts/{account_id}/profiles/")
-async def get_m3u_profiles(account_id: int):
+async def get_m3u_profiles(account_id: int, request: Request):
     """Get all profiles for an M3U account."""
     logger.debug("[M3U] GET /api/m3u/accounts/%s/profiles", account_id)
     client = get_client()
-    try:
-        start = time.time()
-        result = await client.get_m3u_profiles(account_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Fetched profiles for account %s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await client.get_m3u_profiles(account_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Fetched profiles for account %s in %.1fms", account_id, elapsed_ms)
+    return etag_json_response(request, result)
 
 
 @router.post("/accounts/{account_id}/profiles/")
@@ -845,28 +1171,25 @@ async def create_m3u_profile(account_id: int, request: Request):
     """Create a new profile for an M3U account."""
     logger.debug("[M3U] POST /api/m3u/accounts/%s/profiles", account_id)
     client = get_client()
-    try:
-        data = await request.json()
-        start = time.time()
-        result = await client.create_m3u_profile(account_id, data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Created profile for account %s in %.1fms", account_id, elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    data = await _read_json_object(request)
+    start = time.perf_counter()
+    result = await client.create_m3u_profile(account_id, data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Created profile for account %s in %.1fms", account_id, elapsed_ms)
+    return result
 
 
 @router.get("/accounts/{account_id}/profiles/{profile_id}/")
-async def get_m3u_profile(account_id: int, profile_id: int):
+async def get_m3u_profile(account_id: int, profile_id: int, request: Request):
     """Get a specific profile for an M3U account."""
     logger.debug("[M3U] GET /api/m3u/accounts/%s/profiles/%s", account_id, profile_id)
     client = get_client()
     try:
-        start = time.time()
+        start = time.perf_counter()
         result = await client.get_m3u_profile(account_id, profile_id)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U] Fetched profile %s for account %s in %.1fms", profile_id, account_id, elapsed_ms)
-        return result
+        return etag_json_response(request, result)
     except Exception as e:
         logger.warning("[M3U] Failed to fetch profile %s for account %s: %s", profile_id, account_id, e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -877,11 +1200,11 @@ async def update_m3u_profile(account_id: int, profile_id: int, request: Request)
     """Update a profile for an M3U account."""
     logger.debug("[M3U] PATCH /api/m3u/accounts/%s/profiles/%s", account_id, profile_id)
     client = get_client()
+    data = await _read_json_object(request)
     try:
-        data = await request.json()
-        start = time.time()
+        start = time.perf_counter()
         result = await client.update_m3u_profile(account_id, profile_id, data)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U] Updated profile %s for account %s in %.1fms", profile_id, account_id, elapsed_ms)
         return result
     except Exception as e:
@@ -895,9 +1218,9 @@ async def delete_m3u_profile(account_id: int, profile_id: int):
     logger.debug("[M3U] DELETE /api/m3u/accounts/%s/profiles/%s", account_id, profile_id)
     client = get_client()
     try:
-        start = time.time()
+        start = time.perf_counter()
         await client.delete_m3u_profile(account_id, profile_id)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U] Deleted profile %s for account %s in %.1fms", profile_id, account_id, elapsed_ms)
         return {"status": "deleted"}
     except Exception as e:
@@ -914,129 +1237,155 @@ async def update_m3u_group_settings(account_id: int, request: Request):
     """Update group settings for an M3U account."""
     logger.debug("[M3U] PATCH /api/m3u/accounts/%s/group-settings", account_id)
     client = get_client()
-    try:
-        # Get account info and current group settings before update
-        start = time.time()
-        account = await client.get_m3u_account(account_id)
-        account_name = account.get("name", "Unknown")
-        # Store full settings for each group (all auto-sync related fields)
-        before_groups = {}
-        for g in account.get("channel_groups", []):
-            before_groups[g.get("channel_group")] = {
-                "enabled": g.get("enabled"),
-                "auto_channel_sync": g.get("auto_channel_sync"),
-                "auto_sync_channel_start": g.get("auto_sync_channel_start"),
-                "custom_properties": g.get("custom_properties"),
-            }
-
-        # Get channel groups for name lookup
-        channel_groups = await client.get_channel_groups()
-        group_name_map = {g["id"]: g["name"] for g in channel_groups}
-
-        data = await request.json()
+    data = await _read_json_object(request)
+
+    # Autosaving UIs resend the same payload; a repeat of the last successful
+    # update is answered from that update without touching Dispatcharr
+    cache = get_cache()
+    repeat_key = _group_settings_repeat_key(account_id)
+    digest = hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    last = cache.get(repeat_key, ttl=M3U_GROUP_SETTINGS_REPEAT_TTL_SECONDS)
+    if last is not None and last[0] == digest:
+        logger.debug("[M3U] Group settings for account %s unchanged since last update, skipping", account_id)
+        return last[1]
+
+    group_settings = data.get("group_settings") or ()
+    start = time.perf_counter()
+    if not group_settings:
+        # Nothing per-group to journal - skip the before-state fetches
         result = await client.update_m3u_group_settings(account_id, data)
-        elapsed_ms = (time.time() - start) * 1000
+        cache.set(repeat_key, (digest, result))
+        elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug("[M3U] Updated group settings for account %s in %.1fms", account_id, elapsed_ms)
+        return result
 
-        # Log to journal - compare before/after states for all settings
-        group_settings = data.get("group_settings", [])
-        if group_settings:
-            enabled_names = []
-            disabled_names = []
-            auto_sync_enabled_names = []
-            auto_sync_disabled_names = []
-            start_channel_changed = []
-            settings_changed_names = []
-            changed_groups = []
-
-            for gs in group_settings:
-                channel_group_id = gs.get("channel_group")
-                before = before_groups.get(channel_group_id, {})
-                group_name = group_name_map.get(channel_group_id, f"Group {channel_group_id}")
-
-                changes_for_group = {}
-
-                # Check enabled change
-                new_enabled = gs.get("enabled")
-                old_enabled = before.get("enabled")
-                if old_enabled is not None and new_enabled != old_enabled:
-                    if new_enabled:
-                        enabled_names.append(group_name)
-                    else:
-                        disabled_names.append(group_name)
-                    changes_for_group["enabled"] = {"was": old_enabled, "now": new_enabled}
-
-                # Check auto_channel_sync change
-                new_auto_sync = gs.get("auto_channel_sync")
-                old_auto_sync = before.get("auto_channel_sync")
-                if old_auto_sync is not None and new_auto_sync != old_auto_sync:
-                    if new_auto_sync:
-                        auto_sync_enabled_names.append(group_name)
-                    else:
-                        auto_sync_disabled_names.append(group_name)
-                    changes_for_group["auto_channel_sync"] = {"was": old_auto_sync, "now": new_auto_sync}
-
-                # Check auto_sync_channel_start change
-                new_start = gs.get("auto_sync_channel_start")
-                old_start = before.get("auto_sync_channel_start")
-                if old_start != new_start:
-                    start_channel_changed.append(f"{group_name} ({old_start} → {new_start})")
-                    changes_for_group["auto_sync_channel_start"] = {"was": old_start, "now": new_start}
-
-                # Check custom_properties change
-                # Normalize empty dict and None to be equivalent
-                new_custom = gs.get("custom_properties")
-                old_custom = before.get("custom_properties")
-                # Treat empty dict {} as equivalent to None
-                new_custom_normalized = new_custom if new_custom else None
-                old_custom_normalized = old_custom if old_custom else None
-                if old_custom_normalized != new_custom_normalized:
-                    settings_changed_names.append(group_name)
-                    changes_for_group["custom_properties"] = {"was": old_custom, "now": new_custom}
-
-                if changes_for_group:
-                    changed_groups.append({
-                        "channel_group": channel_group_id,
-                        "name": group_name,
-                        "changes": changes_for_group,
-                    })
-
-            if changed_groups:
-                changes = []
-                if enabled_names:
-                    changes.append(f"Enabled: {', '.join(enabled_names)}")
-                if disabled_names:
-                    changes.append(f"Disabled: {', '.join(disabled_names)}")
-                if auto_sync_enabled_names:
-                    changes.append(f"Auto-sync on: {', '.join(auto_sync_enabled_names)}")
-                if auto_sync_disabled_names:
-                    changes.append(f"Auto-sync off: {', '.join(auto_sync_disabled_names)}")
-                if start_channel_changed:
-                    changes.append(f"Start channel: {', '.join(start_channel_changed)}")
-                if settings_changed_names:
-                    changes.append(f"Settings: {', '.join(settings_changed_names)}")
-
-                # Only include before state for groups that actually changed
-                changed_group_ids = {g["channel_group"] for g in changed_groups}
-                before_changed_only = {
-                    gid: {**before_groups[gid], "name": group_name_map.get(gid, f"Group {gid}")}
-                    for gid in changed_group_ids
-                    if gid in before_groups
+    # Get account info (current group settings) and the channel group
+    # names (cached on the client) concurrently before the update
+    account, group_name_map = await asyncio.gather(
+        client.get_m3u_account(account_id),
+        client.channel_group_names(),
+    )
+    account_name = account.get("name", "Unknown")
+    # Store full settings for each group as a tuple in _GROUP_SETTING_FIELDS
+    # order (enabled, auto_channel_sync, auto_sync_channel_start, custom_properties)
+    before_groups = {}
+    for g in account.get("channel_groups") or ():
+        g_get = g.get
+        before_groups[g_get("channel_group")] = tuple(g_get(field) for field in _GROUP_SETTING_FIELDS)
+    fetched = time.perf_counter()
+
+    result = await client.update_m3u_group_settings(account_id, data)
+    cache.set(repeat_key, (digest, result))
+    updated = time.perf_counter()
+
+    # Log to journal - compare before/after states for all settings
+    # Group names bucketed by description label as changes are found
+    change_buckets = defaultdict(list)
+    # Journal after_value, built in the same pass as the buckets
+    changed_groups = []
+    # Before state, only for groups that actually changed
+    before_changed_only = {}
+
+    for gs in group_settings:
+        # PATCH semantics: only compare the fields this entry submitted
+        submitted = gs.keys() & _TRACKED_GROUP_SETTING_FIELDS
+        if not submitted:
+            continue
+
+        gs_get = gs.get
+        channel_group_id = gs_get("channel_group")
+        before = before_groups.get(channel_group_id)
+        old_enabled, old_auto_sync, old_start, old_custom = before or (None, None, None, None)
+
+        # Fast path: a full entry identical to the current settings (the
+        # common case for bulk saves) has nothing to diff; one C-level tuple
+        # compare, with {} and None custom_properties treated alike
+        if before is not None and len(submitted) == len(_TRACKED_GROUP_SETTING_FIELDS):
+            current = _group_setting_values(gs)
+            if current == before or (current[:3] == before[:3] and not current[3] and not old_custom):
+                continue
+
+        group_name = group_name_map.get(channel_group_id, f"Group {channel_group_id}")
+
+        changes_for_group = {}
+
+        # Check enabled change
+        if "enabled" in submitted:
+            new_enabled = gs_get("enabled")
+            if old_enabled is not None and new_enabled != old_enabled:
+                if new_enabled:
+                    change_buckets["Enabled"].append(group_name)
+                else:
+                    change_buckets["Disabled"].append(group_name)
+                changes_for_group["enabled"] = {"was": old_enabled, "now": new_enabled}
+
+        # Check auto_channel_sync change
+        if "auto_channel_sync" in submitted:
+            new_auto_sync = gs_get("auto_channel_sync")
+            if old_auto_sync is not None and new_auto_sync != old_auto_sync:
+                if new_auto_sync:
+                    change_buckets["Auto-sync on"].append(group_name)
+                else:
+                    change_buckets["Auto-sync off"].append(group_name)
+                changes_for_group["auto_channel_sync"] = {"was": old_auto_sync, "now": new_auto_sync}
+
+        # Check auto_sync_channel_start change
+        if "auto_sync_channel_start" in submitted:
+            new_start = gs_get("auto_sync_channel_start")
+            if old_start != new_start:
+                change_buckets["Start channel"].append(f"{group_name} ({old_start} → {new_start})")
+                changes_for_group["auto_sync_channel_start"] = {"was": old_start, "now": new_start}
+
+        # Check custom_properties change
+        if "custom_properties" in submitted:
+            new_custom = gs_get("custom_properties")
+            # Treat empty dict {} as equivalent to None
+            if (old_custom or None) != (new_custom or None):
+                change_buckets["Settings"].append(group_name)
+                changes_for_group["custom_properties"] = {"was": old_custom, "now": new_custom}
+
+        if changes_for_group:
+            changed_groups.append({
+                "channel_group": channel_group_id,
+                "name": group_name,
+                "changes": changes_for_group,
+            })
+            if before is not None:
+                # Built from the values already unpacked for the diff
+                before_changed_only[channel_group_id] = {
+                    "enabled": old_enabled,
+                    "auto_channel_sync": old_auto_sync,
+                    "auto_sync_channel_start": old_start,
+                    "custom_properties": old_custom,
+                    "name": group_name,
                 }
 
-                journal.log_entry(
-                    category="m3u",
-                    action_type="update",
-                    entity_id=account_id,
-                    entity_name=account_name,
-                    description=f"Updated group settings - {'; '.join(changes)}",
-                    before_value=before_changed_only,
-                    after_value=changed_groups,
-                )
+    if changed_groups:
+        # Only labels that collected names are joined, in display order
+        description = "Updated group settings - " + "; ".join(
+            f"{label}: {', '.join(names)}"
+            for label in _GROUP_CHANGE_LABELS
+            if (names := change_buckets.get(label))
+        )
 
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+        journal.log_entry_background(
+            category="m3u",
+            action_type="update",
+            entity_id=account_id,
+            entity_name=account_name,
+            description=description,
+            before_value=before_changed_only,
+            after_value=changed_groups,
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        done = time.perf_counter()
+        logger.debug(
+            "[M3U] Updated group settings for account %s in %.1fms (fetch %.1fms, update %.1fms, diff %.1fms)",
+            account_id, (done - start) * 1000, (fetched - start) * 1000,
+            (updated - fetched) * 1000, (done - updated) * 1000,
+        )
+    return result
 
 
 # -------------------------------------------------------------------------
@@ -1044,18 +1393,15 @@ async def update_m3u_group_settings(account_id: int, request: Request):
 # -------------------------------------------------------------------------
 
 @router.get("/server-groups")
-async def get_server_groups():
+async def get_server_groups(request: Request):
     """Get all server groups."""
     logger.debug("[M3U] GET /api/m3u/server-groups")
     client = get_client()
-    try:
-        start = time.time()
-        result = await client.get_server_groups()
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Fetched server groups in %.1fms", elapsed_ms)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    start = time.perf_counter()
+    result = await client.get_server_groups()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Fetched server groups in %.1fms", elapsed_ms)
+    return etag_json_response(request, result)
 
 
 @router.post("/server-groups")
@@ -1063,28 +1409,25 @@ async def create_server_group(request: Request):
     """Create a new server group."""
     logger.debug("[M3U] POST /api/m3u/server-groups")
     client = get_client()
-    try:
-        data = await request.json()
-        start = time.time()
-        result = await client.create_server_group(data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Created server group in %.1fms", elapsed_ms)
-
-        # Log to journal
-        group_name = data.get("name", "Unknown")
-        account_ids = data.get("account_ids", [])
-        journal.log_entry(
-            category="m3u",
-            action_type="create",
-            entity_id=result.get("id"),
-            entity_name=group_name,
-            description=f"Created server group '{group_name}' linking {len(account_ids)} M3U account(s)",
-            after_value={"name": group_name, "account_ids": account_ids},
-        )
-
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    data = await _read_json_object(request)
+    start = time.perf_counter()
+    result = await client.create_server_group(data)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Created server group in %.1fms", elapsed_ms)
+
+    # Log to journal
+    group_name = data.get("name", "Unknown")
+    account_ids = data.get("account_ids", [])
+    journal.log_entry_background(
+        category="m3u",
+        action_type="create",
+        entity_id=result.get("id"),
+        entity_name=group_name,
+        description=f"Created server group '{group_name}' linking {len(account_ids)} M3U account(s)",
+        after_value={"name": group_name, "account_ids": account_ids},
+    )
+
+    return result
 
 
 @router.patch("/server-groups/{group_id}")
@@ -1092,42 +1435,43 @@ async def update_server_group(group_id: int, request: Request):
     """Update a server group."""
     logger.debug("[M3U] PATCH /api/m3u/server-groups/%s", group_id)
     client = get_client()
-    try:
-        # Get current group info
-        start = time.time()
-        groups = await client.get_server_groups()
-        before_group = next((g for g in groups if g.get("id") == group_id), {})
-        before_name = before_group.get("name", "Unknown")
+    data = await _read_json_object(request)
+    # Get current group info
+    start = time.perf_counter()
+    before_group = await client.get_server_group(group_id)
+    before_name = before_group.get("name", "Unknown")
+    fetched = time.perf_counter()
+
+    result = await client.update_server_group(group_id, data)
+    if logger.isEnabledFor(logging.DEBUG):
+        done = time.perf_counter()
+        logger.debug(
+            "[M3U] Updated server group %s in %.1fms (fetch %.1fms, update %.1fms)",
+            group_id, (done - start) * 1000, (fetched - start) * 1000, (done - fetched) * 1000,
+        )
 
-        data = await request.json()
-        result = await client.update_server_group(group_id, data)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Updated server group %s in %.1fms", group_id, elapsed_ms)
+    # Log to journal
+    new_name = data.get("name", before_name)
+    account_ids = data.get("account_ids", [])
 
-        # Log to journal
-        new_name = data.get("name", before_name)
-        account_ids = data.get("account_ids", [])
-
-        changes = []
-        if "name" in data and data["name"] != before_name:
-            changes.append(f"renamed to '{new_name}'")
-        if "account_ids" in data:
-            changes.append(f"updated to {len(account_ids)} M3U account(s)")
-
-        if changes:
-            journal.log_entry(
-                category="m3u",
-                action_type="update",
-                entity_id=group_id,
-                entity_name=new_name,
-                description=f"Updated server group: {', '.join(changes)}",
-                before_value={"name": before_name, "account_ids": before_group.get("account_ids", [])},
-                after_value=data,
-            )
+    changes = []
+    if "name" in data and data["name"] != before_name:
+        changes.append(f"renamed to '{new_name}'")
+    if "account_ids" in data:
+        changes.append(f"updated to {len(account_ids)} M3U account(s)")
 
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    if changes:
+        journal.log_entry_background(
+            category="m3u",
+            action_type="update",
+            entity_id=group_id,
+            entity_name=new_name,
+            description=f"Updated server group: {', '.join(changes)}",
+            before_value={"name": before_name, "account_ids": before_group.get("account_ids", [])},
+            after_value=data,
+        )
+
+    return result
 
 
 @router.delete("/server-groups/{group_id}")
@@ -1135,27 +1479,23 @@ async def delete_server_group(group_id: int):
     """Delete a server group."""
     logger.debug("[M3U] DELETE /api/m3u/server-groups/%s", group_id)
     client = get_client()
-    try:
-        # Get group info before deleting
-        start = time.time()
-        groups = await client.get_server_groups()
-        group = next((g for g in groups if g.get("id") == group_id), {})
-        group_name = group.get("name", "Unknown")
-
-        await client.delete_server_group(group_id)
-        elapsed_ms = (time.time() - start) * 1000
-        logger.debug("[M3U] Deleted server group %s in %.1fms", group_id, elapsed_ms)
-
-        # Log to journal
-        journal.log_entry(
-            category="m3u",
-            action_type="delete",
-            entity_id=group_id,
-            entity_name=group_name,
-            description=f"Deleted server group '{group_name}'",
-            before_value={"name": group_name, "account_ids": group.get("account_ids", [])},
-        )
-
-        return {"status": "deleted"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Get group info before deleting
+    start = time.perf_counter()
+    group = await client.get_server_group(group_id)
+    group_name = group.get("name", "Unknown")
+
+    await client.delete_server_group(group_id)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.debug("[M3U] Deleted server group %s in %.1fms", group_id, elapsed_ms)
+
+    # Log to journal
+    journal.log_entry_background(
+        category="m3u",
+        action_type="delete",
+        entity_id=group_id,
+        entity_name=group_name,
+        description=f"Deleted server group '{group_name}'",
+        before_value={"name": group_name, "account_ids": group.get("account_ids", [])},
+    )
+
+    return {"status": "deleted"}
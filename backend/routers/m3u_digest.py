@@ -6,12 +6,21 @@ Extracted from main.py (Phase 2 of v0.13.0 backend refactor).
 """
 import logging
 import re
+from datetime import datetime
 from typing import Optional, List
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-
-from database import get_session
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from cache import get_cache
+from concurrency import run_cpu_bound
+from database import get_db
+from json_responses import etag_json_response, json_response
+from tasks.m3u_digest import DIGEST_SETTINGS_CACHE_KEY
 import journal
 import safe_regex
 
@@ -19,6 +28,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/m3u", tags=["M3U Digest"])
 
+# Digest recipient address check
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Change lists are streamed one JSON object per line when the client sends
+# Accept: application/x-ndjson, reading this many rows per query
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_ROWS = 200
+
+# Recent-snapshot pages served by GET /snapshots
+SNAPSHOT_LIST_CACHE_TTL_SECONDS = 30
+
+# Digest schedules accepted by PUT /digest/settings
+_ALLOWED_FREQUENCIES = frozenset({"immediate", "hourly", "daily", "weekly"})
+
+# Settings UIs poll GET /digest/settings; writes drop the cached copy, the TTL
+# only bounds how long a change made outside this router can go unseen
+DIGEST_SETTINGS_CACHE_TTL_SECONDS = 5
+
 
 # -------------------------------------------------------------------------
 # Pydantic models
@@ -38,12 +65,154 @@ class M3UDigestSettingsUpdate(BaseModel):
     exclude_stream_patterns: Optional[List[str]] = None  # Regex patterns to exclude streams
 
 
+def _fetch_page_with_total(query, page: int, page_size: int) -> tuple[list, int]:
+    """Fetch one page of an ordered query plus the unpaginated total in one round trip.
+
+    The total rides along on every row as a COUNT(*) OVER () window column.
+    Only an empty page (no matches, or past the end) needs a separate count.
+    Rows come back as-is, with the extra ``total`` column on each.
+    """
+    return _fetch_slice_with_total(query, (page - 1) * page_size, page_size)
+
+
+def _fetch_slice_with_total(query, offset: int, limit: int) -> tuple[list, int]:
+    """_fetch_page_with_total() for an arbitrary offset/limit window."""
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        return rows, rows[0].total
+    return [], (query.count() if offset > 0 else 0)
+
+
+def _wants_ndjson(request: Request) -> bool:
+    """True when the client asked for newline-delimited JSON rows."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _ndjson_change_stream(query, page: int, page_size: int) -> StreamingResponse:
+    """Stream one page of a change-row query as NDJSON, one change per line.
+
+    Rows are read in NDJSON_CHUNK_ROWS slices, so neither the full page nor
+    one big JSON document is ever held in memory. The
+    unpaginated total goes out in X-Total-Count, taken from the first slice.
+    No cursor stays open between slices; each one is its own short query on
+    the shared SQLite connection.
+    """
+    offset = (page - 1) * page_size
+    rows, total = _fetch_slice_with_total(
+        query, offset, min(page_size, NDJSON_CHUNK_ROWS)
+    )
+
+    async def lines():
+        nonlocal rows, offset
+        remaining = page_size
+        while rows:
+            yield b"".join(orjson.dumps(_change_row_to_dict(row)) + b"\n" for row in rows)
+            offset += len(rows)
+            remaining -= len(rows)
+            if remaining <= 0 or len(rows) < NDJSON_CHUNK_ROWS:
+                break
+            rows = query.offset(offset).limit(min(remaining, NDJSON_CHUNK_ROWS)).all()
+
+    return StreamingResponse(
+        lines(), media_type=NDJSON_MEDIA_TYPE, headers={"X-Total-Count": str(total)}
+    )
+
+
+def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 date filter; None when absent or malformed.
+
+    A malformed value from the client just means the filter is ignored.
+    fromisoformat() accepts a trailing "Z" natively on Python 3.11+.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _change_columns():
+    """Columns the change-list endpoints return, selected without the ORM entity.
+
+    Loading full M3UChangeLog objects also joins in the snapshot relationship
+    (lazy="joined") and tracks every row in the identity map; the list
+    responses need neither.
+    """
+    from models import M3UChangeLog
+
+    return (
+        M3UChangeLog.id,
+        M3UChangeLog.m3u_account_id,
+        M3UChangeLog.change_time,
+        M3UChangeLog.change_type,
+        M3UChangeLog.group_name,
+        M3UChangeLog.stream_names,
+        M3UChangeLog.count,
+        M3UChangeLog.enabled,
+        M3UChangeLog.snapshot_id,
+    )
+
+
+def _change_row_to_dict(row) -> dict:
+    """Shape a projected change row like M3UChangeLog.to_dict()."""
+    from models import M3UChangeLog
+
+    return {
+        "id": row.id,
+        "m3u_account_id": row.m3u_account_id,
+        "change_time": row.change_time.isoformat() + "Z" if row.change_time else None,
+        "change_type": row.change_type,
+        "group_name": row.group_name,
+        "stream_names": M3UChangeLog.parse_stream_names(row.stream_names),
+        "count": row.count,
+        "enabled": row.enabled,
+        "snapshot_id": row.snapshot_id,
+    }
+
+
+def _unique_patterns(patterns: Optional[List[str]]) -> Optional[List[str]]:
+    """Drop repeated and empty exclude patterns, keeping first-seen order.
+
+    The digest evaluator runs every stored pattern against every group or
+    stream name, so a pasted duplicate is pure repeat work, and an empty
+    pattern would match (exclude) everything. None (field not sent) stays None.
+    """
+    if patterns is None:
+        return None
+    return [pattern for pattern in dict.fromkeys(patterns) if pattern]
+
+
+def _exclude_pattern_errors(patterns_by_kind: dict[str, list[str]]) -> list[str]:
+    """Compile every exclude pattern and describe each one that is rejected.
+
+    Validates via safe_regex.compile so the write-time check enforces the same
+    length cap (DEFAULT_MAX_PATTERN_LEN=500) and uniform compile-error surface
+    as the runtime evaluator in tasks/m3u_digest.py (bd-3u6p0; safe_regex
+    shipped in bd-eio04.5).
+    """
+    errors = []
+    for kind, patterns in patterns_by_kind.items():
+        for pattern in patterns:
+            try:
+                safe_regex.compile(pattern)
+            except safe_regex.SafeRegexError as e:
+                errors.append(f"Invalid {kind} exclude regex '{pattern}': {e}")
+    return errors
+
+
 # -------------------------------------------------------------------------
 # M3U Change Tracking API
 # -------------------------------------------------------------------------
 
 @router.get("/changes")
 async def get_m3u_changes(
+    request: Request,
     page: int = 1,
     page_size: int = 50,
     m3u_account_id: Optional[int] = None,
@@ -53,6 +222,7 @@ async def get_m3u_changes(
     sort_order: Optional[str] = "desc",
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
     """
     Get paginated list of M3U change logs.
@@ -67,75 +237,81 @@ async def get_m3u_changes(
         sort_order: Sort order (asc or desc, default: desc)
         date_from: Filter changes from this date (ISO format)
         date_to: Filter changes until this date (ISO format)
+
+    Sends one change per line (with the total in X-Total-Count) when the
+    client accepts application/x-ndjson.
     """
     logger.debug("[M3U-DIGEST] GET /api/m3u/changes - page=%s m3u_account_id=%s change_type=%s", page, m3u_account_id, change_type)
-    from datetime import datetime as dt
+    query = _changes_query(
+        db, m3u_account_id, change_type, enabled, sort_by, sort_order,
+        _parse_iso_datetime(date_from), _parse_iso_datetime(date_to),
+    )
+    if _wants_ndjson(request):
+        return await _ndjson_change_stream(query, page, page_size)
+    return json_response(_change_page(query, page, page_size))
+
+
+def _changes_query(
+    db: Session,
+    m3u_account_id: Optional[int],
+    change_type: Optional[str],
+    enabled: Optional[bool],
+    sort_by: Optional[str],
+    sort_order: Optional[str],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+):
+    """Build the filtered, sorted change-row query for get_m3u_changes."""
     from models import M3UChangeLog
 
-    db = get_session()
-    try:
-        query = db.query(M3UChangeLog)
-
-        # Apply filters
-        if m3u_account_id:
-            query = query.filter(M3UChangeLog.m3u_account_id == m3u_account_id)
-        if change_type:
-            query = query.filter(M3UChangeLog.change_type == change_type)
-        if enabled is not None:
-            query = query.filter(M3UChangeLog.enabled == enabled)
-        if date_from:
-            try:
-                date_from_dt = dt.fromisoformat(date_from.replace("Z", "+00:00"))
-                query = query.filter(M3UChangeLog.change_time >= date_from_dt)
-            except ValueError:
-                pass  # Invalid date format from client; ignore filter
-        if date_to:
-            try:
-                date_to_dt = dt.fromisoformat(date_to.replace("Z", "+00:00"))
-                query = query.filter(M3UChangeLog.change_time <= date_to_dt)
-            except ValueError:
-                pass  # Invalid date format from client; ignore filter
-
-        # Get total count
-        total = query.count()
-
-        # Apply sorting
-        sort_columns = {
-            "change_time": M3UChangeLog.change_time,
-            "m3u_account_id": M3UChangeLog.m3u_account_id,
-            "change_type": M3UChangeLog.change_type,
-            "group_name": M3UChangeLog.group_name,
-            "count": M3UChangeLog.count,
-            "enabled": M3UChangeLog.enabled,
-        }
-        sort_column = sort_columns.get(sort_by, M3UChangeLog.change_time)
-        if sort_order == "asc":
-            query = query.order_by(sort_column.asc())
-        else:
-            query = query.order_by(sort_column.desc())
-
-        # Apply pagination
-        changes = (
-            query.offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
-
-        return {
-            "results": [c.to_dict() for c in changes],
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size,
-        }
-    finally:
-        db.close()
+    query = db.query(*_change_columns())
+
+    # Apply filters
+    if m3u_account_id:
+        query = query.filter(M3UChangeLog.m3u_account_id == m3u_account_id)
+    if change_type:
+        query = query.filter(M3UChangeLog.change_type == change_type)
+    if enabled is not None:
+        query = query.filter(M3UChangeLog.enabled == enabled)
+    if date_from is not None:
+        query = query.filter(M3UChangeLog.change_time >= date_from)
+    if date_to is not None:
+        query = query.filter(M3UChangeLog.change_time <= date_to)
+
+    # Apply sorting
+    sort_columns = {
+        "change_time": M3UChangeLog.change_time,
+        "m3u_account_id": M3UChangeLog.m3u_account_id,
+        "change_type": M3UChangeLog.change_type,
+        "group_name": M3UChangeLog.group_name,
+        "count": M3UChangeLog.count,
+        "enabled": M3UChangeLog.enabled,
+    }
+    sort_column = sort_columns.get(sort_by, M3UChangeLog.change_time)
+    if sort_order == "asc":
+        return query.order_by(sort_column.asc())
+    return query.order_by(sort_column.desc())
+
+
+def _change_page(query, page: int, page_size: int) -> dict:
+    """One page of change rows with its pagination metadata."""
+    # Total comes back with the page
+    changes, total = _fetch_page_with_total(query, page, page_size)
+
+    return {
+        "results": [_change_row_to_dict(row) for row in changes],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+    }
 
 
 @router.get("/changes/summary")
 async def get_m3u_changes_summary(
     hours: int = 24,
     m3u_account_id: Optional[int] = None,
+    db: Session = Depends(get_db),
 ):
     """
     Get aggregated summary of M3U changes.
@@ -145,25 +321,27 @@ async def get_m3u_changes_summary(
         m3u_account_id: Filter by M3U account ID
     """
     logger.debug("[M3U-DIGEST] GET /api/m3u/changes/summary - hours=%s m3u_account_id=%s", hours, m3u_account_id)
+    return json_response(_change_summary(db, hours, m3u_account_id))
+
+
+def _change_summary(db: Session, hours: int, m3u_account_id: Optional[int]) -> dict:
+    """Change summary for the last ``hours`` hours."""
     from datetime import datetime as dt, timedelta
     from m3u_change_detector import M3UChangeDetector
 
-    db = get_session()
-    try:
-        detector = M3UChangeDetector(db)
-        since = dt.utcnow() - timedelta(hours=hours)
-        summary = detector.get_change_summary(since, m3u_account_id)
-        return summary
-    finally:
-        db.close()
+    detector = M3UChangeDetector(db)
+    since = dt.utcnow() - timedelta(hours=hours)
+    return detector.get_change_summary(since, m3u_account_id)
 
 
 @router.get("/accounts/{account_id}/changes")
 async def get_m3u_account_changes(
+    request: Request,
     account_id: int,
     page: int = 1,
     page_size: int = 50,
     change_type: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
     """
     Get change history for a specific M3U account.
@@ -173,42 +351,28 @@ async def get_m3u_account_changes(
         page: Page number (1-indexed)
         page_size: Number of items per page
         change_type: Filter by change type
+
+    Supports the same application/x-ndjson variant as GET /api/m3u/changes.
     """
     logger.debug("[M3U-DIGEST] GET /api/m3u/accounts/%s/changes - page=%s change_type=%s", account_id, page, change_type)
     from models import M3UChangeLog
 
-    db = get_session()
-    try:
-        query = db.query(M3UChangeLog).filter(M3UChangeLog.m3u_account_id == account_id)
+    query = db.query(*_change_columns()).filter(M3UChangeLog.m3u_account_id == account_id)
 
-        if change_type:
-            query = query.filter(M3UChangeLog.change_type == change_type)
+    if change_type:
+        query = query.filter(M3UChangeLog.change_type == change_type)
 
-        total = query.count()
-
-        changes = (
-            query.order_by(M3UChangeLog.change_time.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
-
-        return {
-            "results": [c.to_dict() for c in changes],
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size,
-            "m3u_account_id": account_id,
-        }
-    finally:
-        db.close()
+    query = query.order_by(M3UChangeLog.change_time.desc())
+    if _wants_ndjson(request):
+        return await _ndjson_change_stream(query, page, page_size)
+    return json_response({**_change_page(query, page, page_size), "m3u_account_id": account_id})
 
 
 @router.get("/snapshots")
 async def get_m3u_snapshots(
     m3u_account_id: Optional[int] = None,
     limit: int = 10,
+    db: Session = Depends(get_db),
 ):
     """
     Get recent M3U snapshots.
@@ -218,20 +382,34 @@ async def get_m3u_snapshots(
         limit: Maximum number of snapshots to return
     """
     logger.debug("[M3U-DIGEST] GET /api/m3u/snapshots - m3u_account_id=%s limit=%s", m3u_account_id, limit)
+    from m3u_change_detector import SNAPSHOT_LIST_CACHE_PREFIX
+
+    # Snapshots carry the full groups_data JSON; keep the encoded page so
+    # dashboard polls skip both the read and the re-encode. New snapshots
+    # drop every cached page (see M3UChangeDetector.create_snapshot).
+    cache = get_cache()
+    cache_key = f"{SNAPSHOT_LIST_CACHE_PREFIX}{m3u_account_id}:{limit}"
+    body = cache.get(cache_key, ttl=SNAPSHOT_LIST_CACHE_TTL_SECONDS)
+    if body is None:
+        body = orjson.dumps(
+            _list_snapshots(db, m3u_account_id, limit), option=orjson.OPT_NON_STR_KEYS
+        )
+        cache.set(cache_key, body)
+    return Response(body, media_type="application/json")
+
+
+def _list_snapshots(db: Session, m3u_account_id: Optional[int], limit: int) -> list[dict]:
+    """The most recent snapshots, newest first, serialized."""
     from models import M3USnapshot
 
-    db = get_session()
-    try:
-        query = db.query(M3USnapshot)
+    query = db.query(M3USnapshot)
 
-        if m3u_account_id:
-            query = query.filter(M3USnapshot.m3u_account_id == m3u_account_id)
+    if m3u_account_id:
+        query = query.filter(M3USnapshot.m3u_account_id == m3u_account_id)
 
-        snapshots = query.order_by(M3USnapshot.snapshot_time.desc()).limit(limit).all()
+    snapshots = query.order_by(M3USnapshot.snapshot_time.desc()).limit(limit).all()
 
-        return [s.to_dict() for s in snapshots]
-    finally:
-        db.close()
+    return [s.to_dict() for s in snapshots]
 
 
 # -------------------------------------------------------------------------
@@ -239,125 +417,119 @@ async def get_m3u_snapshots(
 # -------------------------------------------------------------------------
 
 @router.get("/digest/settings")
-async def get_m3u_digest_settings():
+async def get_m3u_digest_settings(request: Request, db: Session = Depends(get_db)):
     """Get M3U digest email settings."""
     logger.debug("[M3U-DIGEST] GET /api/m3u/digest/settings")
     from tasks.m3u_digest import get_or_create_digest_settings
 
-    db = get_session()
-    try:
-        settings = get_or_create_digest_settings(db)
-        return settings.to_dict()
-    finally:
-        db.close()
+    cache = get_cache()
+    result = cache.get(DIGEST_SETTINGS_CACHE_KEY, ttl=DIGEST_SETTINGS_CACHE_TTL_SECONDS)
+    if result is None:
+        result = get_or_create_digest_settings(db).to_dict()
+        cache.set(DIGEST_SETTINGS_CACHE_KEY, result)
+    return etag_json_response(request, result)
 
 
 @router.put("/digest/settings")
-async def update_m3u_digest_settings(request: M3UDigestSettingsUpdate):
+async def update_m3u_digest_settings(
+    request: M3UDigestSettingsUpdate,
+    db: Session = Depends(get_db),
+):
     """Update M3U digest email settings."""
     logger.debug("[M3U-DIGEST] PUT /api/m3u/digest/settings")
     from tasks.m3u_digest import get_or_create_digest_settings
 
-    db = get_session()
-    try:
-        settings = get_or_create_digest_settings(db)
+    group_patterns = _unique_patterns(request.exclude_group_patterns)
+    stream_patterns = _unique_patterns(request.exclude_stream_patterns)
+    exclude_patterns = {
+        "group": group_patterns or [],
+        "stream": stream_patterns or [],
+    }
+    if any(exclude_patterns.values()):
+        # Compiling user regexes is CPU work; keep it off the event loop
+        errors = await run_cpu_bound(_exclude_pattern_errors, exclude_patterns)
+        if errors:
+            raise HTTPException(status_code=400, detail="; ".join(errors))
+
+    settings = get_or_create_digest_settings(db)
+
+    # Validate and apply updates
+    if request.enabled is not None:
+        settings.enabled = request.enabled
+
+    if request.frequency is not None:
+        if request.frequency not in _ALLOWED_FREQUENCIES:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid frequency. Must be: immediate, hourly, daily, or weekly"
+            )
+        settings.frequency = request.frequency
 
-        # Validate and apply updates
-        if request.enabled is not None:
-            settings.enabled = request.enabled
-
-        if request.frequency is not None:
-            if request.frequency not in ("immediate", "hourly", "daily", "weekly"):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid frequency. Must be: immediate, hourly, daily, or weekly"
-                )
-            settings.frequency = request.frequency
-
-        if request.email_recipients is not None:
-            # Validate email addresses
-            email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-            for email in request.email_recipients:
-                if not email_pattern.match(email):
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid email address: {email}"
-                    )
-            settings.set_email_recipients(request.email_recipients)
-
-        if request.include_group_changes is not None:
-            settings.include_group_changes = request.include_group_changes
-
-        if request.include_stream_changes is not None:
-            settings.include_stream_changes = request.include_stream_changes
-
-        if request.show_detailed_list is not None:
-            settings.show_detailed_list = request.show_detailed_list
-
-        if request.min_changes_threshold is not None:
-            if request.min_changes_threshold < 1:
-                raise HTTPException(
-                    status_code=400,
-                    detail="min_changes_threshold must be at least 1"
-                )
-            settings.min_changes_threshold = request.min_changes_threshold
-
-        if request.send_to_discord is not None:
-            settings.send_to_discord = request.send_to_discord
-
-        if request.exclude_group_patterns is not None:
-            # Validate via safe_regex.compile so the write-time check enforces
-            # the same length cap (DEFAULT_MAX_PATTERN_LEN=500) and uniform
-            # compile-error surface as the runtime evaluator in tasks/m3u_digest.py
-            # (bd-3u6p0; safe_regex shipped in bd-eio04.5).
-            for pattern in request.exclude_group_patterns:
-                try:
-                    safe_regex.compile(pattern)
-                except safe_regex.SafeRegexError as e:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid group exclude regex '{pattern}': {e}"
-                    )
-            settings.set_exclude_group_patterns(request.exclude_group_patterns)
-
-        if request.exclude_stream_patterns is not None:
-            # See safe_regex.compile note on exclude_group_patterns above
-            # (bd-3u6p0).
-            for pattern in request.exclude_stream_patterns:
-                try:
-                    safe_regex.compile(pattern)
-                except safe_regex.SafeRegexError as e:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid stream exclude regex '{pattern}': {e}"
-                    )
-            settings.set_exclude_stream_patterns(request.exclude_stream_patterns)
-
-        db.commit()
-        db.refresh(settings)
-
-        # Log to journal
-        journal.log_entry(
-            category="m3u",
-            action_type="update",
-            entity_id=settings.id,
-            entity_name="M3U Digest Settings",
-            description="Updated M3U digest email settings",
-            after_value=settings.to_dict(),
-        )
+    if request.email_recipients is not None:
+        # Validate email addresses, reporting every bad one at once
+        invalid = [email for email in request.email_recipients if not _EMAIL_RE.match(email)]
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid email address: {', '.join(invalid)}"
+                if len(invalid) == 1
+                else f"Invalid email addresses: {', '.join(invalid)}"
+            )
+        settings.set_email_recipients(request.email_recipients)
+
+    if request.include_group_changes is not None:
+        settings.include_group_changes = request.include_group_changes
+
+    if request.include_stream_changes is not None:
+        settings.include_stream_changes = request.include_stream_changes
+
+    if request.show_detailed_list is not None:
+        settings.show_detailed_list = request.show_detailed_list
+
+    if request.min_changes_threshold is not None:
+        if request.min_changes_threshold < 1:
+            raise HTTPException(
+                status_code=400,
+                detail="min_changes_threshold must be at least 1"
+            )
+        settings.min_changes_threshold = request.min_changes_threshold
+
+    if request.send_to_discord is not None:
+        settings.send_to_discord = request.send_to_discord
+
+    if group_patterns is not None:
+        settings.set_exclude_group_patterns(group_patterns)
+
+    if stream_patterns is not None:
+        settings.set_exclude_stream_patterns(stream_patterns)
+
+    # Serialize between flush and commit: the flush applies updated_at's
+    # onupdate in-process, and commit would expire the row so any later
+    # attribute access re-SELECTs it
+    db.flush()
+    result = settings.to_dict()
+    db.commit()
+    get_cache().set(DIGEST_SETTINGS_CACHE_KEY, result)
+
+    # Log to journal
+    journal.log_entry(
+        category="m3u",
+        action_type="update",
+        entity_id=result["id"],
+        entity_name="M3U Digest Settings",
+        description="Updated M3U digest email settings",
+        after_value=result,
+    )
 
-        return settings.to_dict()
-    finally:
-        db.close()
+    return result
 
 
 @router.post("/digest/test")
-async def send_test_m3u_digest():
+async def send_test_m3u_digest(db: Session = Depends(get_db)):
     """Send a test M3U digest email."""
     logger.debug("[M3U-DIGEST] POST /api/m3u/digest/test")
     from tasks.m3u_digest import M3UDigestTask, get_or_create_digest_settings
 
-    db = get_session()
     try:
         settings = get_or_create_digest_settings(db)
 
@@ -382,5 +554,3 @@ async def send_test_m3u_digest():
     except Exception as e:
         logger.exception("[M3U-DIGEST] Failed to send test digest")
         raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        db.close()
@@ -5,24 +5,35 @@ Extracted from main.py (Phase 2 of v0.13.0 backend refactor).
 """
 import asyncio
 import hashlib
-import json
 import logging
 import re
 import time
 from typing import List, Literal, Optional
 
+import orjson
 import yaml
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
 from pydantic import BaseModel
+from sqlalchemy import case
+from sqlalchemy.orm import Session, load_only
 
 import journal
 from auth import RequireAdminIfEnabled
 from auth.routes import limiter
+from cache import get_cache
 from concurrency import run_cpu_bound
 from config import get_settings
-from database import get_session
+from database import get_db, get_session
 from dispatcharr_client import get_client
+from json_responses import etag_json_response, json_response
+from models import NormalizationRule, NormalizationRuleGroup, RuleLintFinding, TagGroup
+from normalization_engine import (
+    RULES_RESPONSE_CACHE_PREFIX,
+    get_normalization_engine,
+    invalidate_rules_cache,
+)
+from normalization_migration import create_demo_rules, get_migration_status
 from regex_lint import (
     lint_conditions_json,
     lint_pattern,
@@ -33,6 +44,21 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/normalization", tags=["Normalization"])
 
+# GET /rules and /groups are polled by the UI and only change through the
+# writers that call invalidate_rules_cache(); the TTL bounds
+# staleness from any writer that does not.
+RULES_RESPONSE_CACHE_TTL_SECONDS = 30
+
+# /rule-stats samples up to 2000 streams; pages after the first are fetched
+# in parallel, a few at a time so Dispatcharr is not flooded.
+RULE_STATS_PAGE_SIZE = 200
+RULE_STATS_FETCH_CONCURRENCY = 4
+
+# /test-batch and /normalize hand texts to the CPU pool in chunks this size,
+# so a large batch doesn't hold a pool thread for its whole duration, and
+# stream each chunk's results out before evaluating the next.
+NORMALIZE_BATCH_CHUNK_SIZE = 256
+
 
 # Request models
 class CreateRuleGroupRequest(BaseModel):
@@ -151,94 +177,111 @@ class ApplyToChannelsRequest(BaseModel):
     actions: Optional[List[ApplyChannelAction]] = None
 
 
+def _priority_case(id_column, ordered_ids: list[int]):
+    """CASE expression giving each id its position in ``ordered_ids``.
+
+    Lets a reorder set every priority in one UPDATE instead of one per row.
+    A repeated id takes its last position, as the per-row loop did.
+    """
+    return case({item_id: priority for priority, item_id in enumerate(ordered_ids)}, value=id_column)
+
+
 @router.get("/rules")
-async def get_all_normalization_rules():
+async def get_all_normalization_rules(request: Request, db: Session = Depends(get_db)):
     """Get all normalization rules organized by group."""
     logger.debug("[NORMALIZE] GET /rules")
     try:
-        from normalization_engine import get_normalization_engine
-        session = get_session()
-        try:
-            engine = get_normalization_engine(session)
-            rules = engine.get_all_rules()
-            return {"groups": rules}
-        finally:
-            session.close()
+        cache = get_cache()
+        cache_key = f"{RULES_RESPONSE_CACHE_PREFIX}rules"
+        result = cache.get(cache_key, ttl=RULES_RESPONSE_CACHE_TTL_SECONDS)
+        if result is None:
+            engine = get_normalization_engine(db)
+            result = {"groups": engine.get_all_rules()}
+            cache.set(cache_key, result)
+        return etag_json_response(request, result)
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to get normalization rules")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _group_dicts(session) -> list[dict]:
+    """All rule groups in priority order, serialized."""
+    groups = session.query(NormalizationRuleGroup).order_by(
+        NormalizationRuleGroup.priority
+    ).all()
+    return [g.to_dict() for g in groups]
+
+
 @router.get("/groups")
-async def get_normalization_groups():
+async def get_normalization_groups(request: Request, db: Session = Depends(get_db)):
     """Get all normalization rule groups."""
     logger.debug("[NORMALIZE] GET /groups")
     try:
-        from models import NormalizationRuleGroup
-        session = get_session()
-        try:
-            groups = session.query(NormalizationRuleGroup).order_by(
-                NormalizationRuleGroup.priority
-            ).all()
-            return {"groups": [g.to_dict() for g in groups]}
-        finally:
-            session.close()
+        cache = get_cache()
+        cache_key = f"{RULES_RESPONSE_CACHE_PREFIX}groups"
+        result = cache.get(cache_key, ttl=RULES_RESPONSE_CACHE_TTL_SECONDS)
+        if result is None:
+            result = {"groups": _group_dicts(db)}
+            cache.set(cache_key, result)
+        return etag_json_response(request, result)
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to get normalization groups")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/groups")
-async def create_normalization_group(request: CreateRuleGroupRequest):
+async def create_normalization_group(request: CreateRuleGroupRequest, db: Session = Depends(get_db)):
     """Create a new normalization rule group."""
     logger.debug("[NORMALIZE] POST /groups - name=%s", request.name)
     try:
-        from models import NormalizationRuleGroup
-        session = get_session()
-        try:
-            group = NormalizationRuleGroup(
-                name=request.name,
-                description=request.description,
-                enabled=request.enabled,
-                priority=request.priority,
-                is_builtin=False
-            )
-            session.add(group)
-            session.commit()
-            session.refresh(group)
-            logger.info("[NORMALIZE] Created group id=%s name=%s", group.id, group.name)
-            return group.to_dict()
-        finally:
-            session.close()
+        group = NormalizationRuleGroup(
+            name=request.name,
+            description=request.description,
+            enabled=request.enabled,
+            priority=request.priority,
+            is_builtin=False
+        )
+        db.add(group)
+        # Flush first so ids and column defaults are assigned, and
+        # serialize before commit expires the instance
+        db.flush()
+        result = group.to_dict()
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Created group id=%s name=%s", result["id"], result["name"])
+        return result
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to create normalization group")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _group_with_rules(session, group_id: int) -> Optional[dict]:
+    """One group serialized with its rules, or None if it does not exist."""
+    group = session.query(NormalizationRuleGroup).filter(
+        NormalizationRuleGroup.id == group_id
+    ).first()
+    if not group:
+        return None
+
+    # Include rules in response
+    rules = session.query(NormalizationRule).filter(
+        NormalizationRule.group_id == group_id
+    ).order_by(NormalizationRule.priority).all()
+
+    result = group.to_dict()
+    result["rules"] = [r.to_dict() for r in rules]
+    return result
+
+
 @router.get("/groups/{group_id}")
-async def get_normalization_group(group_id: int):
+async def get_normalization_group(group_id: int, db: Session = Depends(get_db)):
     """Get a normalization rule group by ID."""
     logger.debug("[NORMALIZE] GET /groups/%s", group_id)
     try:
-        from models import NormalizationRuleGroup, NormalizationRule
-        session = get_session()
-        try:
-            group = session.query(NormalizationRuleGroup).filter(
-                NormalizationRuleGroup.id == group_id
-            ).first()
-            if not group:
-                raise HTTPException(status_code=404, detail="Group not found")
-
-            # Include rules in response
-            rules = session.query(NormalizationRule).filter(
-                NormalizationRule.group_id == group_id
-            ).order_by(NormalizationRule.priority).all()
-
-            result = group.to_dict()
-            result["rules"] = [r.to_dict() for r in rules]
-            return result
-        finally:
-            session.close()
+        result = _group_with_rules(db, group_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Group not found")
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -247,34 +290,31 @@ async def get_normalization_group(group_id: int):
 
 
 @router.patch("/groups/{group_id}")
-async def update_normalization_group(group_id: int, request: UpdateRuleGroupRequest):
+async def update_normalization_group(group_id: int, request: UpdateRuleGroupRequest, db: Session = Depends(get_db)):
     """Update a normalization rule group."""
     logger.debug("[NORMALIZE] PATCH /groups/%s", group_id)
     try:
-        from models import NormalizationRuleGroup
-        session = get_session()
-        try:
-            group = session.query(NormalizationRuleGroup).filter(
-                NormalizationRuleGroup.id == group_id
-            ).first()
-            if not group:
-                raise HTTPException(status_code=404, detail="Group not found")
-
-            if request.name is not None:
-                group.name = request.name
-            if request.description is not None:
-                group.description = request.description
-            if request.enabled is not None:
-                group.enabled = request.enabled
-            if request.priority is not None:
-                group.priority = request.priority
-
-            session.commit()
-            session.refresh(group)
-            logger.info("[NORMALIZE] Updated group id=%s name=%s", group.id, group.name)
-            return group.to_dict()
-        finally:
-            session.close()
+        group = db.query(NormalizationRuleGroup).filter(
+            NormalizationRuleGroup.id == group_id
+        ).first()
+        if not group:
+            raise HTTPException(status_code=404, detail="Group not found")
+
+        if request.name is not None:
+            group.name = request.name
+        if request.description is not None:
+            group.description = request.description
+        if request.enabled is not None:
+            group.enabled = request.enabled
+        if request.priority is not None:
+            group.priority = request.priority
+
+        db.flush()
+        result = group.to_dict()
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Updated group id=%s name=%s", result["id"], result["name"])
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -283,31 +323,26 @@ async def update_normalization_group(group_id: int, request: UpdateRuleGroupRequ
 
 
 @router.delete("/groups/{group_id}")
-async def delete_normalization_group(group_id: int):
+async def delete_normalization_group(group_id: int, db: Session = Depends(get_db)):
     """Delete a normalization rule group and all its rules."""
     logger.debug("[NORMALIZE] DELETE /groups/%s", group_id)
     try:
-        from models import NormalizationRuleGroup, NormalizationRule
-        session = get_session()
-        try:
-            group = session.query(NormalizationRuleGroup).filter(
-                NormalizationRuleGroup.id == group_id
-            ).first()
-            if not group:
-                raise HTTPException(status_code=404, detail="Group not found")
-
-            # Delete all rules in this group first
-            session.query(NormalizationRule).filter(
-                NormalizationRule.group_id == group_id
-            ).delete()
-
-            # Delete the group
-            session.delete(group)
-            session.commit()
-            logger.info("[NORMALIZE] Deleted group id=%s", group_id)
-            return {"status": "deleted", "id": group_id}
-        finally:
-            session.close()
+        # Two bulk DELETEs in one transaction; neither the group nor its
+        # rules are loaded. rule.group_id has no FK to cascade from, so
+        # the rules are removed explicitly.
+        db.query(NormalizationRule).filter(
+            NormalizationRule.group_id == group_id
+        ).delete(synchronize_session=False)
+        deleted = db.query(NormalizationRuleGroup).filter(
+            NormalizationRuleGroup.id == group_id
+        ).delete(synchronize_session=False)
+        if not deleted:
+            db.rollback()
+            raise HTTPException(status_code=404, detail="Group not found")
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Deleted group id=%s", group_id)
+        return {"status": "deleted", "id": group_id}
     except HTTPException:
         raise
     except Exception as e:
@@ -316,42 +351,36 @@ async def delete_normalization_group(group_id: int):
 
 
 @router.post("/groups/reorder")
-async def reorder_normalization_groups(request: ReorderGroupsRequest):
+async def reorder_normalization_groups(request: ReorderGroupsRequest, db: Session = Depends(get_db)):
     """Reorder normalization rule groups."""
     logger.debug("[NORMALIZE] POST /groups/reorder - count=%s", len(request.group_ids))
     try:
-        from models import NormalizationRuleGroup
-        session = get_session()
-        try:
-            for priority, group_id in enumerate(request.group_ids):
-                session.query(NormalizationRuleGroup).filter(
-                    NormalizationRuleGroup.id == group_id
-                ).update({"priority": priority})
-            session.commit()
-            return {"status": "reordered", "group_ids": request.group_ids}
-        finally:
-            session.close()
+        if request.group_ids:
+            db.query(NormalizationRuleGroup).filter(
+                NormalizationRuleGroup.id.in_(request.group_ids)
+            ).update(
+                {"priority": _priority_case(NormalizationRuleGroup.id, request.group_ids)},
+                synchronize_session=False,
+            )
+        db.commit()
+        invalidate_rules_cache()
+        return {"status": "reordered", "group_ids": request.group_ids}
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to reorder normalization groups")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/rules/{rule_id}")
-async def get_normalization_rule(rule_id: int):
+async def get_normalization_rule(rule_id: int, db: Session = Depends(get_db)):
     """Get a normalization rule by ID."""
     logger.debug("[NORMALIZE] GET /rules/%s", rule_id)
     try:
-        from models import NormalizationRule
-        session = get_session()
-        try:
-            rule = session.query(NormalizationRule).filter(
-                NormalizationRule.id == rule_id
-            ).first()
-            if not rule:
-                raise HTTPException(status_code=404, detail="Rule not found")
-            return rule.to_dict()
-        finally:
-            session.close()
+        rule = db.query(NormalizationRule).filter(
+            NormalizationRule.id == rule_id
+        ).first()
+        if not rule:
+            raise HTTPException(status_code=404, detail="Rule not found")
+        return rule.to_dict()
     except HTTPException:
         raise
     except Exception as e:
@@ -389,51 +418,45 @@ def _lint_normalization_rule_request(request) -> None:
 
 
 @router.post("/rules")
-async def create_normalization_rule(request: CreateRuleRequest):
+async def create_normalization_rule(request: CreateRuleRequest, db: Session = Depends(get_db)):
     """Create a new normalization rule."""
     logger.debug("[NORMALIZE] POST /rules - name=%s group_id=%s", request.name, request.group_id)
     try:
-        from models import NormalizationRule, NormalizationRuleGroup
         _lint_normalization_rule_request(request)
-        session = get_session()
-        try:
-            # Verify group exists
-            group = session.query(NormalizationRuleGroup).filter(
-                NormalizationRuleGroup.id == request.group_id
-            ).first()
-            if not group:
-                raise HTTPException(status_code=404, detail="Group not found")
-
-            # Serialize conditions to JSON if provided
-            conditions_json = json.dumps(request.conditions) if request.conditions else None
-
-            rule = NormalizationRule(
-                group_id=request.group_id,
-                name=request.name,
-                description=request.description,
-                enabled=request.enabled,
-                priority=request.priority,
-                condition_type=request.condition_type,
-                condition_value=request.condition_value,
-                case_sensitive=request.case_sensitive,
-                tag_group_id=request.tag_group_id,
-                tag_match_position=request.tag_match_position,
-                conditions=conditions_json,
-                condition_logic=request.condition_logic,
-                action_type=request.action_type,
-                action_value=request.action_value,
-                else_action_type=request.else_action_type,
-                else_action_value=request.else_action_value,
-                stop_processing=request.stop_processing,
-                is_builtin=False
-            )
-            session.add(rule)
-            session.commit()
-            session.refresh(rule)
-            logger.info("[NORMALIZE] Created rule id=%s name=%s", rule.id, rule.name)
-            return rule.to_dict()
-        finally:
-            session.close()
+        # Verify group exists
+        group = db.query(NormalizationRuleGroup).filter(
+            NormalizationRuleGroup.id == request.group_id
+        ).first()
+        if not group:
+            raise HTTPException(status_code=404, detail="Group not found")
+
+        rule = NormalizationRule(
+            group_id=request.group_id,
+            name=request.name,
+            description=request.description,
+            enabled=request.enabled,
+            priority=request.priority,
+            condition_type=request.condition_type,
+            condition_value=request.condition_value,
+            case_sensitive=request.case_sensitive,
+            tag_group_id=request.tag_group_id,
+            tag_match_position=request.tag_match_position,
+            condition_logic=request.condition_logic,
+            action_type=request.action_type,
+            action_value=request.action_value,
+            else_action_type=request.else_action_type,
+            else_action_value=request.else_action_value,
+            stop_processing=request.stop_processing,
+            is_builtin=False
+        )
+        rule.set_conditions(request.conditions)
+        db.add(rule)
+        db.flush()
+        result = rule.to_dict()
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Created rule id=%s name=%s", result["id"], result["name"])
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -442,62 +465,59 @@ async def create_normalization_rule(request: CreateRuleRequest):
 
 
 @router.patch("/rules/{rule_id}")
-async def update_normalization_rule(rule_id: int, request: UpdateRuleRequest):
+async def update_normalization_rule(rule_id: int, request: UpdateRuleRequest, db: Session = Depends(get_db)):
     """Update a normalization rule."""
     logger.debug("[NORMALIZE] PATCH /rules/%s", rule_id)
     try:
-        from models import NormalizationRule
         # Lint any pattern-bearing fields on the update request. The helper
         # only lints what's actually supplied — PATCH semantics are
         # preserved (unset fields pass through unchanged).
         _lint_normalization_rule_request(request)
-        session = get_session()
-        try:
-            rule = session.query(NormalizationRule).filter(
-                NormalizationRule.id == rule_id
-            ).first()
-            if not rule:
-                raise HTTPException(status_code=404, detail="Rule not found")
-
-            if request.name is not None:
-                rule.name = request.name
-            if request.description is not None:
-                rule.description = request.description
-            if request.enabled is not None:
-                rule.enabled = request.enabled
-            if request.priority is not None:
-                rule.priority = request.priority
-            if request.condition_type is not None:
-                rule.condition_type = request.condition_type
-            if request.condition_value is not None:
-                rule.condition_value = request.condition_value
-            if request.case_sensitive is not None:
-                rule.case_sensitive = request.case_sensitive
-            if request.tag_group_id is not None:
-                rule.tag_group_id = request.tag_group_id
-            if request.tag_match_position is not None:
-                rule.tag_match_position = request.tag_match_position
-            if request.conditions is not None:
-                rule.conditions = json.dumps(request.conditions) if request.conditions else None
-            if request.condition_logic is not None:
-                rule.condition_logic = request.condition_logic
-            if request.action_type is not None:
-                rule.action_type = request.action_type
-            if request.action_value is not None:
-                rule.action_value = request.action_value
-            if request.else_action_type is not None:
-                rule.else_action_type = request.else_action_type
-            if request.else_action_value is not None:
-                rule.else_action_value = request.else_action_value
-            if request.stop_processing is not None:
-                rule.stop_processing = request.stop_processing
-
-            session.commit()
-            session.refresh(rule)
-            logger.info("[NORMALIZE] Updated rule id=%s name=%s", rule.id, rule.name)
-            return rule.to_dict()
-        finally:
-            session.close()
+        rule = db.query(NormalizationRule).filter(
+            NormalizationRule.id == rule_id
+        ).first()
+        if not rule:
+            raise HTTPException(status_code=404, detail="Rule not found")
+
+        if request.name is not None:
+            rule.name = request.name
+        if request.description is not None:
+            rule.description = request.description
+        if request.enabled is not None:
+            rule.enabled = request.enabled
+        if request.priority is not None:
+            rule.priority = request.priority
+        if request.condition_type is not None:
+            rule.condition_type = request.condition_type
+        if request.condition_value is not None:
+            rule.condition_value = request.condition_value
+        if request.case_sensitive is not None:
+            rule.case_sensitive = request.case_sensitive
+        if request.tag_group_id is not None:
+            rule.tag_group_id = request.tag_group_id
+        if request.tag_match_position is not None:
+            rule.tag_match_position = request.tag_match_position
+        if request.conditions is not None:
+            rule.set_conditions(request.conditions)
+        if request.condition_logic is not None:
+            rule.condition_logic = request.condition_logic
+        if request.action_type is not None:
+            rule.action_type = request.action_type
+        if request.action_value is not None:
+            rule.action_value = request.action_value
+        if request.else_action_type is not None:
+            rule.else_action_type = request.else_action_type
+        if request.else_action_value is not None:
+            rule.else_action_value = request.else_action_value
+        if request.stop_processing is not None:
+            rule.stop_processing = request.stop_processing
+
+        db.flush()
+        result = rule.to_dict()
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Updated rule id=%s name=%s", result["id"], result["name"])
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -506,25 +526,21 @@ async def update_normalization_rule(rule_id: int, request: UpdateRuleRequest):
 
 
 @router.delete("/rules/{rule_id}")
-async def delete_normalization_rule(rule_id: int):
+async def delete_normalization_rule(rule_id: int, db: Session = Depends(get_db)):
     """Delete a normalization rule."""
     logger.debug("[NORMALIZE] DELETE /rules/%s", rule_id)
     try:
-        from models import NormalizationRule
-        session = get_session()
-        try:
-            rule = session.query(NormalizationRule).filter(
-                NormalizationRule.id == rule_id
-            ).first()
-            if not rule:
-                raise HTTPException(status_code=404, detail="Rule not found")
-
-            session.delete(rule)
-            session.commit()
-            logger.info("[NORMALIZE] Deleted rule id=%s", rule_id)
-            return {"status": "deleted", "id": rule_id}
-        finally:
-            session.close()
+        rule = db.query(NormalizationRule).filter(
+            NormalizationRule.id == rule_id
+        ).first()
+        if not rule:
+            raise HTTPException(status_code=404, detail="Rule not found")
+
+        db.delete(rule)
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Deleted rule id=%s", rule_id)
+        return {"status": "deleted", "id": rule_id}
     except HTTPException:
         raise
     except Exception as e:
@@ -533,119 +549,182 @@ async def delete_normalization_rule(rule_id: int):
 
 
 @router.post("/groups/{group_id}/rules/reorder")
-async def reorder_normalization_rules(group_id: int, request: ReorderRulesRequest):
+async def reorder_normalization_rules(group_id: int, request: ReorderRulesRequest, db: Session = Depends(get_db)):
     """Reorder normalization rules within a group."""
     logger.debug("[NORMALIZE] POST /groups/%s/rules/reorder - count=%s", group_id, len(request.rule_ids))
     try:
-        from models import NormalizationRule
-        session = get_session()
-        try:
-            for priority, rule_id in enumerate(request.rule_ids):
-                session.query(NormalizationRule).filter(
-                    NormalizationRule.id == rule_id,
-                    NormalizationRule.group_id == group_id
-                ).update({"priority": priority})
-            session.commit()
-            return {"status": "reordered", "group_id": group_id, "rule_ids": request.rule_ids}
-        finally:
-            session.close()
+        if request.rule_ids:
+            db.query(NormalizationRule).filter(
+                NormalizationRule.id.in_(request.rule_ids),
+                NormalizationRule.group_id == group_id
+            ).update(
+                {"priority": _priority_case(NormalizationRule.id, request.rule_ids)},
+                synchronize_session=False,
+            )
+        db.commit()
+        invalidate_rules_cache()
+        return {"status": "reordered", "group_id": group_id, "rule_ids": request.rule_ids}
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to reorder rules in group %s", group_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/test")
-async def test_normalization_rule(request: TestRuleRequest):
+async def test_normalization_rule(request: TestRuleRequest, db: Session = Depends(get_db)):
     """Test a rule configuration against sample text without saving."""
     logger.debug("[NORMALIZE] POST /test - action_type=%s condition_type=%s", request.action_type, request.condition_type)
     try:
-        from normalization_engine import get_normalization_engine
-        session = get_session()
-        try:
-            engine = get_normalization_engine(session)
-            # Offload CPU-bound regex/rule eval to thread pool (bd-w3z4h)
-            result = await run_cpu_bound(
-                engine.test_rule,
-                text=request.text,
-                condition_type=request.condition_type,
-                condition_value=request.condition_value or "",
-                case_sensitive=request.case_sensitive,
-                action_type=request.action_type,
-                action_value=request.action_value or "",
-                conditions=request.conditions,
-                condition_logic=request.condition_logic,
-                tag_group_id=request.tag_group_id,
-                tag_match_position=request.tag_match_position or "contains",
-                else_action_type=request.else_action_type,
-                else_action_value=request.else_action_value,
-            )
-            return result
-        finally:
-            session.close()
+        engine = get_normalization_engine(db)
+        # Offload CPU-bound regex/rule eval to thread pool (bd-w3z4h)
+        result = await run_cpu_bound(
+            engine.test_rule,
+            text=request.text,
+            condition_type=request.condition_type,
+            condition_value=request.condition_value or "",
+            case_sensitive=request.case_sensitive,
+            action_type=request.action_type,
+            action_value=request.action_value or "",
+            conditions=request.conditions,
+            condition_logic=request.condition_logic,
+            tag_group_id=request.tag_group_id,
+            tag_match_position=request.tag_match_position or "contains",
+            else_action_type=request.else_action_type,
+            else_action_value=request.else_action_value,
+        )
+        return result
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to test normalization rule")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _rules_batch_response(engine, texts: list[str], serialize) -> Response:
+    """Run engine.test_rules_batch chunk by chunk and respond ``{"results": [...]}``.
+
+    Offloads batch evaluation off the event loop (bd-w3z4h). Chunks run in
+    sequence rather than concurrently: the engine lazily loads rules and tag
+    groups through its request-scoped session, which must not be used from
+    two threads at once. Each chunk is encoded as soon as it is evaluated,
+    so only one chunk of result objects is held at a time.
+
+    Every chunk is evaluated before the response starts, so a failure in
+    any of them reaches the caller's 500 handler instead of cutting off a
+    200 body halfway through.
+    """
+    size = NORMALIZE_BATCH_CHUNK_SIZE
+    encoded = []
+    for start in range(0, len(texts), size):
+        results = await run_cpu_bound(engine.test_rules_batch, texts[start:start + size])
+        if results:
+            encoded.append(b",".join(orjson.dumps(serialize(r)) for r in results))
+    return Response(
+        b'{"results":[' + b",".join(encoded) + b"]}", media_type="application/json"
+    )
+
+
+def _test_result_dict(r) -> dict:
+    return {
+        "original": r.original,
+        "normalized": r.normalized,
+        "rules_applied": r.rules_applied,
+        "transformations": [
+            {"rule_id": t[0], "before": t[1], "after": t[2]}
+            for t in r.transformations
+        ]
+    }
+
+
+def _normalized_dict(r) -> dict:
+    return {"original": r.original, "normalized": r.normalized}
+
+
 @router.post("/test-batch")
 @limiter.limit("30/minute")
-async def test_normalization_batch(request: Request, body: TestRulesBatchRequest):
+async def test_normalization_batch(request: Request, body: TestRulesBatchRequest, db: Session = Depends(get_db)):
     """Test all enabled rules against multiple sample texts."""
     logger.debug("[NORMALIZE] POST /test-batch - count=%s", len(body.texts))
     try:
-        from normalization_engine import get_normalization_engine
-        session = get_session()
-        try:
-            engine = get_normalization_engine(session)
-            # Offload batch evaluation off event loop (bd-w3z4h)
-            results = await run_cpu_bound(engine.test_rules_batch, body.texts)
-            return {
-                "results": [
-                    {
-                        "original": r.original,
-                        "normalized": r.normalized,
-                        "rules_applied": r.rules_applied,
-                        "transformations": [
-                            {"rule_id": t[0], "before": t[1], "after": t[2]}
-                            for t in r.transformations
-                        ]
-                    }
-                    for r in results
-                ]
-            }
-        finally:
-            session.close()
+        engine = get_normalization_engine(db)
+        return await _rules_batch_response(engine, body.texts, _test_result_dict)
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to test normalization batch")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/normalize")
-async def normalize_text(request: TestRulesBatchRequest):
+async def normalize_text(request: TestRulesBatchRequest, db: Session = Depends(get_db)):
     """Normalize one or more texts using all enabled rules."""
     logger.debug("[NORMALIZE] POST /normalize - count=%s", len(request.texts))
     try:
-        from normalization_engine import get_normalization_engine
-        session = get_session()
-        try:
-            engine = get_normalization_engine(session)
-            # Offload batch evaluation off event loop (bd-w3z4h)
-            results = await run_cpu_bound(engine.test_rules_batch, request.texts)
-            return {
-                "results": [
-                    {"original": r.original, "normalized": r.normalized}
-                    for r in results
-                ]
-            }
-        finally:
-            session.close()
+        engine = get_normalization_engine(db)
+        return await _rules_batch_response(engine, request.texts, _normalized_dict)
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to normalize texts")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _rules_with_group_names(session):
+    """Every rule in (group_id, priority) order plus a group id -> name map.
+
+    Only the columns rule-stats reads are loaded: the group map is built
+    from (id, name) rows, and rules skip their action/else/audit columns.
+    """
+    group_map = dict(
+        session.query(NormalizationRuleGroup.id, NormalizationRuleGroup.name).all()
+    )
+
+    rules = session.query(NormalizationRule).options(
+        load_only(
+            NormalizationRule.id,
+            NormalizationRule.name,
+            NormalizationRule.group_id,
+            NormalizationRule.enabled,
+            NormalizationRule.condition_type,
+            NormalizationRule.condition_value,
+            NormalizationRule.case_sensitive,
+            NormalizationRule.conditions,
+            NormalizationRule.condition_logic,
+            NormalizationRule.tag_group_id,
+            NormalizationRule.tag_match_position,
+        )
+    ).order_by(
+        NormalizationRule.group_id,
+        NormalizationRule.priority
+    ).all()
+    return group_map, rules
+
+
+async def _fetch_streams(client, limit: int) -> list[dict]:
+    """Fetch up to ``limit`` streams from Dispatcharr.
+
+    The first page reports the total count; the remaining pages needed to
+    reach ``limit`` are then fetched concurrently, RULE_STATS_FETCH_CONCURRENCY
+    at a time, and concatenated in page order.
+    """
+    page_size = min(limit, RULE_STATS_PAGE_SIZE)
+    first = await client.get_streams(page=1, page_size=page_size)
+    streams = list(first.get("results", []))
+    total_count = first.get("count")
+    if not isinstance(total_count, int) or len(streams) >= limit:
+        return streams[:limit]
+
+    wanted = min(limit, total_count)
+    last_page = (wanted + page_size - 1) // page_size
+    sem = asyncio.Semaphore(RULE_STATS_FETCH_CONCURRENCY)
+
+    async def fetch_page(page: int) -> list[dict]:
+        async with sem:
+            result = await client.get_streams(page=page, page_size=page_size)
+            return result.get("results", []) or []
+
+    for page_results in await asyncio.gather(
+        *(fetch_page(page) for page in range(2, last_page + 1))
+    ):
+        streams.extend(page_results)
+    return streams[:limit]
+
+
 @router.get("/rule-stats")
-async def get_normalization_rule_stats(limit: int = 500):
+async def get_normalization_rule_stats(limit: int = 500, db: Session = Depends(get_db)):
     """Get statistics on how many streams each rule matches.
 
     Fetches streams from Dispatcharr and tests each enabled rule individually
@@ -660,19 +739,26 @@ async def get_normalization_rule_stats(limit: int = 500):
     """
     logger.debug("[NORMALIZE] GET /rule-stats - limit=%s", limit)
     try:
-        from models import NormalizationRule, NormalizationRuleGroup
-        from normalization_engine import get_normalization_engine
-
         # Cap the limit to avoid performance issues
         limit = min(limit, 2000)
 
-        # Fetch streams from Dispatcharr
         client = get_client()
+        engine = get_normalization_engine(db)
+
+        # The rule load does not depend on the streams: start the
+        # Dispatcharr fetch first and let it send its request, then read
+        # the rules on the loop while Dispatcharr works on the response.
         start = time.time()
-        streams_result = await client.get_streams(page=1, page_size=limit)
+        streams_fetch = asyncio.ensure_future(_fetch_streams(client, limit))
+        await asyncio.sleep(0)
+        try:
+            group_map, rules = _rules_with_group_names(db)
+        except BaseException:
+            streams_fetch.cancel()
+            raise
+        streams = await streams_fetch
         elapsed_ms = (time.time() - start) * 1000
         logger.debug("[NORMALIZE] get_streams completed in %.1fms", elapsed_ms)
-        streams = streams_result.get("results", [])
         stream_names = [s.get("name", "") for s in streams if s.get("name")]
 
         if not stream_names:
@@ -682,79 +768,47 @@ async def get_normalization_rule_stats(limit: int = 500):
                 "total_rules": 0
             }
 
-        session = get_session()
-        try:
-            engine = get_normalization_engine(session)
-
-            # Get all rules with their groups
-            groups = session.query(NormalizationRuleGroup).order_by(
-                NormalizationRuleGroup.priority
-            ).all()
-            group_map = {g.id: g.name for g in groups}
-
-            rules = session.query(NormalizationRule).order_by(
-                NormalizationRule.group_id,
-                NormalizationRule.priority
-            ).all()
-
-            # Offload the R×S regex loop to the thread pool (bd-w3z4h).
-            # 500 streams × 100 rules = 50k regex evals — blocks the event loop
-            # for several seconds if run inline.
-            def _count_matches():
-                counts = []
-                for rule in rules:
-                    count = 0
-                    for name in stream_names:
-                        m = engine._match_condition(name, rule)
-                        if m.matched:
-                            count += 1
-                    counts.append(count)
-                return counts
-
-            match_counts = await run_cpu_bound(_count_matches)
-            rule_stats = []
-            for rule, match_count in zip(rules, match_counts):
-                rule_stats.append({
-                    "rule_id": rule.id,
-                    "rule_name": rule.name,
-                    "group_id": rule.group_id,
-                    "group_name": group_map.get(rule.group_id, "Unknown"),
-                    "enabled": rule.enabled,
-                    "match_count": match_count,
-                    "match_percentage": round(match_count / len(stream_names) * 100, 1) if stream_names else 0
-                })
+        # Offload the R×S regex loop to the thread pool (bd-w3z4h).
+        # 500 streams × 100 rules = 50k regex evals — blocks the event loop
+        # for several seconds if run inline.
+        match_counts = await run_cpu_bound(engine.count_matches_bulk, stream_names, rules)
+        rule_stats = []
+        for rule in rules:
+            match_count = match_counts[rule.id]
+            rule_stats.append({
+                "rule_id": rule.id,
+                "rule_name": rule.name,
+                "group_id": rule.group_id,
+                "group_name": group_map.get(rule.group_id, "Unknown"),
+                "enabled": rule.enabled,
+                "match_count": match_count,
+                "match_percentage": round(match_count / len(stream_names) * 100, 1) if stream_names else 0
+            })
 
-            return {
-                "rule_stats": rule_stats,
-                "total_streams_tested": len(stream_names),
-                "total_rules": len(rules)
-            }
-        finally:
-            session.close()
+        return json_response({
+            "rule_stats": rule_stats,
+            "total_streams_tested": len(stream_names),
+            "total_rules": len(rules)
+        })
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to get rule stats")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/migration/status")
-async def get_normalization_migration_status():
+async def get_normalization_migration_status(db: Session = Depends(get_db)):
     """Get the status of the normalization rules migration."""
     logger.debug("[NORMALIZE] GET /migration/status")
     try:
-        from normalization_migration import get_migration_status
-        session = get_session()
-        try:
-            status = get_migration_status(session)
-            return status
-        finally:
-            session.close()
+        status = get_migration_status(db)
+        return status
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to get migration status")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/migration/run")
-async def run_normalization_migration(force: bool = False, migrate_settings: bool = True):
+async def run_normalization_migration(force: bool = False, migrate_settings: bool = True, db: Session = Depends(get_db)):
     """Create demo normalization rules.
 
     Creates editable demo rules that are disabled by default. Users can enable
@@ -766,8 +820,6 @@ async def run_normalization_migration(force: bool = False, migrate_settings: boo
     """
     logger.debug("[NORMALIZE] POST /migration/run - force=%s migrate_settings=%s", force, migrate_settings)
     try:
-        from normalization_migration import create_demo_rules
-
         # Get user settings to migrate
         custom_normalization_tags = []
 
@@ -775,97 +827,93 @@ async def run_normalization_migration(force: bool = False, migrate_settings: boo
             settings = get_settings()
             custom_normalization_tags = settings.custom_normalization_tags or []
 
-        session = get_session()
-        try:
-            result = create_demo_rules(
-                session,
-                force=force,
-                custom_normalization_tags=custom_normalization_tags
-            )
-            return result
-        finally:
-            session.close()
+        result = create_demo_rules(
+            db,
+            force=force,
+            custom_normalization_tags=custom_normalization_tags
+        )
+        invalidate_rules_cache()
+        return result
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to create demo rules")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _export_yaml(session) -> str:
+    """Serialize every group and its rules to the export YAML document."""
+    groups = session.query(NormalizationRuleGroup).order_by(
+        NormalizationRuleGroup.priority
+    ).all()
+
+    export_data = {
+        "normalization_rules": {
+            "version": 1,
+            "groups": []
+        }
+    }
+
+    for group in groups:
+        rules = session.query(NormalizationRule).filter(
+            NormalizationRule.group_id == group.id
+        ).order_by(NormalizationRule.priority).all()
+
+        group_data = {
+            "name": group.name,
+            "description": group.description,
+            "enabled": group.enabled,
+            "is_builtin": group.is_builtin,
+            "rules": []
+        }
+
+        for rule in rules:
+            rule_data = {
+                "name": rule.name,
+                "description": rule.description,
+                "enabled": rule.enabled,
+                "condition_type": rule.condition_type,
+                "condition_value": rule.condition_value,
+                "case_sensitive": rule.case_sensitive,
+                "action_type": rule.action_type,
+                "action_value": rule.action_value,
+                "stop_processing": rule.stop_processing,
+                "is_builtin": rule.is_builtin,
+            }
+
+            # Include compound conditions if present
+            if rule.conditions:
+                rule_data["conditions"] = rule.get_conditions()
+                rule_data["condition_logic"] = rule.condition_logic or "AND"
+
+            # Include tag group reference by name for portability
+            if rule.tag_group_id:
+                tag_group = session.query(TagGroup).filter(TagGroup.id == rule.tag_group_id).first()
+                if tag_group:
+                    rule_data["tag_group_name"] = tag_group.name
+                rule_data["tag_match_position"] = rule.tag_match_position
+
+            # Include else action if present
+            if rule.else_action_type:
+                rule_data["else_action_type"] = rule.else_action_type
+                rule_data["else_action_value"] = rule.else_action_value
+
+            group_data["rules"].append(rule_data)
+
+        export_data["normalization_rules"]["groups"].append(group_data)
+
+    return yaml.dump(export_data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
 @router.get("/export")
-async def export_normalization_rules():
+async def export_normalization_rules(db: Session = Depends(get_db)):
     """Export all normalization rules and groups as YAML."""
     logger.debug("[NORMALIZE] GET /export")
     try:
-        from models import NormalizationRuleGroup, NormalizationRule
-        session = get_session()
-        try:
-            groups = session.query(NormalizationRuleGroup).order_by(
-                NormalizationRuleGroup.priority
-            ).all()
-
-            export_data = {
-                "normalization_rules": {
-                    "version": 1,
-                    "groups": []
-                }
-            }
-
-            for group in groups:
-                rules = session.query(NormalizationRule).filter(
-                    NormalizationRule.group_id == group.id
-                ).order_by(NormalizationRule.priority).all()
-
-                group_data = {
-                    "name": group.name,
-                    "description": group.description,
-                    "enabled": group.enabled,
-                    "is_builtin": group.is_builtin,
-                    "rules": []
-                }
-
-                for rule in rules:
-                    rule_data = {
-                        "name": rule.name,
-                        "description": rule.description,
-                        "enabled": rule.enabled,
-                        "condition_type": rule.condition_type,
-                        "condition_value": rule.condition_value,
-                        "case_sensitive": rule.case_sensitive,
-                        "action_type": rule.action_type,
-                        "action_value": rule.action_value,
-                        "stop_processing": rule.stop_processing,
-                        "is_builtin": rule.is_builtin,
-                    }
-
-                    # Include compound conditions if present
-                    if rule.conditions:
-                        rule_data["conditions"] = json.loads(rule.conditions) if isinstance(rule.conditions, str) else rule.conditions
-                        rule_data["condition_logic"] = rule.condition_logic or "AND"
-
-                    # Include tag group reference by name for portability
-                    if rule.tag_group_id:
-                        from models import TagGroup
-                        tag_group = session.query(TagGroup).filter(TagGroup.id == rule.tag_group_id).first()
-                        if tag_group:
-                            rule_data["tag_group_name"] = tag_group.name
-                        rule_data["tag_match_position"] = rule.tag_match_position
-
-                    # Include else action if present
-                    if rule.else_action_type:
-                        rule_data["else_action_type"] = rule.else_action_type
-                        rule_data["else_action_value"] = rule.else_action_value
-
-                    group_data["rules"].append(rule_data)
-
-                export_data["normalization_rules"]["groups"].append(group_data)
-
-            yaml_content = yaml.dump(export_data, default_flow_style=False, sort_keys=False, allow_unicode=True)
-            return Response(
-                content=yaml_content,
-                media_type="application/x-yaml",
-                headers={"Content-Disposition": "attachment; filename=normalization-rules.yaml"}
-            )
-        finally:
-            session.close()
+        yaml_content = _export_yaml(db)
+        return Response(
+            content=yaml_content,
+            media_type="application/x-yaml",
+            headers={"Content-Disposition": "attachment; filename=normalization-rules.yaml"}
+        )
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to export normalization rules")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -877,7 +925,7 @@ class ImportRulesRequest(BaseModel):
 
 
 @router.post("/import")
-async def import_normalization_rules(request: ImportRulesRequest):
+async def import_normalization_rules(request: ImportRulesRequest, db: Session = Depends(get_db)):
     """Import normalization rules and groups from YAML."""
     logger.debug("[NORMALIZE] POST /import - overwrite=%s", request.overwrite)
     try:
@@ -893,100 +941,92 @@ async def import_normalization_rules(request: ImportRulesRequest):
         raise HTTPException(status_code=400, detail="Missing 'groups' key in normalization_rules")
 
     try:
-        from models import NormalizationRuleGroup, NormalizationRule, TagGroup
-        session = get_session()
-        try:
-            # If overwrite, delete existing non-builtin groups
-            if request.overwrite:
-                existing_groups = session.query(NormalizationRuleGroup).filter(
-                    NormalizationRuleGroup.is_builtin == False
-                ).all()
-                for g in existing_groups:
-                    session.query(NormalizationRule).filter(
-                        NormalizationRule.group_id == g.id
-                    ).delete()
-                    session.delete(g)
-                session.flush()
-
-            # Build tag group name -> id map for resolving references
-            tag_groups = session.query(TagGroup).all()
-            tag_group_map = {tg.name: tg.id for tg in tag_groups}
-
-            created_groups = 0
-            created_rules = 0
-            skipped_groups = 0
-
-            max_priority = session.query(NormalizationRuleGroup).count()
-
-            for group_data in rules_data["groups"]:
-                group_name = group_data.get("name")
-                if not group_name:
-                    continue
+        # If overwrite, delete existing non-builtin groups
+        if request.overwrite:
+            existing_groups = db.query(NormalizationRuleGroup).filter(
+                NormalizationRuleGroup.is_builtin == False
+            ).all()
+            for g in existing_groups:
+                db.query(NormalizationRule).filter(
+                    NormalizationRule.group_id == g.id
+                ).delete()
+                db.delete(g)
+            db.flush()
+
+        # Build tag group name -> id map for resolving references
+        tag_groups = db.query(TagGroup).all()
+        tag_group_map = {tg.name: tg.id for tg in tag_groups}
+
+        created_groups = 0
+        created_rules = 0
+        skipped_groups = 0
+
+        max_priority = db.query(NormalizationRuleGroup).count()
+
+        for group_data in rules_data["groups"]:
+            group_name = group_data.get("name")
+            if not group_name:
+                continue
 
-                # Skip if group with same name already exists (unless overwrite)
-                existing = session.query(NormalizationRuleGroup).filter(
-                    NormalizationRuleGroup.name == group_name
-                ).first()
-                if existing:
-                    skipped_groups += 1
-                    continue
+            # Skip if group with same name already exists (unless overwrite)
+            existing = db.query(NormalizationRuleGroup).filter(
+                NormalizationRuleGroup.name == group_name
+            ).first()
+            if existing:
+                skipped_groups += 1
+                continue
 
-                group = NormalizationRuleGroup(
-                    name=group_name,
-                    description=group_data.get("description"),
-                    enabled=group_data.get("enabled", True),
-                    priority=max_priority,
-                    is_builtin=False,  # Always create as non-builtin on import
+            group = NormalizationRuleGroup(
+                name=group_name,
+                description=group_data.get("description"),
+                enabled=group_data.get("enabled", True),
+                priority=max_priority,
+                is_builtin=False,  # Always create as non-builtin on import
+            )
+            db.add(group)
+            db.flush()  # Get the group ID
+            max_priority += 1
+            created_groups += 1
+
+            for rule_priority, rule_data in enumerate(group_data.get("rules", [])):
+                # Resolve tag group reference by name
+                tag_group_id = None
+                if "tag_group_name" in rule_data:
+                    tag_group_id = tag_group_map.get(rule_data["tag_group_name"])
+
+                rule = NormalizationRule(
+                    group_id=group.id,
+                    name=rule_data.get("name", "Imported Rule"),
+                    description=rule_data.get("description"),
+                    enabled=rule_data.get("enabled", True),
+                    priority=rule_priority,
+                    condition_type=rule_data.get("condition_type"),
+                    condition_value=rule_data.get("condition_value"),
+                    case_sensitive=rule_data.get("case_sensitive", False),
+                    tag_group_id=tag_group_id,
+                    tag_match_position=rule_data.get("tag_match_position"),
+                    condition_logic=rule_data.get("condition_logic", "AND"),
+                    action_type=rule_data.get("action_type", "remove"),
+                    action_value=rule_data.get("action_value"),
+                    else_action_type=rule_data.get("else_action_type"),
+                    else_action_value=rule_data.get("else_action_value"),
+                    stop_processing=rule_data.get("stop_processing", False),
+                    is_builtin=False,
                 )
-                session.add(group)
-                session.flush()  # Get the group ID
-                max_priority += 1
-                created_groups += 1
-
-                for rule_priority, rule_data in enumerate(group_data.get("rules", [])):
-                    # Resolve tag group reference by name
-                    tag_group_id = None
-                    if "tag_group_name" in rule_data:
-                        tag_group_id = tag_group_map.get(rule_data["tag_group_name"])
-
-                    conditions_json = None
-                    if "conditions" in rule_data and rule_data["conditions"]:
-                        conditions_json = json.dumps(rule_data["conditions"])
-
-                    rule = NormalizationRule(
-                        group_id=group.id,
-                        name=rule_data.get("name", "Imported Rule"),
-                        description=rule_data.get("description"),
-                        enabled=rule_data.get("enabled", True),
-                        priority=rule_priority,
-                        condition_type=rule_data.get("condition_type"),
-                        condition_value=rule_data.get("condition_value"),
-                        case_sensitive=rule_data.get("case_sensitive", False),
-                        tag_group_id=tag_group_id,
-                        tag_match_position=rule_data.get("tag_match_position"),
-                        conditions=conditions_json,
-                        condition_logic=rule_data.get("condition_logic", "AND"),
-                        action_type=rule_data.get("action_type", "remove"),
-                        action_value=rule_data.get("action_value"),
-                        else_action_type=rule_data.get("else_action_type"),
-                        else_action_value=rule_data.get("else_action_value"),
-                        stop_processing=rule_data.get("stop_processing", False),
-                        is_builtin=False,
-                    )
-                    session.add(rule)
-                    created_rules += 1
-
-            session.commit()
-            logger.info("[NORMALIZE] Imported %s groups, %s rules, skipped %s groups",
-                        created_groups, created_rules, skipped_groups)
-            return {
-                "status": "imported",
-                "created_groups": created_groups,
-                "created_rules": created_rules,
-                "skipped_groups": skipped_groups,
-            }
-        finally:
-            session.close()
+                rule.set_conditions(rule_data.get("conditions"))
+                db.add(rule)
+                created_rules += 1
+
+        db.commit()
+        invalidate_rules_cache()
+        logger.info("[NORMALIZE] Imported %s groups, %s rules, skipped %s groups",
+                    created_groups, created_rules, skipped_groups)
+        return {
+            "status": "imported",
+            "created_groups": created_groups,
+            "created_rules": created_rules,
+            "skipped_groups": skipped_groups,
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -1143,7 +1183,6 @@ def _compute_rule_set_hash(engine) -> str:
     identifiers.
     """
     try:
-        from models import NormalizationRule, NormalizationRuleGroup
         session = getattr(engine, "db", None) or get_session()
         rules = (
             session.query(NormalizationRule)
@@ -1209,15 +1248,16 @@ async def apply_normalization_to_channels(
 
     try:
         try:
-            from normalization_engine import get_normalization_engine
             client = get_client()
-            session = get_session()
+            # The session only backs the rule load for the diff; it is closed
+            # before the execute phase's Dispatcharr calls and journal writes
+            db = get_session()
             try:
-                engine = get_normalization_engine(session)
+                engine = get_normalization_engine(db)
                 diffs = await _build_apply_diff(client, engine)
                 rule_set_hash = _compute_rule_set_hash(engine) if not dry_run else None
             finally:
-                session.close()
+                db.close()
         except HTTPException:
             raise
         except Exception as e:
@@ -1424,7 +1464,7 @@ async def apply_normalization_to_channels(
 
 
 @router.get("/lint-findings")
-async def get_normalization_lint_findings():
+async def get_normalization_lint_findings(db: Session = Depends(get_db)):
     """Return the cached lint findings for normalization rules.
 
     Findings are produced by the one-time startup scan (bd-eio04.7 migration
@@ -1435,17 +1475,12 @@ async def get_normalization_lint_findings():
     """
     logger.debug("[NORMALIZE] GET /lint-findings")
     try:
-        from models import RuleLintFinding
         from tasks.rule_lint_scan import RULE_TYPE_NORMALIZATION
 
-        session = get_session()
-        try:
-            findings = session.query(RuleLintFinding).filter(
-                RuleLintFinding.rule_type == RULE_TYPE_NORMALIZATION
-            ).order_by(RuleLintFinding.rule_id, RuleLintFinding.id).all()
-            return {"findings": [f.to_dict() for f in findings]}
-        finally:
-            session.close()
+        findings = db.query(RuleLintFinding).filter(
+            RuleLintFinding.rule_type == RULE_TYPE_NORMALIZATION
+        ).order_by(RuleLintFinding.rule_id, RuleLintFinding.id).all()
+        return {"findings": [f.to_dict() for f in findings]}
     except Exception as e:
         logger.exception("[NORMALIZE] Failed to get lint findings: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -8,9 +8,18 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func, tuple_
 
+from cache import get_cache
 from database import get_session
-from services.notification_service import create_notification_internal
+from pagination import decode_keyset_cursor, next_keyset_cursor
+from services.notification_service import (
+    NOTIFICATIONS_CACHE_PREFIX,
+    NOTIFICATIONS_CACHE_TTL_SECONDS,
+    create_notification_internal,
+    create_notifications_batch_internal,
+    invalidate_notifications_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +38,18 @@ class CreateNotificationRequest(BaseModel):
     send_alerts: bool = True
 
 
-@router.get("")
-async def get_notifications(
-    page: int = 1,
-    page_size: int = 50,
-    unread_only: bool = False,
-    notification_type: Optional[str] = None,
-):
-    """Get notifications with pagination and filtering."""
-    logger.debug("[NOTIFY] GET /notifications - page=%s unread_only=%s type=%s", page, unread_only, notification_type)
+class BatchCreateNotificationsRequest(BaseModel):
+    items: list[CreateNotificationRequest]
+
+
+def _notifications_page(
+    page: int,
+    page_size: int,
+    unread_only: bool,
+    notification_type: Optional[str],
+    after: Optional[tuple],
+) -> dict:
+    """One page of notifications plus the filtered total."""
     from models import Notification
 
     session = get_session()
@@ -52,30 +64,95 @@ async def get_notifications(
         if notification_type:
             query = query.filter(Notification.type == notification_type)
 
-        # Order by most recent first
-        query = query.order_by(Notification.created_at.desc())
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        notifications = query.offset(offset).limit(page_size).all()
-
-        # Get unread count
-        unread_count = session.query(Notification).filter(Notification.read == False).count()
+        # Order by most recent first; id breaks created_at ties so the
+        # order is stable across pages
+        ordering = (Notification.created_at.desc(), Notification.id.desc())
+
+        if after:
+            # Keyset page: seek past the cursor instead of OFFSET. The window
+            # count would only cover the rows after the cursor, so the total
+            # comes from the un-cursored filters.
+            notifications = query.filter(
+                tuple_(Notification.created_at, Notification.id) < after
+            ).order_by(*ordering).limit(page_size).all()
+            total = query.count()
+        else:
+            # Apply pagination; the total rides along on every row as a window
+            # count instead of a separate COUNT(*) query
+            offset = (page - 1) * page_size
+            rows = query.add_columns(func.count().over().label("total")).order_by(
+                *ordering
+            ).offset(offset).limit(page_size).all()
+            notifications = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Past the last page (or nothing matched) — no row to read it from
+                total = query.count() if offset else 0
 
         return {
             "notifications": [n.to_dict() for n in notifications],
             "total": total,
-            "unread_count": unread_count,
-            "page": page,
-            "page_size": page_size,
+            "next_cursor": next_keyset_cursor(notifications, page_size, "created_at"),
         }
     finally:
         session.close()
 
 
+def _unread_count() -> int:
+    """Count unread notifications."""
+    from models import Notification
+
+    session = get_session()
+    try:
+        return session.query(Notification).filter(Notification.read == False).count()
+    finally:
+        session.close()
+
+
+@router.get("")
+async def get_notifications(
+    page: int = 1,
+    page_size: int = 50,
+    unread_only: bool = False,
+    notification_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+):
+    """Get notifications with pagination and filtering.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page by
+    keyset instead of ``page`` — deep pages then cost the same as the first.
+    """
+    logger.debug("[NOTIFY] GET /notifications - page=%s unread_only=%s type=%s cursor=%s", page, unread_only, notification_type, cursor)
+    after = decode_keyset_cursor(cursor) if cursor else None
+
+    cache = get_cache()
+    cache_key = f"{NOTIFICATIONS_CACHE_PREFIX}list:{page}:{page_size}:{unread_only}:{notification_type}:{cursor}"
+    cached = cache.get(cache_key, ttl=NOTIFICATIONS_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
+    page_result = _notifications_page(page, page_size, unread_only, notification_type, after)
+
+    # Get unread count, shared by every cached page
+    unread_key = f"{NOTIFICATIONS_CACHE_PREFIX}unread_count"
+    unread_count = cache.get(unread_key, ttl=NOTIFICATIONS_CACHE_TTL_SECONDS)
+    if unread_count is None:
+        unread_count = _unread_count()
+        cache.set(unread_key, unread_count)
+
+    result = {
+        "notifications": page_result["notifications"],
+        "total": page_result["total"],
+        "unread_count": unread_count,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": page_result["next_cursor"],
+    }
+    cache.set(cache_key, result)
+    return result
+
+
 @router.post("")
 async def create_notification(request: CreateNotificationRequest):
     """Create a new notification (API endpoint).
@@ -109,10 +186,35 @@ async def create_notification(request: CreateNotificationRequest):
     return result
 
 
-@router.patch("/mark-all-read")
-async def mark_all_notifications_read():
-    """Mark all notifications as read."""
-    logger.debug("[NOTIFY] PATCH /notifications/mark-all-read")
+@router.post("/batch")
+async def create_notifications_batch(request: BatchCreateNotificationsRequest):
+    """Create several notifications in one insert (e.g. alert fan-out).
+
+    Every item is validated as for POST /api/notifications before anything
+    is written; the whole batch is rejected if any item is invalid.
+    """
+    logger.debug("[NOTIFY] POST /notifications/batch - items=%s", len(request.items))
+    for index, item in enumerate(request.items):
+        if not item.message:
+            raise HTTPException(status_code=400, detail=f"Item {index}: message is required")
+        if item.notification_type not in ("info", "success", "warning", "error"):
+            raise HTTPException(status_code=400, detail=f"Item {index}: invalid notification type")
+
+    if not request.items:
+        return {"created": 0, "notifications": []}
+
+    results = await create_notifications_batch_internal(
+        [item.model_dump() for item in request.items]
+    )
+    if not results:
+        raise HTTPException(status_code=500, detail="Failed to create notifications")
+
+    logger.info("[NOTIFY] Created notification batch count=%s", len(results))
+    return {"created": len(results), "notifications": results}
+
+
+def _mark_all_read() -> int:
+    """Mark every unread notification read; returns the row count."""
     from datetime import datetime
     from models import Notification
 
@@ -123,16 +225,23 @@ async def mark_all_notifications_read():
             synchronize_session=False
         )
         session.commit()
-        logger.info("[NOTIFY] Marked all notifications read count=%s", count)
-        return {"marked_read": count}
+        return count
     finally:
         session.close()
 
 
-@router.patch("/{notification_id}")
-async def update_notification(notification_id: int, read: Optional[bool] = None):
-    """Update a notification (mark as read/unread)."""
-    logger.debug("[NOTIFY] PATCH /notifications/%s - read=%s", notification_id, read)
+@router.patch("/mark-all-read")
+async def mark_all_notifications_read():
+    """Mark all notifications as read."""
+    logger.debug("[NOTIFY] PATCH /notifications/mark-all-read")
+    count = _mark_all_read()
+    invalidate_notifications_cache()
+    logger.info("[NOTIFY] Marked all notifications read count=%s", count)
+    return {"marked_read": count}
+
+
+def _update_notification(notification_id: int, read: Optional[bool]) -> Optional[dict]:
+    """Apply a read-state change; None if the notification does not exist."""
     from datetime import datetime
     from models import Notification
 
@@ -140,7 +249,7 @@ async def update_notification(notification_id: int, read: Optional[bool] = None)
     try:
         notification = session.query(Notification).filter(Notification.id == notification_id).first()
         if not notification:
-            raise HTTPException(status_code=404, detail="Notification not found")
+            return None
 
         if read is not None:
             notification.read = read
@@ -148,36 +257,53 @@ async def update_notification(notification_id: int, read: Optional[bool] = None)
 
         session.commit()
         session.refresh(notification)
-        logger.info("[NOTIFY] Updated notification id=%s read=%s", notification_id, read)
         return notification.to_dict()
     finally:
         session.close()
 
 
-@router.delete("/{notification_id}")
-async def delete_notification(notification_id: int):
-    """Delete a specific notification."""
-    logger.debug("[NOTIFY] DELETE /notifications/%s", notification_id)
+@router.patch("/{notification_id}")
+async def update_notification(notification_id: int, read: Optional[bool] = None):
+    """Update a notification (mark as read/unread)."""
+    logger.debug("[NOTIFY] PATCH /notifications/%s - read=%s", notification_id, read)
+    result = _update_notification(notification_id, read)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
+
+    invalidate_notifications_cache()
+    logger.info("[NOTIFY] Updated notification id=%s read=%s", notification_id, read)
+    return result
+
+
+def _delete_notification(notification_id: int) -> bool:
+    """Delete one notification; False if it does not exist."""
     from models import Notification
 
     session = get_session()
     try:
-        notification = session.query(Notification).filter(Notification.id == notification_id).first()
-        if not notification:
-            raise HTTPException(status_code=404, detail="Notification not found")
-
-        session.delete(notification)
+        count = session.query(Notification).filter(
+            Notification.id == notification_id
+        ).delete(synchronize_session=False)
         session.commit()
-        logger.info("[NOTIFY] Deleted notification id=%s", notification_id)
-        return {"deleted": True}
+        return count > 0
     finally:
         session.close()
 
 
-@router.delete("")
-async def clear_all_notifications(read_only: bool = True):
-    """Clear notifications. By default only clears read notifications."""
-    logger.debug("[NOTIFY] DELETE /notifications - read_only=%s", read_only)
+@router.delete("/{notification_id}")
+async def delete_notification(notification_id: int):
+    """Delete a specific notification."""
+    logger.debug("[NOTIFY] DELETE /notifications/%s", notification_id)
+    if not _delete_notification(notification_id):
+        raise HTTPException(status_code=404, detail="Notification not found")
+
+    invalidate_notifications_cache()
+    logger.info("[NOTIFY] Deleted notification id=%s", notification_id)
+    return {"deleted": True}
+
+
+def _clear_notifications(read_only: bool) -> int:
+    """Delete all (or all read) notifications; returns the row count."""
     from models import Notification
 
     session = get_session()
@@ -188,16 +314,23 @@ async def clear_all_notifications(read_only: bool = True):
 
         count = query.delete(synchronize_session=False)
         session.commit()
-        logger.info("[NOTIFY] Cleared notifications count=%s read_only=%s", count, read_only)
-        return {"deleted": count, "read_only": read_only}
+        return count
     finally:
         session.close()
 
 
-@router.delete("/by-source")
-async def delete_notifications_by_source(source: str, source_id: Optional[str] = None):
-    """Delete notifications matching source and optionally source_id."""
-    logger.debug("[NOTIFY] DELETE /notifications/by-source - source=%s source_id=%s", source, source_id)
+@router.delete("")
+async def clear_all_notifications(read_only: bool = True):
+    """Clear notifications. By default only clears read notifications."""
+    logger.debug("[NOTIFY] DELETE /notifications - read_only=%s", read_only)
+    count = _clear_notifications(read_only)
+    invalidate_notifications_cache()
+    logger.info("[NOTIFY] Cleared notifications count=%s read_only=%s", count, read_only)
+    return {"deleted": count, "read_only": read_only}
+
+
+def _delete_by_source(source: str, source_id: Optional[str]) -> int:
+    """Delete notifications by source (and source_id); returns the row count."""
     from models import Notification
 
     session = get_session()
@@ -208,7 +341,16 @@ async def delete_notifications_by_source(source: str, source_id: Optional[str] =
 
         count = query.delete(synchronize_session=False)
         session.commit()
-        logger.info("[NOTIFY] Deleted notifications by source=%s source_id=%s count=%s", source, source_id, count)
-        return {"deleted": count, "source": source, "source_id": source_id}
+        return count
     finally:
         session.close()
+
+
+@router.delete("/by-source")
+async def delete_notifications_by_source(source: str, source_id: Optional[str] = None):
+    """Delete notifications matching source and optionally source_id."""
+    logger.debug("[NOTIFY] DELETE /notifications/by-source - source=%s source_id=%s", source, source_id)
+    count = _delete_by_source(source, source_id)
+    invalidate_notifications_cache()
+    logger.info("[NOTIFY] Deleted notifications by source=%s source_id=%s count=%s", source, source_id, count)
+    return {"deleted": count, "source": source, "source_id": source_id}
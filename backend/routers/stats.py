@@ -5,11 +5,11 @@ Extracted from main.py (Phase 3 of v0.13.0 backend refactor).
 """
 import logging
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 
 from auth.dependencies import get_current_user
@@ -22,6 +22,7 @@ from bandwidth_tracker import (
 from database import get_session
 from dispatcharr_client import get_client
 from models import SessionTelemetry, UniqueClientConnection, User
+from pagination import decode_keyset_cursor, next_keyset_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -421,6 +422,101 @@ async def get_unique_viewers_by_channel(days: int = 7, limit: int = 20):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _watch_history_page(
+    page: int,
+    page_size: int,
+    channel_id: Optional[str],
+    ip_address: Optional[str],
+    days: Optional[int],
+    after: Optional[tuple[datetime, int]],
+) -> dict:
+    """One page of watch history plus its summary."""
+    session = get_session()
+    try:
+        # Build query
+        query = session.query(UniqueClientConnection)
+
+        # Apply filters
+        if channel_id:
+            query = query.filter(UniqueClientConnection.channel_id == channel_id)
+        if ip_address:
+            query = query.filter(UniqueClientConnection.ip_address == ip_address)
+        if days:
+            cutoff_date = date.today() - timedelta(days=days)
+            query = query.filter(UniqueClientConnection.date >= cutoff_date)
+
+        # Most recent first; id breaks connected_at ties so the order is
+        # stable across pages
+        ordering = (UniqueClientConnection.connected_at.desc(), UniqueClientConnection.id.desc())
+
+        if after:
+            # Keyset page: seek past the cursor instead of OFFSET. The
+            # window count would only cover the rows after the cursor, so
+            # the total comes from the un-cursored filters.
+            records = query.filter(
+                tuple_(UniqueClientConnection.connected_at, UniqueClientConnection.id) < after
+            ).order_by(*ordering).limit(page_size).all()
+            total = query.count()
+        else:
+            # Apply pagination; the total rides along on every row as a
+            # window count instead of a separate COUNT(*) query
+            offset = (page - 1) * page_size
+            rows = query.add_columns(func.count().over().label("total")).order_by(
+                *ordering
+            ).offset(offset).limit(page_size).all()
+            records = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Past the last page (or nothing matched) — no row to read it from
+                total = query.count() if offset else 0
+
+        # Get summary stats
+        summary_query = session.query(
+            func.count(func.distinct(UniqueClientConnection.channel_id)).label("unique_channels"),
+            func.count(func.distinct(UniqueClientConnection.ip_address)).label("unique_ips"),
+            func.sum(UniqueClientConnection.watch_seconds).label("total_watch_seconds"),
+        )
+        if channel_id:
+            summary_query = summary_query.filter(UniqueClientConnection.channel_id == channel_id)
+        if ip_address:
+            summary_query = summary_query.filter(UniqueClientConnection.ip_address == ip_address)
+        if days:
+            summary_query = summary_query.filter(UniqueClientConnection.date >= cutoff_date)
+
+        summary = summary_query.first()
+
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size if total > 0 else 1,
+            "next_cursor": next_keyset_cursor(records, page_size, "connected_at"),
+            "summary": {
+                "unique_channels": summary.unique_channels or 0,
+                "unique_ips": summary.unique_ips or 0,
+                "total_watch_seconds": summary.total_watch_seconds or 0,
+            },
+            "history": [
+                {
+                    "id": r.id,
+                    "channel_id": r.channel_id,
+                    "channel_name": r.channel_name,
+                    "ip_address": r.ip_address,
+                    "user_id": r.user_id,
+                    "username": r.username,
+                    "date": r.date.isoformat() if r.date else None,
+                    "connected_at": r.connected_at.isoformat() + "Z" if r.connected_at else None,
+                    "disconnected_at": r.disconnected_at.isoformat() + "Z" if r.disconnected_at else None,
+                    "watch_seconds": r.watch_seconds,
+                }
+                for r in records
+            ],
+        }
+    finally:
+        session.close()
+
+
 @router.get("/watch-history")
 async def get_watch_history(
     page: int = 1,
@@ -428,6 +524,7 @@ async def get_watch_history(
     channel_id: Optional[str] = None,
     ip_address: Optional[str] = None,
     days: Optional[int] = None,
+    cursor: Optional[str] = None,
 ):
     """
     Get watch history log - all channel viewing sessions.
@@ -438,82 +535,15 @@ async def get_watch_history(
         channel_id: Filter by specific channel
         ip_address: Filter by specific IP address
         days: Filter to last N days (None = all time)
+        cursor: ``next_cursor`` from the previous response; pages by keyset
+            instead of ``page`` when given
     """
-    logger.debug("[STATS] GET /api/stats/watch-history - page=%s page_size=%s channel_id=%s", page, page_size, channel_id)
+    logger.debug("[STATS] GET /api/stats/watch-history - page=%s page_size=%s channel_id=%s cursor=%s", page, page_size, channel_id, cursor)
+    after = decode_keyset_cursor(cursor) if cursor else None
+    # Limit page_size
+    page_size = min(page_size, 100)
     try:
-        from models import UniqueClientConnection
-        from sqlalchemy import func, desc
-        from datetime import date, timedelta
-
-        session = get_session()
-        try:
-            # Build query
-            query = session.query(UniqueClientConnection)
-
-            # Apply filters
-            if channel_id:
-                query = query.filter(UniqueClientConnection.channel_id == channel_id)
-            if ip_address:
-                query = query.filter(UniqueClientConnection.ip_address == ip_address)
-            if days:
-                cutoff_date = date.today() - timedelta(days=days)
-                query = query.filter(UniqueClientConnection.date >= cutoff_date)
-
-            # Get total count
-            total = query.count()
-
-            # Limit page_size
-            page_size = min(page_size, 100)
-
-            # Apply pagination and ordering (most recent first)
-            offset = (page - 1) * page_size
-            records = query.order_by(
-                desc(UniqueClientConnection.connected_at)
-            ).offset(offset).limit(page_size).all()
-
-            # Get summary stats
-            summary_query = session.query(
-                func.count(func.distinct(UniqueClientConnection.channel_id)).label("unique_channels"),
-                func.count(func.distinct(UniqueClientConnection.ip_address)).label("unique_ips"),
-                func.sum(UniqueClientConnection.watch_seconds).label("total_watch_seconds"),
-            )
-            if channel_id:
-                summary_query = summary_query.filter(UniqueClientConnection.channel_id == channel_id)
-            if ip_address:
-                summary_query = summary_query.filter(UniqueClientConnection.ip_address == ip_address)
-            if days:
-                summary_query = summary_query.filter(UniqueClientConnection.date >= cutoff_date)
-
-            summary = summary_query.first()
-
-            return {
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size if total > 0 else 1,
-                "summary": {
-                    "unique_channels": summary.unique_channels or 0,
-                    "unique_ips": summary.unique_ips or 0,
-                    "total_watch_seconds": summary.total_watch_seconds or 0,
-                },
-                "history": [
-                    {
-                        "id": r.id,
-                        "channel_id": r.channel_id,
-                        "channel_name": r.channel_name,
-                        "ip_address": r.ip_address,
-                        "user_id": r.user_id,
-                        "username": r.username,
-                        "date": r.date.isoformat() if r.date else None,
-                        "connected_at": r.connected_at.isoformat() + "Z" if r.connected_at else None,
-                        "disconnected_at": r.disconnected_at.isoformat() + "Z" if r.disconnected_at else None,
-                        "watch_seconds": r.watch_seconds,
-                    }
-                    for r in records
-                ],
-            }
-        finally:
-            session.close()
+        return _watch_history_page(page, page_size, channel_id, ip_address, days, after)
     except Exception as e:
         logger.exception("[STATS] Failed to get watch history")
         raise HTTPException(status_code=500, detail="Internal server error")
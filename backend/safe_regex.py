@@ -50,6 +50,7 @@ See also
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import sys
@@ -82,6 +83,11 @@ DEFAULT_MAX_PATTERN_LEN: int = 500
 # never logged — see module docstring).
 _EXCERPT_CHARS: int = 50
 
+# Compiled patterns kept by :func:`compile`. Rule sets are re-validated on
+# every settings save and recompiled on every task run, and ``regex``'s own
+# cache lookup still costs several microseconds per pattern.
+_COMPILE_CACHE_SIZE: int = 512
+
 
 # =========================================================================
 # Exception hierarchy.
@@ -174,6 +180,15 @@ def _log_timeout(pattern: str, text_len: int, timeout_ms: int) -> None:
     )
 
 
+@functools.lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def _compile_cached(pattern: str, flags: int) -> "_regex.Pattern":
+    """Compile and memoize; compiled patterns are immutable so sharing is safe.
+
+    Compile errors propagate and are not cached.
+    """
+    return _regex.compile(pattern, flags=flags)
+
+
 def _timeout_seconds(timeout_ms: int) -> float:
     """Convert an integer-millisecond budget into the float seconds the
     regex library expects via its ``timeout=`` kwarg."""
@@ -331,7 +346,7 @@ def compile(  # noqa: A001 — intentional parity with re/regex.compile
             % (len(pattern), max_pattern_len, _pattern_sha256(pattern))
         )
     try:
-        return _regex.compile(pattern, flags=flags)
+        return _compile_cached(pattern, flags)
     except _regex.error as exc:
         logger.warning(
             "[SAFE_REGEX] compile error "
@@ -10,11 +10,26 @@ import json
 import logging
 from typing import Optional
 
+from sqlalchemy import insert
+
+from cache import get_cache
 from config import get_settings
 from database import get_session
 
 logger = logging.getLogger(__name__)
 
+# GET /api/notifications is polled by the UI; its pages and the shared
+# unread count are cached under this prefix. Anything that writes
+# notifications must call invalidate_notifications_cache() after
+# committing; the TTL bounds staleness from any writer that does not.
+NOTIFICATIONS_CACHE_PREFIX = "notifications:"
+NOTIFICATIONS_CACHE_TTL_SECONDS = 30
+
+
+def invalidate_notifications_cache() -> None:
+    """Drop cached notification pages and unread count so the next GET reloads."""
+    get_cache().invalidate_prefix(NOTIFICATIONS_CACHE_PREFIX)
+
 
 async def create_notification_internal(
     notification_type: str = "info",
@@ -75,6 +90,7 @@ async def create_notification_internal(
         )
         session.add(notification)
         session.commit()
+        invalidate_notifications_cache()
         session.refresh(notification)
         result = notification.to_dict()
 
@@ -102,6 +118,90 @@ async def create_notification_internal(
         session.close()
 
 
+async def create_notifications_batch_internal(items: list[dict]) -> list[dict]:
+    """Create several notifications with one multi-row INSERT (internal helper).
+
+    Each item takes the same keys as create_notification_internal()
+    (``notification_type``, ``title``, ``message``, ``source``, ``source_id``,
+    ``action_label``, ``action_url``, ``metadata``, ``send_alerts``). Items
+    with an empty message are skipped and invalid types default to "info",
+    as in the single-row helper. Alerts for items with ``send_alerts`` are
+    dispatched concurrently in the background.
+
+    Returns:
+        Notification dicts in item order (empty if the insert failed)
+    """
+    from models import Notification
+
+    rows = []
+    alerts = []
+    for item in items:
+        message = item.get("message")
+        if not message:
+            logger.warning("[NOTIFY-SVC] create_notifications_batch_internal skipping item with empty message")
+            continue
+        notification_type = item.get("notification_type", "info")
+        if notification_type not in ("info", "success", "warning", "error"):
+            logger.warning("[NOTIFY-SVC] Invalid notification type: %s, defaulting to info", notification_type)
+            notification_type = "info"
+        metadata = item.get("metadata")
+        rows.append({
+            "type": notification_type,
+            "title": item.get("title"),
+            "message": message,
+            "source": item.get("source"),
+            "source_id": item.get("source_id"),
+            "action_label": item.get("action_label"),
+            "action_url": item.get("action_url"),
+            "extra_data": json.dumps(metadata) if metadata else None,
+        })
+        if item.get("send_alerts", True):
+            alerts.append({
+                "title": item.get("title"),
+                "message": message,
+                "notification_type": notification_type,
+                "source": item.get("source"),
+                "metadata": metadata,
+            })
+
+    if not rows:
+        return []
+
+    session = get_session()
+    try:
+        # ORM bulk INSERT: one statement for every row, RETURNING the new
+        # rows, without per-object unit-of-work bookkeeping. Asking for
+        # sort_by_parameter_order would make SQLAlchemy fall back to one
+        # INSERT per row here (no insert sentinel); ids are assigned in
+        # VALUES order, so sorting on them restores item order instead.
+        created = session.scalars(insert(Notification).returning(Notification), rows).all()
+        session.commit()
+        results = [notification.to_dict() for notification in sorted(created, key=lambda n: n.id)]
+    except Exception as e:
+        logger.exception("[NOTIFY-SVC] Failed to create notification batch: %s", e)
+        session.rollback()
+        return []
+    finally:
+        session.close()
+
+    invalidate_notifications_cache()
+
+    # Dispatch to alert channels asynchronously (non-blocking)
+    if alerts:
+        asyncio.create_task(_dispatch_batch_to_alert_channels(alerts))
+
+    logger.debug("[NOTIFY-SVC] Created %s notification(s) in one batch", len(results))
+    return results
+
+
+async def _dispatch_batch_to_alert_channels(alerts: list[dict]) -> None:
+    """Send a batch's alerts concurrently; one failure does not stop the rest."""
+    await asyncio.gather(
+        *(_dispatch_to_alert_channels(**alert) for alert in alerts),
+        return_exceptions=True,
+    )
+
+
 async def update_notification_internal(
     notification_id: int,
     notification_type: str = None,
@@ -143,6 +243,7 @@ async def update_notification_internal(
             notification.extra_data = json.dumps(metadata)
 
         session.commit()
+        invalidate_notifications_cache()
         session.refresh(notification)
         result = notification.to_dict()
 
@@ -176,6 +277,7 @@ async def delete_notifications_by_source_internal(source: str) -> int:
         ).delete()
         session.commit()
         if deleted > 0:
+            invalidate_notifications_cache()
             logger.debug("[NOTIFY-SVC] Deleted %s notification(s) with source '%s'", deleted, source)
         return deleted
     except Exception as e:
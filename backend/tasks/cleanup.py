@@ -24,6 +24,7 @@ from models import (
     StreamStats,
     TaskExecution,
 )
+from services.notification_service import invalidate_notifications_cache
 from task_scheduler import TaskScheduler, TaskResult, ScheduleConfig, ScheduleType
 from task_registry import register_task
 
@@ -371,6 +372,8 @@ class CleanupTask(TaskScheduler):
                     ).delete(synchronize_session=False)
                     deleted_counts["notifications"] = result
                     session.commit()
+                    if result:
+                        invalidate_notifications_cache()
                     logger.info(
                         "[%s] Deleted %s old notifications (expired or older than %s days)",
                         self.task_id,
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict
 from sqlalchemy.orm import Session
 
 import safe_regex
+from cache import get_cache
 from database import get_session
 from models import M3UChangeLog, M3UDigestSettings
 from task_scheduler import TaskScheduler, TaskResult, ScheduleConfig, ScheduleType
@@ -38,6 +39,10 @@ class _FilteredChange:
         return getattr(self._original, name)
 
 
+# Cache key for the serialized settings row served by GET /api/m3u/digest/settings
+DIGEST_SETTINGS_CACHE_KEY = "m3u_digest_settings"
+
+
 def get_or_create_digest_settings(db: Session) -> M3UDigestSettings:
     """Get or create the M3U digest settings singleton."""
     settings = db.query(M3UDigestSettings).first()
@@ -338,6 +343,7 @@ This is a test email from Enhanced Channel Manager.
                 if changes:
                     settings.last_digest_at = datetime.utcnow()
                     db.commit()
+                    get_cache().invalidate(DIGEST_SETTINGS_CACHE_KEY)
 
                 # Build result message
                 if changes:
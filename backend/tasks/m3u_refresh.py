@@ -50,7 +50,7 @@ async def capture_m3u_changes(
 
     try:
         # Get the M3U account - channel_groups contains ALL groups from this M3U source
-        account_data = await api_client.get_m3u_account(account_id)
+        account_data = await api_client.get_m3u_account(account_id, use_cache=False)
         account_channel_groups = account_data.get("channel_groups", [])
 
         # Get all channel groups to build ID -> name mapping
@@ -256,7 +256,7 @@ class M3URefreshTask(TaskScheduler):
 
                 try:
                     # Get initial state to detect when refresh completes
-                    initial_account = await client.get_m3u_account(account_id)
+                    initial_account = await client.get_m3u_account(account_id, use_cache=False)
                     initial_updated = initial_account.get("updated_at") or initial_account.get("last_refresh")
 
                     logger.info("[%s] Triggering M3U refresh for: %s", self.task_id, account_name)
@@ -276,7 +276,7 @@ class M3URefreshTask(TaskScheduler):
                         await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
                         # Check if account has been updated
-                        current_account = await client.get_m3u_account(account_id)
+                        current_account = await client.get_m3u_account(account_id, use_cache=False)
                         current_updated = current_account.get("updated_at") or current_account.get("last_refresh")
 
                         if current_updated and current_updated != initial_updated:
@@ -59,6 +59,19 @@ def test_session(test_engine):
     session.close()
 
 
+@pytest.fixture(autouse=True)
+def _isolate_response_caches():
+    """Keep the shared normalization ruleset and cached API responses from
+    leaking between tests, which each start with an empty database."""
+    from cache import get_cache
+    from normalization_engine import invalidate_rules_cache
+    invalidate_rules_cache()
+    get_cache().clear()
+    yield
+    invalidate_rules_cache()
+    get_cache().clear()
+
+
 @pytest.fixture(scope="function")
 def override_get_session(test_session):
     """
@@ -2526,3 +2526,240 @@ class TestMigration0013Idempotent:
                 )
         finally:
             engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Migration 0014 — m3u_change_logs (change_type, change_time DESC) index
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+class TestMigration0014:
+    """Migration 0014 — composite type/time index on m3u_change_logs.
+
+    Coverage:
+      - Fresh upgrade through 0014 creates the index, and the "filter by
+        type, newest first" page query is served from it without a sort.
+      - Downgrade to 0013 drops it.
+      - Drifted DB (index already created by ``create_all()``) upgrades
+        without raising "index already exists".
+    """
+
+    INDEX = "idx_m3u_change_type_time"
+
+    def test_fresh_upgrade_and_downgrade(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0014_fresh.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0014")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.INDEX in _index_names(engine, "m3u_change_logs")
+            with engine.connect() as conn:
+                plan = " | ".join(
+                    row[-1] for row in conn.execute(text(
+                        "EXPLAIN QUERY PLAN SELECT * FROM m3u_change_logs "
+                        "WHERE change_type = 'group_added' "
+                        "ORDER BY change_time DESC LIMIT 50"
+                    ))
+                )
+            assert self.INDEX in plan
+            assert "TEMP B-TREE" not in plan
+        finally:
+            engine.dispose()
+
+        command.downgrade(cfg, "0013")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.INDEX not in _index_names(engine, "m3u_change_logs")
+        finally:
+            engine.dispose()
+
+    def test_drifted_sqlite_upgrade_is_idempotent(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0014_drifted.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0013")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE INDEX idx_m3u_change_type_time "
+                    "ON m3u_change_logs (change_type, change_time DESC)"
+                ))
+        finally:
+            engine.dispose()
+
+        command.upgrade(cfg, "head")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.INDEX in _index_names(engine, "m3u_change_logs")
+        finally:
+            engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Migration 0015 — normalization enabled/priority composite indexes
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+class TestMigration0015:
+    """Migration 0015 — enabled/priority indexes for the engine's rule load.
+
+    Coverage:
+      - Fresh upgrade through 0015 creates both indexes, and the enabled
+        group and rule loads are served from them without a sort.
+      - Downgrade to 0014 drops them.
+      - Drifted DB (index already created by ``create_all()``) upgrades
+        without raising "index already exists".
+    """
+
+    GROUP_INDEX = "idx_norm_group_enabled_priority"
+    RULE_INDEX = "idx_norm_rule_enabled_group_priority"
+
+    def test_fresh_upgrade_and_downgrade(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0015_fresh.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0015")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.GROUP_INDEX in _index_names(engine, "normalization_rule_groups")
+            assert self.RULE_INDEX in _index_names(engine, "normalization_rules")
+            with engine.connect() as conn:
+                for index, query in (
+                    (self.GROUP_INDEX, "SELECT * FROM normalization_rule_groups "
+                                       "WHERE enabled = 1 ORDER BY priority"),
+                    (self.RULE_INDEX, "SELECT * FROM normalization_rules "
+                                      "WHERE enabled = 1 ORDER BY group_id, priority"),
+                ):
+                    plan = " | ".join(
+                        row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+                    )
+                    assert index in plan
+                    assert "TEMP B-TREE" not in plan
+        finally:
+            engine.dispose()
+
+        command.downgrade(cfg, "0014")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.GROUP_INDEX not in _index_names(engine, "normalization_rule_groups")
+            assert self.RULE_INDEX not in _index_names(engine, "normalization_rules")
+        finally:
+            engine.dispose()
+
+    def test_drifted_sqlite_upgrade_is_idempotent(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0015_drifted.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0014")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE INDEX idx_norm_rule_enabled_group_priority "
+                    "ON normalization_rules (enabled, group_id, priority)"
+                ))
+        finally:
+            engine.dispose()
+
+        command.upgrade(cfg, "head")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.GROUP_INDEX in _index_names(engine, "normalization_rule_groups")
+            assert self.RULE_INDEX in _index_names(engine, "normalization_rules")
+        finally:
+            engine.dispose()
+
+
+class TestMigration0016:
+    """Migration 0016 — (ts DESC, id DESC) keyset pagination indexes.
+
+    Coverage:
+      - Fresh upgrade through 0016 creates both indexes, and a cursor page
+        of watch history / notifications is a range seek on them without a
+        sort.
+      - Downgrade to 0015 drops them.
+      - Drifted DB (index already created by ``create_all()``) upgrades
+        without raising "index already exists".
+    """
+
+    CONNECTION_INDEX = "idx_unique_client_connected_id"
+    NOTIFICATION_INDEX = "idx_notification_created_id"
+
+    def test_fresh_upgrade_and_downgrade(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0016_fresh.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0016")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.CONNECTION_INDEX in _index_names(engine, "unique_client_connections")
+            assert self.NOTIFICATION_INDEX in _index_names(engine, "notifications")
+            with engine.connect() as conn:
+                for index, query in (
+                    (self.CONNECTION_INDEX, "SELECT * FROM unique_client_connections "
+                                            "WHERE (connected_at, id) < ('2026-01-01', 10) "
+                                            "ORDER BY connected_at DESC, id DESC LIMIT 50"),
+                    (self.NOTIFICATION_INDEX, "SELECT * FROM notifications "
+                                              "WHERE (created_at, id) < ('2026-01-01', 10) "
+                                              "ORDER BY created_at DESC, id DESC LIMIT 50"),
+                ):
+                    plan = " | ".join(
+                        row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+                    )
+                    assert index in plan
+                    assert "TEMP B-TREE" not in plan
+        finally:
+            engine.dispose()
+
+        command.downgrade(cfg, "0015")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.CONNECTION_INDEX not in _index_names(engine, "unique_client_connections")
+            assert self.NOTIFICATION_INDEX not in _index_names(engine, "notifications")
+        finally:
+            engine.dispose()
+
+    def test_drifted_sqlite_upgrade_is_idempotent(self, tmp_path):
+        from alembic import command
+
+        db_url = f"sqlite:///{tmp_path / 'mig0016_drifted.db'}"
+        cfg = _make_alembic_config(db_url)
+        command.upgrade(cfg, "0015")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE INDEX idx_notification_created_id "
+                    "ON notifications (created_at DESC, id DESC)"
+                ))
+        finally:
+            engine.dispose()
+
+        command.upgrade(cfg, "head")
+
+        engine = create_engine(db_url, future=True)
+        try:
+            assert self.CONNECTION_INDEX in _index_names(engine, "unique_client_connections")
+            assert self.NOTIFICATION_INDEX in _index_names(engine, "notifications")
+        finally:
+            engine.dispose()
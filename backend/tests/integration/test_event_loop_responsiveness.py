@@ -54,7 +54,7 @@ class TestHealthRespondsDuringCpuBoundWork:
         slow_engine = _SlowEngine(sleep_seconds=0.8)
 
         with patch(
-            "normalization_engine.get_normalization_engine",
+            "routers.normalization.get_normalization_engine",
             return_value=slow_engine,
         ):
             # Kick off slow request and yield so it enters the sync offload
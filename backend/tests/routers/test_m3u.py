@@ -5,8 +5,10 @@ Tests: 26 M3U endpoints covering account CRUD, refresh, filters,
        profiles, group settings, and server groups.
 Mocks: get_client() to isolate from Dispatcharr.
 """
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch
+import respx
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestGetM3UAccount:
@@ -25,6 +27,203 @@ class TestGetM3UAccount:
         mock_client.get_m3u_account.assert_called_once_with(1)
 
 
+class TestGetStreamMetadata:
+    """Tests for GET /api/m3u/accounts/{account_id}/stream-metadata."""
+
+    PLAYLIST = (
+        "#EXTM3U\n"
+        '#EXTINF:-1 tvg-id="news.us" tvc-guide-stationid="12345" tvg-name="News" '
+        'group-title="US",News HD\n'
+        "http://example.com/1.ts\n"
+        '#EXTINF:-1 tvg-name="No ID",No ID\n'
+        "http://example.com/2.ts\n"
+        '#EXTINF:-1 tvg-id="sports.us" tvg-logo="http://logo/s.png",Sports\n'
+        "http://example.com/3.ts\n"
+    )
+
+    def _mock_playlist(self, router, response):
+        """Mock a provider that rejects HEAD and serves ``response`` on GET."""
+        router.head("http://provider.test/list.m3u").mock(return_value=httpx.Response(405))
+        return router.get("http://provider.test/list.m3u").mock(return_value=response)
+
+    @pytest.mark.asyncio
+    async def test_parses_extinf_metadata(self, async_client):
+        """Parses tvg-id keyed metadata from the streamed playlist."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             respx.mock(assert_all_called=True) as router:
+            self._mock_playlist(router, httpx.Response(200, text=self.PLAYLIST))
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["count"] == 2
+        assert body["metadata"]["news.us"] == {
+            "tvc-guide-stationid": "12345",
+            "tvg-name": "News",
+            "group-title": "US",
+        }
+        assert body["metadata"]["sports.us"] == {"tvg-logo": "http://logo/s.png"}
+
+    @pytest.mark.asyncio
+    async def test_parses_across_line_batches(self, async_client):
+        """Entries are collected across multiple worker-thread batches."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.M3U_PARSE_BATCH_LINES", 2), \
+             respx.mock as router:
+            self._mock_playlist(router, httpx.Response(200, text=self.PLAYLIST))
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert set(response.json()["metadata"]) == {"news.us", "sports.us"}
+
+    @pytest.mark.asyncio
+    async def test_ignores_keys_with_matching_suffix(self, async_client):
+        """Only whole attribute keys match; x-tvg-id is not tvg-id."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+        playlist = '#EXTINF:-1 x-tvg-id="bogus" tvg-id="real" tvg-name="Real",Real\n'
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             respx.mock as router:
+            self._mock_playlist(router, httpx.Response(200, text=playlist))
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.json()["metadata"] == {"real": {"tvg-name": "Real"}}
+
+    @pytest.mark.asyncio
+    async def test_parses_crlf_and_indented_lines(self, async_client):
+        """CRLF line endings, indented EXTINF lines and a missing final newline parse the same."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+        playlist = (
+            b'#EXTM3U\r\n'
+            b'  #EXTINF:-1 tvg-id="a" tvg-name="A",A\r\n'
+            b'http://example.com/a.ts\r\n'
+            b'#EXTINF:-1 tvg-id="b" tvg-name="Caf\xc3\xa9",B'
+        )
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             respx.mock as router:
+            self._mock_playlist(router, httpx.Response(200, content=playlist))
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.json()["metadata"] == {
+            "a": {"tvg-name": "A"},
+            "b": {"tvg-name": "Café"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_reuses_parse_when_etag_unchanged(self, async_client):
+        """A matching ETag on HEAD serves the cached parse without re-downloading."""
+        from cache import get_cache
+
+        get_cache().invalidate_prefix("m3u_metadata:")
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             respx.mock as router:
+            router.head("http://provider.test/list.m3u").mock(
+                return_value=httpx.Response(200, headers={"ETag": '"v1"'})
+            )
+            get_route = router.get("http://provider.test/list.m3u").mock(
+                return_value=httpx.Response(200, text=self.PLAYLIST, headers={"ETag": '"v1"'})
+            )
+            first = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+            second = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert first.json() == second.json()
+        assert second.json()["count"] == 2
+        assert get_route.call_count == 1
+        get_cache().invalidate_prefix("m3u_metadata:")
+
+    @pytest.mark.asyncio
+    async def test_account_update_invalidates_cached_parse(self, async_client):
+        """Updating the account drops its cached metadata."""
+        from cache import get_cache
+
+        get_cache().set("m3u_metadata:1:\"v1\"", {"metadata": {}, "count": 0})
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {"id": 1, "name": "Old"}
+        mock_client.patch_m3u_account.return_value = {"id": 1, "name": "Old"}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal"):
+            await async_client.patch("/api/m3u/accounts/1", json={"is_active": False})
+
+        assert get_cache().get("m3u_metadata:1:\"v1\"") is None
+
+    @pytest.mark.asyncio
+    async def test_reads_uploaded_playlist_from_disk(self, async_client, tmp_path):
+        """Accounts backed by an uploaded file are parsed from disk without HTTP."""
+        from cache import get_cache
+
+        get_cache().invalidate_prefix("m3u_metadata:")
+        uploads = tmp_path / "m3u_uploads"
+        uploads.mkdir()
+        playlist = uploads / "abcd1234_list.m3u"
+        playlist.write_text(self.PLAYLIST)
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": None, "file_path": str(playlist),
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.CONFIG_DIR", tmp_path), \
+             respx.mock:
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.status_code == 200
+        assert set(response.json()["metadata"]) == {"news.us", "sports.us"}
+        get_cache().invalidate_prefix("m3u_metadata:")
+
+    @pytest.mark.asyncio
+    async def test_ignores_local_paths_outside_uploads(self, async_client, tmp_path):
+        """Files outside the uploads directory are never read from disk."""
+        outside = tmp_path / "secret.m3u"
+        outside.write_text(self.PLAYLIST)
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": None, "file_path": str(outside),
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.CONFIG_DIR", tmp_path / "config"):
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_returns_502(self, async_client):
+        """Upstream HTTP failure surfaces as 502."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "account_type": "M3U", "server_url": "http://provider.test/list.m3u",
+        }
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             respx.mock as router:
+            self._mock_playlist(router, httpx.Response(404))
+            response = await async_client.get("/api/m3u/accounts/1/stream-metadata")
+
+        assert response.status_code == 502
+
+
 class TestCreateM3UAccount:
     """Tests for POST /api/m3u/accounts."""
 
@@ -45,6 +244,55 @@ class TestCreateM3UAccount:
         assert response.json()["name"] == "New M3U"
 
 
+class TestUploadM3UFile:
+    """Tests for POST /api/m3u/upload."""
+
+    @pytest.mark.asyncio
+    async def test_saves_file_in_chunks(self, async_client, tmp_path):
+        """Writes the upload to m3u_uploads and reports its size."""
+        content = b"#EXTM3U\n" * 100
+        with patch("routers.m3u.CONFIG_DIR", tmp_path), \
+             patch("routers.m3u.M3U_UPLOAD_CHUNK_BYTES", 64), \
+             patch("routers.m3u.journal"):
+            response = await async_client.post(
+                "/api/m3u/upload", files={"file": ("list.m3u", content)},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["size"] == len(content)
+        from pathlib import Path
+        saved = Path(data["file_path"])
+        assert saved.read_bytes() == content
+        prefix, _, name = saved.name.partition("_")
+        assert len(prefix) == 8 and name == "list.m3u"
+
+    @pytest.mark.asyncio
+    async def test_sanitizes_filename(self, async_client, tmp_path):
+        """Characters outside word, dash and dot are replaced in the saved name."""
+        with patch("routers.m3u.CONFIG_DIR", tmp_path), \
+             patch("routers.m3u.journal"):
+            response = await async_client.post(
+                "/api/m3u/upload", files={"file": ("my list (1).m3u", b"#EXTM3U\n")},
+            )
+
+        assert response.json()["file_path"].endswith("_my_list__1_.m3u")
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_file(self, async_client, tmp_path):
+        """Returns 413 and leaves nothing on disk when the file exceeds the cap."""
+        with patch("routers.m3u.CONFIG_DIR", tmp_path), \
+             patch("routers.m3u.M3U_UPLOAD_MAX_BYTES", 10), \
+             patch("routers.m3u.journal") as mock_journal:
+            response = await async_client.post(
+                "/api/m3u/upload", files={"file": ("list.m3u", b"#EXTM3U\n" * 10)},
+            )
+
+        assert response.status_code == 413
+        assert list(tmp_path.rglob("*.m3u")) == []
+        mock_journal.log_entry_background.assert_not_called()
+
+
 class TestUpdateM3UAccount:
     """Tests for PUT /api/m3u/accounts/{account_id}."""
 
@@ -82,6 +330,37 @@ class TestPatchM3UAccount:
 
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_skips_prior_state_fetch_when_nothing_journaled(self, async_client):
+        """A PATCH that touches no journaled field does not read the prior account."""
+        mock_client = AsyncMock()
+        mock_client.patch_m3u_account.return_value = {"id": 1, "name": "Original"}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal") as mock_journal:
+            response = await async_client.patch("/api/m3u/accounts/1", json={
+                "refresh_interval": 12,
+            })
+
+        assert response.status_code == 200
+        mock_client.get_m3u_account.assert_not_called()
+        mock_journal.log_entry_background.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_journals_prior_active_state(self, async_client):
+        """Toggling is_active journals the prior state."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {"id": 1, "name": "IPTV", "is_active": True}
+        mock_client.patch_m3u_account.return_value = {"id": 1, "name": "IPTV", "is_active": False}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal") as mock_journal:
+            await async_client.patch("/api/m3u/accounts/1", json={"is_active": False})
+
+        kwargs = mock_journal.log_entry_background.call_args.kwargs
+        assert kwargs["before_value"] == {"is_active": True}
+        assert kwargs["description"] == "M3U account disabled"
+
 
 class TestDeleteM3UAccount:
     """Tests for DELETE /api/m3u/accounts/{account_id}."""
@@ -93,6 +372,7 @@ class TestDeleteM3UAccount:
         mock_client.get_m3u_account.return_value = {"id": 1, "name": "IPTV"}
         mock_client.get_m3u_accounts.return_value = [{"id": 1, "name": "IPTV", "channel_groups": []}]
         mock_client.delete_m3u_account.return_value = None
+        mock_client.invalidate_channel_group_names = MagicMock()
 
         with patch("routers.m3u.get_client", return_value=mock_client), \
              patch("routers.m3u.journal"):
@@ -116,6 +396,7 @@ class TestDeleteM3UAccount:
             {"id": 2, "name": "IPTV-2", "channel_groups": [{"channel_group": 10}]},
         ]
         mock_client.delete_m3u_account.return_value = None
+        mock_client.invalidate_channel_group_names = MagicMock()
         mock_client.delete_channel_group.return_value = None
 
         with patch("routers.m3u.get_client", return_value=mock_client), \
@@ -131,6 +412,36 @@ class TestDeleteM3UAccount:
         # Only group 20 should have been deleted
         mock_client.delete_channel_group.assert_called_once_with(20)
 
+    @pytest.mark.asyncio
+    async def test_reports_failed_group_deletes(self, async_client):
+        """A failing group delete is reported without stopping the others."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1, "name": "IPTV-1",
+            "channel_groups": [{"channel_group": 10}, {"channel_group": 20}, {"channel_group": 30}],
+        }
+        mock_client.get_m3u_accounts.return_value = [
+            {"id": 1, "name": "IPTV-1", "channel_groups": [{"channel_group": 10}]},
+        ]
+        mock_client.delete_m3u_account.return_value = None
+        mock_client.invalidate_channel_group_names = MagicMock()
+
+        async def delete_group(group_id):
+            if group_id == 20:
+                raise RuntimeError("group has channels")
+
+        mock_client.delete_channel_group.side_effect = delete_group
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal"):
+            response = await async_client.delete("/api/m3u/accounts/1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["deleted_groups"] == [10, 30]
+        assert data["failed_groups"] == [{"id": 20, "error": "group has channels"}]
+        assert data["skipped_groups"] == []
+
     @pytest.mark.asyncio
     async def test_cleans_up_linked_accounts(self, async_client):
         """Removes deleted account from linked_m3u_accounts in settings."""
@@ -139,6 +450,7 @@ class TestDeleteM3UAccount:
         mock_client.get_m3u_account.return_value = {"id": 2, "name": "IPTV-2"}
         mock_client.get_m3u_accounts.return_value = [{"id": 2, "name": "IPTV-2", "channel_groups": []}]
         mock_client.delete_m3u_account.return_value = None
+        mock_client.invalidate_channel_group_names = MagicMock()
 
         mock_settings = DispatcharrSettings(
             url="http://test", username="test",
@@ -190,7 +502,10 @@ class TestRefreshSingle:
 
     @pytest.mark.asyncio
     async def test_refreshes_account(self, async_client):
-        """Triggers refresh for a single M3U account."""
+        """Triggers refresh, returns 202 and runs the tracked completion poller."""
+        import asyncio
+        from routers.m3u import _REFRESH_POLL_TASKS
+
         mock_client = AsyncMock()
         mock_client.get_m3u_account.return_value = {
             "id": 1, "name": "IPTV", "updated_at": "2024-01-01",
@@ -198,10 +513,238 @@ class TestRefreshSingle:
         mock_client.refresh_m3u_account.return_value = {"status": "refreshing"}
 
         with patch("routers.m3u.get_client", return_value=mock_client), \
-             patch("asyncio.create_task"):
+             patch("routers.m3u._poll_m3u_refresh_completion", new_callable=AsyncMock) as poll:
             response = await async_client.post("/api/m3u/refresh/1")
+            await asyncio.gather(*_REFRESH_POLL_TASKS.values())
 
-        assert response.status_code == 200
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "scheduled"
+        assert data["task_id"]
+        assert data["result"] == {"status": "refreshing"}
+        poll.assert_awaited_once_with(1, "IPTV", "2024-01-01")
+        assert not _REFRESH_POLL_TASKS
+
+    @pytest.mark.asyncio
+    async def test_repeat_refresh_reuses_running_poller(self, async_client):
+        """A second refresh while the account is still being polled shares the poller."""
+        import asyncio
+        from routers.m3u import _REFRESH_POLL_TASKS
+
+        release = asyncio.Event()
+
+        async def slow_poll(*args):
+            await release.wait()
+
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {"id": 1, "name": "IPTV", "updated_at": "t0"}
+        mock_client.refresh_m3u_account.return_value = {}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u._poll_m3u_refresh_completion", side_effect=slow_poll) as poll:
+            first = await async_client.post("/api/m3u/refresh/1")
+            second = await async_client.post("/api/m3u/refresh/1")
+            release.set()
+            await asyncio.gather(*_REFRESH_POLL_TASKS.values())
+
+        assert first.json()["task_id"] == second.json()["task_id"]
+        assert poll.call_count == 1
+        assert not _REFRESH_POLL_TASKS
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_trigger(self, async_client):
+        """Duplicate refreshes in flight together make one upstream call."""
+        import asyncio
+        from routers.m3u import _IN_FLIGHT_TRIGGERS, _REFRESH_POLL_TASKS
+
+        release = asyncio.Event()
+
+        async def slow_refresh(account_id):
+            await release.wait()
+            return {"status": "refreshing"}
+
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {"id": 1, "name": "IPTV", "updated_at": "t0"}
+        mock_client.refresh_m3u_account.side_effect = slow_refresh
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u._poll_m3u_refresh_completion", new_callable=AsyncMock):
+            pending = [asyncio.create_task(async_client.post("/api/m3u/refresh/1")) for _ in range(3)]
+            # Let every request reach the handler while the first is still in flight
+            for _ in range(100):
+                await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*pending)
+            await asyncio.gather(*_REFRESH_POLL_TASKS.values())
+
+        assert [r.status_code for r in responses] == [202, 202, 202]
+        assert len({r.json()["task_id"] for r in responses}) == 1
+        assert mock_client.refresh_m3u_account.call_count == 1
+        assert not _IN_FLIGHT_TRIGGERS
+
+    @pytest.mark.asyncio
+    async def test_trigger_failure_alert_does_not_block_response(self, async_client):
+        """The 500 is returned while the failure alert is still being delivered."""
+        import asyncio
+        from routers.m3u import _pending_alerts
+
+        release = asyncio.Event()
+
+        async def slow_alert(**kwargs):
+            await release.wait()
+
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.side_effect = RuntimeError("upstream down")
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.send_alert", side_effect=slow_alert) as alert:
+            response = await async_client.post("/api/m3u/refresh/1")
+            assert response.status_code == 500
+            assert len(_pending_alerts) == 1
+            release.set()
+            await asyncio.gather(*_pending_alerts)
+
+        assert alert.call_args.kwargs["title"] == "M3U Refresh Failed"
+        assert alert.call_args.kwargs["entity_id"] == 1
+        assert not _pending_alerts
+
+
+class TestCaptureChangesAfterRefresh:
+    """Tests for _capture_m3u_changes_after_refresh (post-refresh change capture)."""
+
+    @pytest.mark.asyncio
+    async def test_collects_stream_names_with_bounded_concurrency(self):
+        """Fetches every group's stream names, skipping failures, within the concurrency cap."""
+        import asyncio
+        from routers.m3u import _capture_m3u_changes_after_refresh
+
+        in_flight = 0
+        peak = 0
+
+        async def get_streams(page, page_size, channel_group_name, m3u_account):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if channel_group_name == "Broken":
+                raise Exception("upstream 500")
+            return {"results": [{"name": f"{channel_group_name} 1"}]}
+
+        group_ids = list(range(1, 13))
+        names = {gid: f"Group {gid}" for gid in group_ids}
+        names[12] = "Broken"
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "channel_groups": [{"channel_group": gid, "enabled": True} for gid in group_ids],
+        }
+        mock_client.channel_group_names.return_value = names
+        mock_client.get_stream_groups_with_counts.return_value = [{"name": "Group 1", "count": 4}]
+        mock_client.get_streams.side_effect = get_streams
+
+        detector = MagicMock()
+        detector.detect_changes.return_value.has_changes = False
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.get_session"), \
+             patch("routers.m3u.M3U_CHANGE_FETCH_CONCURRENCY", 3), \
+             patch("m3u_change_detector.M3UChangeDetector", return_value=detector):
+            await _capture_m3u_changes_after_refresh(1, "IPTV")
+
+        kwargs = detector.detect_changes.call_args.kwargs
+        assert kwargs["current_total_streams"] == 4
+        assert len(kwargs["current_groups"]) == 12
+        by_group = kwargs["stream_names_by_group"]
+        assert "Broken" not in by_group
+        assert by_group["Group 3"] == ["Group 3 1"]
+        assert len(by_group) == 11
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_stale_group_name_map(self):
+        """Groups created by the refresh trigger one rebuild of the cached name map."""
+        from routers.m3u import _capture_m3u_changes_after_refresh
+
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "channel_groups": [{"channel_group": 1}, {"channel_group": 2}],
+        }
+        mock_client.channel_group_names.side_effect = [
+            {1: "News"},
+            {1: "News", 2: "Sports"},
+        ]
+        mock_client.invalidate_channel_group_names = MagicMock()
+        mock_client.get_stream_groups_with_counts.return_value = []
+        mock_client.get_streams.return_value = {"results": []}
+
+        detector = MagicMock()
+        detector.detect_changes.return_value.has_changes = False
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.get_session"), \
+             patch("m3u_change_detector.M3UChangeDetector", return_value=detector):
+            await _capture_m3u_changes_after_refresh(1, "IPTV")
+
+        mock_client.invalidate_channel_group_names.assert_called_once()
+        groups = detector.detect_changes.call_args.kwargs["current_groups"]
+        assert [g["name"] for g in groups] == ["News", "Sports"]
+
+
+class TestPollRefreshCompletion:
+    """Tests for _poll_m3u_refresh_completion (background refresh watcher)."""
+
+    @pytest.mark.asyncio
+    async def test_backs_off_then_completes(self):
+        """Poll delay grows between checks; completion runs the follow-up steps once."""
+        from routers.m3u import _poll_m3u_refresh_completion
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.side_effect = [
+            {"updated_at": "t0"},
+            {"updated_at": "t0"},
+            {"updated_at": "t1"},
+        ]
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.asyncio.sleep", side_effect=fake_sleep), \
+             patch("routers.m3u.random.uniform", return_value=0.0), \
+             patch("routers.m3u._capture_m3u_changes_after_refresh", new_callable=AsyncMock) as capture, \
+             patch("routers.m3u.send_immediate_digest", new_callable=AsyncMock) as digest, \
+             patch("routers.m3u.send_alert", new_callable=AsyncMock) as alert, \
+             patch("routers.m3u.journal") as mock_journal, \
+             patch("routers.m3u.run_auto_creation_after_refresh", new_callable=AsyncMock) as auto:
+            await _poll_m3u_refresh_completion(1, "IPTV", "t0")
+
+        assert sleeps == [1.0, 1.6, pytest.approx(2.56)]
+        capture.assert_awaited_once_with(1, "IPTV")
+        digest.assert_awaited_once_with(1)
+        mock_journal.log_entry_background.assert_called_once()
+        assert alert.await_args.kwargs["notification_type"] == "success"
+        auto.assert_awaited_once_with(m3u_account_ids=[1], triggered_by="m3u_refresh")
+
+    @pytest.mark.asyncio
+    async def test_assumed_completion_alerts_are_coalesced(self):
+        """Back-to-back assumed completions for one account send a single alert."""
+        from routers.m3u import _last_refresh_alert, _on_refresh_complete
+
+        _last_refresh_alert.clear()
+        with patch("routers.m3u._capture_m3u_changes_after_refresh", new_callable=AsyncMock), \
+             patch("routers.m3u.send_immediate_digest", new_callable=AsyncMock), \
+             patch("routers.m3u.send_alert", new_callable=AsyncMock) as alert, \
+             patch("routers.m3u.journal") as mock_journal, \
+             patch("routers.m3u.run_auto_creation_after_refresh", new_callable=AsyncMock):
+            await _on_refresh_complete(1, "IPTV", None)
+            await _on_refresh_complete(1, "IPTV", None)
+            await _on_refresh_complete(2, "Other", None)
+
+        assert alert.await_count == 2
+        assert mock_journal.log_entry_background.call_count == 3
+        _last_refresh_alert.clear()
 
 
 class TestRefreshVOD:
@@ -250,6 +793,22 @@ class TestCreateFilter:
 
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b"{not json", b"[1, 2]"])
+    async def test_rejects_invalid_body(self, async_client, body):
+        """Malformed or non-object JSON bodies return 400 without calling upstream."""
+        mock_client = AsyncMock()
+
+        with patch("routers.m3u.get_client", return_value=mock_client):
+            response = await async_client.post(
+                "/api/m3u/accounts/1/filters",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+
+        assert response.status_code == 400
+        mock_client.create_m3u_filter.assert_not_called()
+
 
 class TestUpdateFilter:
     """Tests for PUT /api/m3u/accounts/{account_id}/filters/{filter_id}."""
@@ -367,6 +926,34 @@ class TestDeleteProfile:
 class TestUpdateGroupSettings:
     """Tests for PATCH /api/m3u/accounts/{account_id}/group-settings."""
 
+    @pytest.fixture(autouse=True)
+    def _forget_last_payload(self):
+        from cache import get_cache
+        get_cache().invalidate_prefix("m3u_group_settings:")
+        yield
+        get_cache().invalidate_prefix("m3u_group_settings:")
+
+    @pytest.mark.asyncio
+    async def test_identical_repeat_skips_upstream(self, async_client):
+        """Resending the last successful payload returns the prior response."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {"id": 1, "name": "IPTV", "channel_groups": []}
+        mock_client.channel_group_names.return_value = {}
+        mock_client.update_m3u_group_settings.return_value = {"id": 1, "saved": True}
+        payload = {"group_settings": [{"channel_group": 10, "enabled": True}]}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal"):
+            first = await async_client.patch("/api/m3u/accounts/1/group-settings", json=payload)
+            second = await async_client.patch("/api/m3u/accounts/1/group-settings", json=payload)
+            changed = await async_client.patch("/api/m3u/accounts/1/group-settings", json={
+                "group_settings": [{"channel_group": 10, "enabled": False}],
+            })
+
+        assert first.json() == second.json() == {"id": 1, "saved": True}
+        assert changed.status_code == 200
+        assert mock_client.update_m3u_group_settings.await_count == 2
+
     @pytest.mark.asyncio
     async def test_updates_group_settings(self, async_client):
         """Updates M3U group settings."""
@@ -381,6 +968,111 @@ class TestUpdateGroupSettings:
             })
 
         assert response.status_code == 200
+        # No per-group entries to journal, so no before-state fetches
+        mock_client.get_m3u_account.assert_not_called()
+        mock_client.channel_group_names.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_journals_changes_in_label_order(self, async_client):
+        """Journal description lists change labels in fixed display order."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1,
+            "name": "IPTV",
+            "channel_groups": [
+                {"channel_group": 10, "enabled": True, "auto_channel_sync": False},
+                {"channel_group": 20, "enabled": False, "auto_channel_sync": False},
+            ],
+        }
+        mock_client.channel_group_names.return_value = {10: "News", 20: "Sports"}
+        mock_client.update_m3u_group_settings.return_value = {"id": 1}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal") as mock_journal:
+            response = await async_client.patch("/api/m3u/accounts/1/group-settings", json={
+                "group_settings": [
+                    {"channel_group": 10, "enabled": False, "auto_channel_sync": True},
+                    {"channel_group": 20, "enabled": True, "auto_channel_sync": False},
+                ],
+            })
+
+        assert response.status_code == 200
+        kwargs = mock_journal.log_entry_background.call_args.kwargs
+        assert kwargs["description"] == (
+            "Updated group settings - Enabled: Sports; Disabled: News; Auto-sync on: News"
+        )
+        assert set(kwargs["before_value"]) == {10, 20}
+        assert kwargs["before_value"][10] == {
+            "enabled": True,
+            "auto_channel_sync": False,
+            "auto_sync_channel_start": None,
+            "custom_properties": None,
+            "name": "News",
+        }
+        assert [g["name"] for g in kwargs["after_value"]] == ["News", "Sports"]
+
+    @pytest.mark.asyncio
+    async def test_omitted_fields_are_not_journaled(self, async_client):
+        """Fields absent from a group entry are not reported as changed."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1,
+            "name": "IPTV",
+            "channel_groups": [
+                {
+                    "channel_group": 10,
+                    "enabled": True,
+                    "auto_sync_channel_start": 100,
+                    "custom_properties": {"xc_id": "5"},
+                },
+            ],
+        }
+        mock_client.channel_group_names.return_value = {10: "News"}
+        mock_client.update_m3u_group_settings.return_value = {"id": 1}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal") as mock_journal:
+            response = await async_client.patch("/api/m3u/accounts/1/group-settings", json={
+                "group_settings": [{"channel_group": 10, "enabled": True}],
+            })
+
+        assert response.status_code == 200
+        mock_journal.log_entry_background.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_full_entries_are_not_journaled(self, async_client):
+        """Full entries matching current settings ({} == None) produce no journal entry."""
+        mock_client = AsyncMock()
+        mock_client.get_m3u_account.return_value = {
+            "id": 1,
+            "name": "IPTV",
+            "channel_groups": [
+                {
+                    "channel_group": 10,
+                    "enabled": True,
+                    "auto_channel_sync": False,
+                    "auto_sync_channel_start": 100,
+                    "custom_properties": None,
+                },
+            ],
+        }
+        mock_client.channel_group_names.return_value = {10: "News"}
+        mock_client.update_m3u_group_settings.return_value = {"id": 1}
+
+        with patch("routers.m3u.get_client", return_value=mock_client), \
+             patch("routers.m3u.journal") as mock_journal:
+            response = await async_client.patch("/api/m3u/accounts/1/group-settings", json={
+                "group_settings": [{
+                    "channel_group": 10,
+                    "enabled": True,
+                    "auto_channel_sync": False,
+                    "auto_sync_channel_start": 100,
+                    "custom_properties": {},
+                }],
+            })
+
+        assert response.status_code == 200
+        mock_journal.log_entry_background.assert_not_called()
 
 
 class TestGetServerGroups:
@@ -397,6 +1089,24 @@ class TestGetServerGroups:
 
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_unchanged_groups_revalidate_with_304(self, async_client):
+        """A matching If-None-Match returns 304 with no body; a stale one gets the data."""
+        mock_client = AsyncMock()
+        mock_client.get_server_groups.return_value = [{"id": 1, "name": "Sports"}]
+
+        with patch("routers.m3u.get_client", return_value=mock_client):
+            first = await async_client.get("/api/m3u/server-groups")
+            etag = first.headers["etag"]
+            unchanged = await async_client.get("/api/m3u/server-groups", headers={"If-None-Match": etag})
+            stale = await async_client.get("/api/m3u/server-groups", headers={"If-None-Match": 'W/"old"'})
+
+        assert etag.startswith('W/"')
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert stale.status_code == 200
+        assert stale.json() == [{"id": 1, "name": "Sports"}]
+
     @pytest.mark.asyncio
     async def test_client_error(self, async_client):
         """Returns 500 on client error."""
@@ -434,7 +1144,7 @@ class TestUpdateServerGroup:
     async def test_updates_group(self, async_client):
         """Updates a server group."""
         mock_client = AsyncMock()
-        mock_client.get_server_groups.return_value = [{"id": 1, "name": "Old"}]
+        mock_client.get_server_group.return_value = {"id": 1, "name": "Old"}
         mock_client.update_server_group.return_value = {"id": 1, "name": "New"}
 
         with patch("routers.m3u.get_client", return_value=mock_client), \
@@ -453,7 +1163,7 @@ class TestDeleteServerGroup:
     async def test_deletes_group(self, async_client):
         """Deletes a server group."""
         mock_client = AsyncMock()
-        mock_client.get_server_groups.return_value = [{"id": 1, "name": "Sports"}]
+        mock_client.get_server_group.return_value = {"id": 1, "name": "Sports"}
         mock_client.delete_server_group.return_value = None
 
         with patch("routers.m3u.get_client", return_value=mock_client), \
@@ -462,3 +1172,5 @@ class TestDeleteServerGroup:
 
         assert response.status_code == 200
         assert response.json()["status"] == "deleted"
+        mock_client.get_server_group.assert_awaited_once_with(1)
+        mock_client.get_server_groups.assert_not_called()
@@ -11,6 +11,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from models import M3UChangeLog, M3USnapshot, M3UDigestSettings
+from m3u_change_detector import M3UChangeDetector
 
 
 def _create_change_log(session, **overrides):
@@ -95,6 +96,54 @@ class TestGetM3UChanges:
         assert data["total"] == 2
         assert len(data["results"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_rows_match_model_to_dict(self, async_client, test_session):
+        """Projected rows keep the exact M3UChangeLog.to_dict() shape."""
+        snapshot = _create_snapshot(test_session)
+        record = _create_change_log(test_session, snapshot_id=snapshot.id)
+        _create_change_log(test_session, stream_names="not json")
+
+        response = await async_client.get("/api/m3u/changes", params={"sort_by": "count"})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert record.to_dict() in results
+        assert any(r["stream_names"] == [] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson_in_chunks(self, async_client, test_session):
+        """Accept: application/x-ndjson streams one change per line across slices."""
+        for i in range(5):
+            _create_change_log(test_session, count=i, change_time=datetime(2024, 6, 1 + i))
+
+        with patch("routers.m3u_digest.NDJSON_CHUNK_ROWS", 2):
+            response = await async_client.get(
+                "/api/m3u/changes",
+                params={"page_size": 3, "page": 1},
+                headers={"Accept": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["x-total-count"] == "5"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["count"] for r in rows] == [4, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_date_range(self, async_client, test_session):
+        """ISO date bounds (with a trailing Z) filter; malformed ones are ignored."""
+        _create_change_log(test_session, change_time=datetime(2024, 6, 1, 12, 0, 0))
+        _create_change_log(test_session, change_time=datetime(2024, 6, 15, 12, 0, 0))
+        _create_change_log(test_session, change_time=datetime(2024, 6, 30, 12, 0, 0))
+
+        response = await async_client.get("/api/m3u/changes", params={
+            "date_from": "2024-06-10T00:00:00Z",
+            "date_to": "not-a-date",
+        })
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
     @pytest.mark.asyncio
     async def test_filters_by_account(self, async_client, test_session):
         """Filters changes by M3U account ID."""
@@ -148,6 +197,20 @@ class TestGetM3UChanges:
         assert data["page"] == 2
         assert data["total_pages"] == 3
 
+    @pytest.mark.asyncio
+    async def test_page_past_end_keeps_total(self, async_client, test_session):
+        """A page beyond the last still reports the full total."""
+        for i in range(3):
+            _create_change_log(test_session, count=i)
+
+        response = await async_client.get("/api/m3u/changes", params={"page": 5, "page_size": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"] == []
+        assert data["total"] == 3
+        assert data["total_pages"] == 2
+
     @pytest.mark.asyncio
     async def test_sort_ascending(self, async_client, test_session):
         """Sorts results in ascending order."""
@@ -210,6 +273,30 @@ class TestGetM3UChangesSummary:
 
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_request_session_closed_on_event_loop(self, async_client):
+        """get_db closes its session on the loop thread, not a threadpool
+        thread where its rollback could race other sessions on the shared
+        connection."""
+        import threading
+        from sqlalchemy.orm import Session
+
+        close = Session.close
+        closed_on = []
+
+        def record_close(session):
+            closed_on.append(threading.get_ident())
+            return close(session)
+
+        mock_detector = MagicMock()
+        mock_detector.get_change_summary.return_value = {}
+        with patch("m3u_change_detector.M3UChangeDetector", return_value=mock_detector), \
+             patch.object(Session, "close", autospec=True, side_effect=record_close):
+            response = await async_client.get("/api/m3u/changes/summary")
+
+        assert response.status_code == 200
+        assert closed_on and set(closed_on) == {threading.get_ident()}
+
 
 class TestGetM3UAccountChanges:
     """Tests for GET /api/m3u/accounts/{account_id}/changes."""
@@ -266,6 +353,25 @@ class TestGetM3USnapshots:
         data = response.json()
         assert len(data) == 2
 
+    @pytest.mark.asyncio
+    async def test_query_runs_on_event_loop(self, async_client):
+        """The snapshot query stays on the loop thread that owns the shared connection."""
+        import threading
+        import routers.m3u_digest as m3u_digest_router
+
+        loop_thread = threading.get_ident()
+        seen = []
+
+        def fake_list(db, m3u_account_id, limit):
+            seen.append(threading.get_ident())
+            return []
+
+        with patch.object(m3u_digest_router, "_list_snapshots", side_effect=fake_list):
+            response = await async_client.get("/api/m3u/snapshots")
+
+        assert response.status_code == 200
+        assert seen == [loop_thread]
+
     @pytest.mark.asyncio
     async def test_filters_by_account(self, async_client, test_session):
         """Filters snapshots by M3U account."""
@@ -278,6 +384,24 @@ class TestGetM3USnapshots:
         data = response.json()
         assert len(data) == 1
 
+    @pytest.mark.asyncio
+    async def test_repeat_poll_served_from_cache_until_new_snapshot(self, async_client, test_session):
+        """Polls reuse the cached page; creating a snapshot invalidates it."""
+        _create_snapshot(test_session, m3u_account_id=1)
+
+        first = await async_client.get("/api/m3u/snapshots", params={"m3u_account_id": 1})
+        with patch("routers.m3u_digest._list_snapshots") as list_mock:
+            again = await async_client.get("/api/m3u/snapshots", params={"m3u_account_id": 1})
+        list_mock.assert_not_called()
+        assert again.json() == first.json()
+
+        M3UChangeDetector(test_session).create_snapshot(
+            m3u_account_id=1, groups_data=[], total_streams=0
+        )
+        after = await async_client.get("/api/m3u/snapshots", params={"m3u_account_id": 1})
+
+        assert len(after.json()) == 2
+
     @pytest.mark.asyncio
     async def test_respects_limit(self, async_client, test_session):
         """Respects the limit parameter."""
@@ -325,6 +449,30 @@ class TestGetDigestSettings:
         assert data["enabled"] is False
         assert data["frequency"] == "daily"
 
+    @pytest.mark.asyncio
+    async def test_repeat_get_revalidates_until_update(self, async_client, test_session):
+        """Repeat GETs are served from cache with a 304; a PUT busts it."""
+        _create_digest_settings(test_session)
+
+        first = await async_client.get("/api/m3u/digest/settings")
+        etag = first.headers["etag"]
+        with patch("tasks.m3u_digest.get_or_create_digest_settings") as load_mock:
+            again = await async_client.get(
+                "/api/m3u/digest/settings", headers={"If-None-Match": etag}
+            )
+        assert again.status_code == 304
+        load_mock.assert_not_called()
+
+        with patch("routers.m3u_digest.journal"):
+            await async_client.put("/api/m3u/digest/settings", json={"frequency": "weekly"})
+        after = await async_client.get(
+            "/api/m3u/digest/settings", headers={"If-None-Match": etag}
+        )
+
+        assert after.status_code == 200
+        assert after.json()["frequency"] == "weekly"
+        assert after.headers["etag"] != etag
+
 
 class TestUpdateDigestSettings:
     """Tests for PUT /api/m3u/digest/settings."""
@@ -345,6 +493,19 @@ class TestUpdateDigestSettings:
         assert data["enabled"] is True
         assert data["frequency"] == "hourly"
 
+    @pytest.mark.asyncio
+    async def test_response_reflects_bumped_updated_at(self, async_client, test_session):
+        """The PUT response (serialized before commit) carries the new updated_at."""
+        record = _create_digest_settings(test_session)
+        created = record.to_dict()["updated_at"]
+
+        with patch("routers.m3u_digest.journal") as journal_mock:
+            response = await async_client.put("/api/m3u/digest/settings", json={"enabled": True})
+
+        data = response.json()
+        assert data["updated_at"] > created
+        assert journal_mock.log_entry.call_args.kwargs["after_value"] == data
+
     @pytest.mark.asyncio
     async def test_rejects_invalid_frequency(self, async_client, test_session):
         """Returns 400 for invalid frequency."""
@@ -371,6 +532,19 @@ class TestUpdateDigestSettings:
         assert response.status_code == 400
         assert "email" in response.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_lists_every_invalid_email(self, async_client, test_session):
+        """The 400 names all invalid recipients, not just the first."""
+        _create_digest_settings(test_session)
+
+        with patch("routers.m3u_digest.journal"):
+            response = await async_client.put("/api/m3u/digest/settings", json={
+                "email_recipients": ["bad-one", "ok@example.com", "bad-two"],
+            })
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid email addresses: bad-one, bad-two"
+
     @pytest.mark.asyncio
     async def test_rejects_invalid_threshold(self, async_client, test_session):
         """Returns 400 for threshold less than 1."""
@@ -448,6 +622,38 @@ class TestUpdateDigestSettings:
         assert response.status_code == 400
         assert "regex" in response.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_reports_every_invalid_pattern(self, async_client, test_session):
+        """Bad group and stream patterns are all named in one 400."""
+        _create_digest_settings(test_session)
+
+        with patch("routers.m3u_digest.journal"):
+            response = await async_client.put("/api/m3u/digest/settings", json={
+                "exclude_group_patterns": ["[bad", "ok", "[bad"],
+                "exclude_stream_patterns": ["(bad"],
+            })
+
+        assert response.status_code == 400
+        detail = response.json()["detail"]
+        assert detail.count("Invalid group exclude regex '[bad'") == 1
+        assert "Invalid stream exclude regex '(bad'" in detail
+
+    @pytest.mark.asyncio
+    async def test_dedupes_and_drops_empty_patterns(self, async_client, test_session):
+        """Repeated and empty exclude patterns are not stored."""
+        _create_digest_settings(test_session)
+
+        with patch("routers.m3u_digest.journal"):
+            response = await async_client.put("/api/m3u/digest/settings", json={
+                "exclude_group_patterns": ["^ES", "", "^ES", "PPV"],
+                "exclude_stream_patterns": ["", ""],
+            })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["exclude_group_patterns"] == ["^ES", "PPV"]
+        assert data["exclude_stream_patterns"] == []
+
     @pytest.mark.asyncio
     async def test_accepts_valid_exclude_patterns(self, async_client, test_session):
         """Accepts valid exclude patterns under the safe_regex length cap."""
@@ -55,13 +55,31 @@ class TestGetAllRules:
             {"id": 1, "name": "Group A", "rules": []}
         ]
 
-        with patch("normalization_engine.get_normalization_engine", return_value=mock_engine):
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
             response = await async_client.get("/api/normalization/rules")
 
         assert response.status_code == 200
         data = response.json()
         assert "groups" in data
 
+    @pytest.mark.asyncio
+    async def test_tag_cache_invalidation_drops_cached_rules(self, async_client):
+        """Tag group writes invalidate cached rules, which embed tag group names."""
+        from normalization_engine import invalidate_tag_cache
+
+        mock_engine = MagicMock()
+        mock_engine.get_all_rules.return_value = []
+
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
+            await async_client.get("/api/normalization/rules")
+            await async_client.get("/api/normalization/rules")
+            assert mock_engine.get_all_rules.call_count == 1
+
+            invalidate_tag_cache()
+            await async_client.get("/api/normalization/rules")
+
+        assert mock_engine.get_all_rules.call_count == 2
+
 
 class TestGetGroups:
     """Tests for GET /api/normalization/groups."""
@@ -86,6 +104,50 @@ class TestGetGroups:
         assert groups[0]["name"] == "First"
         assert groups[1]["name"] == "Second"
 
+    @pytest.mark.asyncio
+    async def test_query_runs_on_event_loop(self, async_client):
+        """The group query stays on the loop thread that owns the shared connection."""
+        import threading
+        import routers.normalization as normalization_router
+
+        loop_thread = threading.get_ident()
+        seen = []
+
+        def fake_groups(session):
+            seen.append(threading.get_ident())
+            return []
+
+        with patch.object(normalization_router, "_group_dicts", side_effect=fake_groups):
+            response = await async_client.get("/api/normalization/groups")
+
+        assert response.status_code == 200
+        assert seen == [loop_thread]
+
+    @pytest.mark.asyncio
+    async def test_repeat_get_served_from_cache_until_write(self, async_client):
+        """Repeat GETs skip the DB and revalidate via ETag until a group is written."""
+        import routers.normalization as normalization_router
+
+        with patch.object(
+            normalization_router, "_group_dicts", wraps=normalization_router._group_dicts,
+        ) as group_dicts:
+            first = await async_client.get("/api/normalization/groups")
+            etag = first.headers["etag"]
+            repeat = await async_client.get(
+                "/api/normalization/groups", headers={"If-None-Match": etag},
+            )
+            assert repeat.status_code == 304
+            assert group_dicts.call_count == 1
+
+            await async_client.post("/api/normalization/groups", json={"name": "New"})
+            after = await async_client.get(
+                "/api/normalization/groups", headers={"If-None-Match": etag},
+            )
+
+        assert group_dicts.call_count == 2
+        assert after.status_code == 200
+        assert [g["name"] for g in after.json()["groups"]] == ["New"]
+
 
 class TestCreateGroup:
     """Tests for POST /api/normalization/groups."""
@@ -105,6 +167,29 @@ class TestCreateGroup:
         assert data["priority"] == 5
         assert data["is_builtin"] is False
 
+    @pytest.mark.asyncio
+    async def test_no_select_after_insert(self, async_client, test_engine):
+        """The response is built from the flushed row, without re-reading it."""
+        from sqlalchemy import event
+
+        selects = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = await async_client.post("/api/normalization/groups", json={"name": "New"})
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] is not None
+        assert data["created_at"] is not None
+        assert selects == []
+
 
 class TestGetGroup:
     """Tests for GET /api/normalization/groups/{group_id}."""
@@ -128,6 +213,27 @@ class TestGetGroup:
         response = await async_client.get("/api/normalization/groups/99999")
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_closes_session_on_error_response(self, async_client):
+        """The injected session is closed even when the handler raises."""
+        import database
+
+        session_factory = database._SessionLocal
+        opened = []
+
+        def tracking_session():
+            session = session_factory()
+            session.close = MagicMock(wraps=session.close)
+            opened.append(session)
+            return session
+
+        with patch.object(database, "_SessionLocal", tracking_session):
+            response = await async_client.get("/api/normalization/groups/99999")
+
+        assert response.status_code == 404
+        assert len(opened) == 1
+        opened[0].close.assert_called_once()
+
 
 class TestUpdateGroup:
     """Tests for PATCH /api/normalization/groups/{group_id}."""
@@ -177,6 +283,35 @@ class TestDeleteGroup:
             NormalizationRule.group_id == group_id
         ).count() == 0
 
+    @pytest.mark.asyncio
+    async def test_deletes_without_loading_rows(self, async_client, test_session, test_engine):
+        """Only the two bulk DELETEs run; other groups' rules are untouched."""
+        from sqlalchemy import event
+
+        group = _create_group(test_session)
+        other = _create_group(test_session, name="Other")
+        _create_rule(test_session, group.id)
+        _create_rule(test_session, group.id, name="Second")
+        _create_rule(test_session, other.id)
+        group_id = group.id
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement.lstrip().split()[0].upper())
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = await async_client.delete(f"/api/normalization/groups/{group_id}")
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 200
+        assert statements == ["DELETE", "DELETE"]
+        assert test_session.query(NormalizationRule).filter(
+            NormalizationRule.group_id == other.id
+        ).count() == 1
+
     @pytest.mark.asyncio
     async def test_returns_404(self, async_client):
         """Returns 404 for nonexistent group."""
@@ -244,6 +379,28 @@ class TestCreateRule:
         assert data["name"] == "Remove HD"
         assert data["group_id"] == group.id
 
+    @pytest.mark.asyncio
+    async def test_round_trips_compound_conditions(self, async_client, test_session):
+        """Compound conditions, including non-ASCII values, read back unchanged."""
+        group = _create_group(test_session)
+        conditions = [
+            {"type": "contains", "value": "Español", "negate": False, "case_sensitive": False},
+            {"type": "ends_with", "value": "ᴴᴰ", "negate": True, "case_sensitive": True},
+        ]
+
+        response = await async_client.post("/api/normalization/rules", json={
+            "group_id": group.id,
+            "name": "Compound",
+            "conditions": conditions,
+            "condition_logic": "OR",
+            "action_type": "remove",
+        })
+        assert response.status_code == 200
+        assert response.json()["conditions"] == conditions
+
+        fetched = await async_client.get(f"/api/normalization/rules/{response.json()['id']}")
+        assert fetched.json()["conditions"] == conditions
+
     @pytest.mark.asyncio
     async def test_returns_404_for_nonexistent_group(self, async_client):
         """Returns 404 when group doesn't exist."""
@@ -275,6 +432,21 @@ class TestUpdateRule:
         assert data["name"] == "New"
         assert data["enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_response_reflects_bumped_updated_at(self, async_client, test_session):
+        """updated_at in the response is the onupdate value written by this PATCH."""
+        group = _create_group(test_session)
+        rule = _create_rule(test_session, group.id, name="Old")
+        before = rule.to_dict()["updated_at"]
+
+        response = await async_client.patch(
+            f"/api/normalization/rules/{rule.id}", json={"name": "New"},
+        )
+        assert response.status_code == 200
+
+        test_session.refresh(rule)
+        assert response.json()["updated_at"] == rule.to_dict()["updated_at"] != before
+
     @pytest.mark.asyncio
     async def test_returns_404(self, async_client):
         """Returns 404 for nonexistent rule."""
@@ -331,6 +503,28 @@ class TestReorderRules:
         assert r2.priority == 0
         assert r1.priority == 1
 
+    @pytest.mark.asyncio
+    async def test_ignores_rules_from_other_groups(self, async_client, test_session):
+        """Rule ids belonging to another group keep their priority."""
+        group = _create_group(test_session, name="Mine")
+        other = _create_group(test_session, name="Other")
+        r1 = _create_rule(test_session, group.id, name="A", priority=0)
+        r2 = _create_rule(test_session, group.id, name="B", priority=1)
+        foreign = _create_rule(test_session, other.id, name="C", priority=7)
+
+        response = await async_client.post(
+            f"/api/normalization/groups/{group.id}/rules/reorder",
+            json={"rule_ids": [foreign.id, r2.id, r1.id]},
+        )
+        assert response.status_code == 200
+
+        test_session.refresh(r1)
+        test_session.refresh(r2)
+        test_session.refresh(foreign)
+        assert r2.priority == 1
+        assert r1.priority == 2
+        assert foreign.priority == 7
+
 
 class TestTestRule:
     """Tests for POST /api/normalization/test."""
@@ -345,7 +539,7 @@ class TestTestRule:
             "result": "ESPN",
         }
 
-        with patch("normalization_engine.get_normalization_engine", return_value=mock_engine):
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
             response = await async_client.post("/api/normalization/test", json={
                 "text": "ESPN HD",
                 "condition_type": "contains",
@@ -373,7 +567,7 @@ class TestTestBatch:
         mock_engine = MagicMock()
         mock_engine.test_rules_batch.return_value = [mock_result]
 
-        with patch("normalization_engine.get_normalization_engine", return_value=mock_engine):
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
             response = await async_client.post("/api/normalization/test-batch", json={
                 "texts": ["ESPN HD"],
             })
@@ -384,6 +578,60 @@ class TestTestBatch:
         assert data["results"][0]["original"] == "ESPN HD"
         assert data["results"][0]["normalized"] == "ESPN"
 
+    @pytest.mark.asyncio
+    async def test_results_across_chunks(self, async_client, test_session):
+        """Results from every chunk are returned as one JSON document."""
+        import routers.normalization as normalization_router
+
+        group = _create_group(test_session)
+        rule = _create_rule(test_session, group.id)
+        texts = ["ESPN HD", "CNN", "BBC HD", "Fox", "TSN HD"]
+
+        with patch.object(normalization_router, "NORMALIZE_BATCH_CHUNK_SIZE", 2):
+            response = await async_client.post("/api/normalization/test-batch", json={
+                "texts": texts,
+            })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        results = response.json()["results"]
+        assert [r["original"] for r in results] == texts
+        assert [r["normalized"] for r in results] == ["ESPN", "CNN", "BBC", "Fox", "TSN"]
+        assert results[0]["transformations"] == [
+            {"rule_id": rule.id, "before": "ESPN HD", "after": "ESPN "},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_later_chunk_failure_returns_500(self, async_client):
+        """A chunk failing after the first yields a 500, not a truncated 200."""
+        import routers.normalization as normalization_router
+
+        mock_result = MagicMock()
+        mock_result.original = "ESPN HD"
+        mock_result.normalized = "ESPN"
+        mock_result.rules_applied = 0
+        mock_result.transformations = []
+
+        mock_engine = MagicMock()
+        mock_engine.test_rules_batch.side_effect = [[mock_result], RuntimeError("boom")]
+
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine), \
+             patch.object(normalization_router, "NORMALIZE_BATCH_CHUNK_SIZE", 1):
+            response = await async_client.post("/api/normalization/test-batch", json={
+                "texts": ["ESPN HD", "CNN"],
+            })
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, async_client):
+        """An empty batch returns an empty results list."""
+        response = await async_client.post("/api/normalization/test-batch", json={"texts": []})
+
+        assert response.status_code == 200
+        assert response.json() == {"results": []}
+
 
 class TestNormalize:
     """Tests for POST /api/normalization/normalize."""
@@ -398,7 +646,7 @@ class TestNormalize:
         mock_engine = MagicMock()
         mock_engine.test_rules_batch.return_value = [mock_result]
 
-        with patch("normalization_engine.get_normalization_engine", return_value=mock_engine):
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
             response = await async_client.post("/api/normalization/normalize", json={
                 "texts": ["BBC HD"],
             })
@@ -408,6 +656,29 @@ class TestNormalize:
         assert data["results"][0]["original"] == "BBC HD"
         assert data["results"][0]["normalized"] == "BBC"
 
+    @pytest.mark.asyncio
+    async def test_large_batch_runs_in_chunks(self, async_client):
+        """Large batches reach the engine in chunks, with results kept in order."""
+        import routers.normalization as normalization_router
+
+        def fake_batch(texts):
+            return [MagicMock(original=t, normalized=t.lower()) for t in texts]
+
+        mock_engine = MagicMock()
+        mock_engine.test_rules_batch.side_effect = fake_batch
+        texts = [f"Channel {i}" for i in range(600)]
+
+        with patch("routers.normalization.get_normalization_engine", return_value=mock_engine), \
+             patch.object(normalization_router, "NORMALIZE_BATCH_CHUNK_SIZE", 256):
+            response = await async_client.post("/api/normalization/normalize", json={
+                "texts": texts,
+            })
+
+        assert response.status_code == 200
+        chunk_sizes = [len(c.args[0]) for c in mock_engine.test_rules_batch.call_args_list]
+        assert chunk_sizes == [256, 256, 88]
+        assert [r["original"] for r in response.json()["results"]] == texts
+
 
 class TestRuleStats:
     """Tests for GET /api/normalization/rule-stats."""
@@ -418,7 +689,7 @@ class TestRuleStats:
         from unittest.mock import AsyncMock
 
         group = _create_group(test_session, name="Quality")
-        _create_rule(test_session, group.id, name="HD rule")
+        rule = _create_rule(test_session, group.id, name="HD rule")
 
         mock_client = AsyncMock()
         mock_client.get_streams.return_value = {"results": [
@@ -426,20 +697,116 @@ class TestRuleStats:
         ]}
 
         mock_engine = MagicMock()
-        mock_match_yes = MagicMock()
-        mock_match_yes.matched = True
-        mock_match_no = MagicMock()
-        mock_match_no.matched = False
-        mock_engine._match_condition.side_effect = [mock_match_yes, mock_match_no]
+        mock_engine.count_matches_bulk.return_value = {rule.id: 1}
 
         with patch("routers.normalization.get_client", return_value=mock_client), \
-             patch("normalization_engine.get_normalization_engine", return_value=mock_engine):
+             patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
             response = await async_client.get("/api/normalization/rule-stats")
 
         assert response.status_code == 200
         data = response.json()
         assert "rule_stats" in data
         assert data["total_streams_tested"] == 2
+        assert data["rule_stats"][0]["match_count"] == 1
+        assert data["rule_stats"][0]["match_percentage"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_loads_rules_while_fetching_streams(self, async_client):
+        """The rule load runs while the Dispatcharr fetch is still pending."""
+        import asyncio
+        import threading
+        import routers.normalization as normalization_router
+
+        rules_loaded = threading.Event()
+
+        def fake_load(session):
+            rules_loaded.set()
+            return {}, []
+
+        async def fake_get_streams(**kwargs):
+            # Only returns once the rules have been loaded concurrently.
+            assert await asyncio.to_thread(rules_loaded.wait, 5)
+            return {"results": [{"name": "ESPN HD"}]}
+
+        mock_client = MagicMock()
+        mock_client.get_streams.side_effect = fake_get_streams
+        mock_engine = MagicMock()
+        mock_engine.count_matches_bulk.return_value = {}
+
+        with patch("routers.normalization.get_client", return_value=mock_client), \
+             patch("routers.normalization.get_normalization_engine", return_value=mock_engine), \
+             patch.object(normalization_router, "_rules_with_group_names", side_effect=fake_load):
+            response = await async_client.get("/api/normalization/rule-stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_streams_tested"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetches_stream_pages_concurrently(self, async_client):
+        """Pages after the first are fetched in parallel and merged in order."""
+        import asyncio
+        import routers.normalization as normalization_router
+
+        in_flight = 0
+        peak = 0
+        requested = []
+
+        async def fake_get_streams(page, page_size):
+            nonlocal in_flight, peak
+            requested.append((page, page_size))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            start = (page - 1) * page_size
+            names = [{"name": f"S{i}"} for i in range(start, min(start + page_size, 950))]
+            return {"count": 950, "results": names}
+
+        mock_client = MagicMock()
+        mock_client.get_streams.side_effect = fake_get_streams
+        mock_engine = MagicMock()
+        mock_engine.count_matches_bulk.return_value = {}
+
+        with patch("routers.normalization.get_client", return_value=mock_client), \
+             patch("routers.normalization.get_normalization_engine", return_value=mock_engine):
+            response = await async_client.get("/api/normalization/rule-stats?limit=700")
+
+        assert response.status_code == 200
+        assert response.json()["total_streams_tested"] == 700
+        assert sorted(requested) == [(p, 200) for p in range(1, 5)]
+        assert 1 < peak <= normalization_router.RULE_STATS_FETCH_CONCURRENCY
+        names = mock_engine.count_matches_bulk.call_args.args[0]
+        assert names == [f"S{i}" for i in range(700)]
+
+
+class TestRuleStatsLoading:
+    """The rule-stats loader reads only the columns matching needs."""
+
+    def test_loads_group_names_and_match_columns(self, test_engine, test_session):
+        from sqlalchemy import inspect
+        from sqlalchemy.orm import Session
+        from normalization_engine import NormalizationEngine
+        from routers.normalization import _rules_with_group_names
+
+        group = _create_group(test_session, name="Quality", description="x" * 500)
+        _create_rule(test_session, group.id, name="HD", condition_type="contains",
+                     condition_value="HD", action_type="replace", action_value="")
+        _create_rule(test_session, group.id, name="News or One", priority=1, condition_type=None,
+                     conditions='[{"type": "contains", "value": "News"}, '
+                                '{"type": "ends_with", "value": "One"}]',
+                     condition_logic="OR")
+
+        with Session(test_engine) as session:
+            group_map, rules = _rules_with_group_names(session)
+            loaded = inspect(rules[0]).dict
+            counts = NormalizationEngine(session).count_matches_bulk(
+                ["ESPN HD", "Fox News", "BBC One", "CNN"], rules
+            )
+
+        assert group_map == {group.id: "Quality"}
+        assert [r.name for r in rules] == ["HD", "News or One"]
+        assert "action_value" not in loaded and "created_at" not in loaded
+        assert [counts[r.id] for r in rules] == [1, 2]
 
 
 class TestMigrationStatus:
@@ -448,7 +815,7 @@ class TestMigrationStatus:
     @pytest.mark.asyncio
     async def test_returns_status(self, async_client):
         """Returns migration status."""
-        with patch("normalization_migration.get_migration_status", return_value={
+        with patch("routers.normalization.get_migration_status", return_value={
             "migrated": True, "groups_count": 3, "rules_count": 15,
         }):
             response = await async_client.get("/api/normalization/migration/status")
@@ -464,7 +831,7 @@ class TestRunMigration:
     @pytest.mark.asyncio
     async def test_runs_migration(self, async_client):
         """Creates demo normalization rules."""
-        with patch("normalization_migration.create_demo_rules", return_value={
+        with patch("routers.normalization.create_demo_rules", return_value={
             "created_groups": 3, "created_rules": 15,
         }), patch("routers.normalization.get_settings") as mock_settings:
             mock_settings.return_value.custom_normalization_tags = []
@@ -514,7 +881,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL", "CNN": "CNN"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine):
+             patch("routers.normalization.get_normalization_engine", return_value=engine):
             response = await async_client.post("/api/normalization/apply-to-channels?dry_run=true")
 
         assert response.status_code == 200
@@ -544,7 +911,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL", "RTL": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine):
+             patch("routers.normalization.get_normalization_engine", return_value=engine):
             response = await async_client.post("/api/normalization/apply-to-channels?dry_run=true")
 
         assert response.status_code == 200
@@ -562,7 +929,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine), \
+             patch("routers.normalization.get_normalization_engine", return_value=engine), \
              patch("routers.normalization.journal") as mock_journal:
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=false",
@@ -597,7 +964,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL", "RTL": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine), \
+             patch("routers.normalization.get_normalization_engine", return_value=engine), \
              patch("routers.normalization.journal") as mock_journal:
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=false",
@@ -631,7 +998,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL", "RTL": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine), \
+             patch("routers.normalization.get_normalization_engine", return_value=engine), \
              patch("routers.normalization.journal") as mock_journal:
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=false",
@@ -664,7 +1031,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL", "RTL": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine), \
+             patch("routers.normalization.get_normalization_engine", return_value=engine), \
              patch("routers.normalization.journal"):
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=false",
@@ -686,7 +1053,7 @@ class TestApplyToChannels:
         engine = self._mock_engine({"RTL ᴿᴬᵂ": "RTL"})
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine):
+             patch("routers.normalization.get_normalization_engine", return_value=engine):
             response = await async_client.post("/api/normalization/apply-to-channels?dry_run=true")
 
         assert response.status_code == 200
@@ -721,7 +1088,7 @@ class TestApplyToChannelsRuleTrace:
         client.get_channel_groups.return_value = []
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine):
+             patch("routers.normalization.get_normalization_engine", return_value=engine):
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=true"
             )
@@ -783,7 +1150,7 @@ class TestApplyToChannelsAdminGate:
         engine.normalize.return_value = MagicMock(normalized="RTL", transformations=[])
 
         with patch("routers.normalization.get_client", return_value=client), \
-             patch("normalization_engine.get_normalization_engine", return_value=engine):
+             patch("routers.normalization.get_normalization_engine", return_value=engine):
             response = await async_client.post(
                 "/api/normalization/apply-to-channels?dry_run=true"
             )
@@ -815,7 +1182,7 @@ class TestApplyToChannelsIdempotencyLock:
         await normalization_router._APPLY_TO_CHANNELS_EXECUTE_LOCK.acquire()
         try:
             with patch("routers.normalization.get_client", return_value=client), \
-                 patch("normalization_engine.get_normalization_engine", return_value=engine):
+                 patch("routers.normalization.get_normalization_engine", return_value=engine):
                 response = await async_client.post(
                     "/api/normalization/apply-to-channels?dry_run=false",
                     json={"actions": [{"channel_id": 1, "action": "rename"}]},
@@ -842,7 +1209,7 @@ class TestApplyToChannelsIdempotencyLock:
         await normalization_router._APPLY_TO_CHANNELS_EXECUTE_LOCK.acquire()
         try:
             with patch("routers.normalization.get_client", return_value=client), \
-                 patch("normalization_engine.get_normalization_engine", return_value=engine):
+                 patch("routers.normalization.get_normalization_engine", return_value=engine):
                 response = await async_client.post(
                     "/api/normalization/apply-to-channels?dry_run=true"
                 )
@@ -1,12 +1,14 @@
 """
 Unit tests for notification endpoints.
 
-Tests: GET /api/notifications, POST /api/notifications,
+Tests: GET /api/notifications, POST /api/notifications, POST /api/notifications/batch,
        PATCH /api/notifications/mark-all-read, PATCH /api/notifications/{id},
        DELETE /api/notifications/{id}, DELETE /api/notifications,
        DELETE /api/notifications/by-source
 Uses async_client fixture which patches database session.
 """
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 
@@ -69,6 +71,43 @@ class TestGetNotifications:
         assert data["page_size"] == 2
         assert len(data["notifications"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_page_past_end_reports_total(self, async_client, test_session):
+        """A page past the last one is empty but still reports the total."""
+        for i in range(3):
+            _create_notification(test_session, title=f"Notif {i}")
+
+        response = await async_client.get("/api/notifications", params={"page": 3, "page_size": 2})
+        data = response.json()
+        assert data["notifications"] == []
+        assert data["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_through_ties(self, async_client, test_session):
+        """next_cursor walks every notification exactly once, newest first,
+        even when created_at ties."""
+        from datetime import datetime
+        same_time = datetime(2026, 1, 1, 12, 0)
+        for i in range(5):
+            _create_notification(test_session, title=f"Notif {i}", created_at=same_time)
+
+        titles, cursor = [], None
+        for _ in range(3):
+            params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+            data = (await async_client.get("/api/notifications", params=params)).json()
+            assert data["total"] == 5
+            titles += [n["title"] for n in data["notifications"]]
+            cursor = data["next_cursor"]
+
+        assert titles == [f"Notif {i}" for i in reversed(range(5))]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, async_client):
+        """A cursor that was not issued by the API is a 400."""
+        response = await async_client.get("/api/notifications", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_filter_unread_only(self, async_client, test_session):
         """Filters to only unread notifications."""
@@ -106,6 +145,46 @@ class TestGetNotifications:
         data = response.json()
         assert data["unread_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_repeat_poll_served_from_cache(self, async_client, test_session, test_engine):
+        """A repeat poll with the same query runs no SQL."""
+        from sqlalchemy import event
+
+        _create_notification(test_session)
+        first = await async_client.get("/api/notifications")
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            second = await async_client.get("/api/notifications")
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert second.json() == first.json()
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_pages(self, async_client, test_session):
+        """Creating and marking read show up on the next poll."""
+        notif = _create_notification(test_session, title="Existing")
+        await async_client.get("/api/notifications")
+        await async_client.get("/api/notifications", params={"unread_only": True})
+
+        with patch("services.notification_service._dispatch_to_alert_channels", new_callable=AsyncMock):
+            await async_client.post("/api/notifications", json={"message": "New", "send_alerts": False})
+        data = (await async_client.get("/api/notifications")).json()
+        assert data["total"] == 2
+        assert data["unread_count"] == 2
+
+        await async_client.patch(f"/api/notifications/{notif.id}", params={"read": True})
+        data = (await async_client.get("/api/notifications", params={"unread_only": True})).json()
+        assert data["total"] == 1
+        assert data["unread_count"] == 1
+
 
 class TestCreateNotification:
     """Tests for POST /api/notifications."""
@@ -148,6 +227,77 @@ class TestCreateNotification:
         assert response.status_code == 400
 
 
+class TestCreateNotificationsBatch:
+    """Tests for POST /api/notifications/batch."""
+
+    @pytest.mark.asyncio
+    async def test_creates_all_items_in_one_insert(self, async_client, test_session, test_engine):
+        """Every item is written by a single INSERT and returned in order."""
+        from sqlalchemy import event
+
+        inserts = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = await async_client.post("/api/notifications/batch", json={"items": [
+                {"message": f"Alert {i}", "notification_type": "warning", "send_alerts": False}
+                for i in range(3)
+            ]})
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 3
+        assert [n["message"] for n in data["notifications"]] == ["Alert 0", "Alert 1", "Alert 2"]
+        assert all(n["id"] for n in data["notifications"])
+        assert len(inserts) == 1
+        assert test_session.query(Notification).count() == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_item_rejects_batch(self, async_client, test_session):
+        """One invalid item fails the whole batch before anything is written."""
+        response = await async_client.post("/api/notifications/batch", json={"items": [
+            {"message": "Fine"},
+            {"message": "Bad", "notification_type": "invalid"},
+        ]})
+
+        assert response.status_code == 400
+        assert "Item 1" in response.json()["detail"]
+        assert test_session.query(Notification).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_dispatches_alerts_only_for_items_that_want_them(self, async_client):
+        """Alerts go out for items with send_alerts, all from one background task."""
+        with patch("services.notification_service._dispatch_to_alert_channels", new_callable=AsyncMock) as mock_dispatch:
+            await async_client.post("/api/notifications/batch", json={"items": [
+                {"message": "Loud", "title": "One"},
+                {"message": "Quiet", "send_alerts": False},
+                {"message": "Loud too", "title": "Three"},
+            ]})
+            await asyncio.sleep(0)
+
+        assert [c.kwargs["message"] for c in mock_dispatch.call_args_list] == ["Loud", "Loud too"]
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_pages(self, async_client):
+        """A batch shows up on the next poll."""
+        await async_client.get("/api/notifications")
+
+        await async_client.post("/api/notifications/batch", json={"items": [
+            {"message": "A", "send_alerts": False},
+            {"message": "B", "send_alerts": False},
+        ]})
+        data = (await async_client.get("/api/notifications")).json()
+
+        assert data["total"] == 2
+        assert data["unread_count"] == 2
+
+
 class TestMarkAllNotificationsRead:
     """Tests for PATCH /api/notifications/mark-all-read."""
 
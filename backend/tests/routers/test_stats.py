@@ -535,6 +535,63 @@ class TestWatchHistory:
         assert data["history"] == []
         assert "summary" in data
 
+    @pytest.mark.asyncio
+    async def test_paginates_with_total(self, async_client, test_session):
+        """Pages are newest first and carry the filtered total; a page past
+        the end is empty but still reports it."""
+        from datetime import date, datetime, timedelta
+        from models import UniqueClientConnection
+
+        start = datetime(2026, 1, 1, 12, 0)
+        for i in range(5):
+            test_session.add(UniqueClientConnection(
+                ip_address="10.0.0.1", channel_id="a" if i < 4 else "b",
+                channel_name="A", date=date(2026, 1, 1),
+                connected_at=start + timedelta(minutes=i), watch_seconds=60,
+            ))
+        test_session.commit()
+
+        page = (await async_client.get("/api/stats/watch-history", params={
+            "channel_id": "a", "page": 2, "page_size": 3,
+        })).json()
+        past_end = (await async_client.get("/api/stats/watch-history", params={
+            "channel_id": "a", "page": 3, "page_size": 3,
+        })).json()
+
+        assert page["total"] == 4
+        assert page["total_pages"] == 2
+        assert [h["connected_at"] for h in page["history"]] == ["2026-01-01T12:00:00Z"]
+        assert past_end["total"] == 4
+        assert past_end["history"] == []
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self, async_client, test_session):
+        """next_cursor continues where the previous page ended, with the
+        filtered total on every page, and is None on the last page."""
+        from datetime import date, datetime, timedelta
+        from models import UniqueClientConnection
+
+        start = datetime(2026, 1, 1, 12, 0)
+        for i in range(5):
+            test_session.add(UniqueClientConnection(
+                ip_address="10.0.0.1", channel_id="a", channel_name="A",
+                date=date(2026, 1, 1), connected_at=start + timedelta(minutes=i // 2),
+                watch_seconds=60,
+            ))
+        test_session.commit()
+
+        first = (await async_client.get("/api/stats/watch-history", params={
+            "page_size": 3,
+        })).json()
+        second = (await async_client.get("/api/stats/watch-history", params={
+            "page_size": 3, "cursor": first["next_cursor"],
+        })).json()
+
+        ids = [h["id"] for h in first["history"] + second["history"]]
+        assert ids == [5, 4, 3, 2, 1]
+        assert second["total"] == 5
+        assert second["next_cursor"] is None
+
 
 class TestPopularityRankings:
     """Tests for GET /api/stats/popularity/rankings."""
@@ -1,8 +1,9 @@
 """
 Unit tests for notification service internal functions.
 
-Tests: create_notification_internal, update_notification_internal,
-       delete_notifications_by_source_internal, _dispatch_to_alert_channels
+Tests: create_notification_internal, create_notifications_batch_internal,
+       update_notification_internal, delete_notifications_by_source_internal,
+       _dispatch_to_alert_channels
 Mocks: database sessions (via main.get_session), alert channel dispatch.
 """
 import json
@@ -159,6 +160,38 @@ class TestCreateNotificationInternal:
         assert parsed["count"] == 42
 
 
+class TestCreateNotificationsBatchInternal:
+    """Tests for create_notifications_batch_internal()."""
+
+    @pytest.mark.asyncio
+    async def test_skips_empty_messages_and_defaults_invalid_type(self, test_session):
+        """Same item rules as the single-row helper, metadata stored as JSON."""
+        with patch("services.notification_service.get_session", return_value=test_session):
+            from services.notification_service import create_notifications_batch_internal
+
+            results = await create_notifications_batch_internal([
+                {"message": "First", "notification_type": "bogus", "send_alerts": False},
+                {"message": "", "send_alerts": False},
+                {"message": "Third", "metadata": {"k": "v"}, "send_alerts": False},
+            ])
+
+        assert [r["message"] for r in results] == ["First", "Third"]
+        assert results[0]["type"] == "info"
+        assert results[1]["metadata"] == {"k": "v"}
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_when_nothing_to_insert(self, test_session):
+        """No valid items means no INSERT and no cache invalidation."""
+        with patch("services.notification_service.get_session", return_value=test_session), \
+             patch("services.notification_service.invalidate_notifications_cache") as mock_invalidate:
+            from services.notification_service import create_notifications_batch_internal
+
+            results = await create_notifications_batch_internal([{"message": ""}])
+
+        assert results == []
+        mock_invalidate.assert_not_called()
+
+
 class TestUpdateNotificationInternal:
     """Tests for update_notification_internal()."""
 
@@ -0,0 +1,208 @@
+"""
+Unit tests for DispatcharrClient short-lived lookup memos.
+
+get_server_groups() keeps the last fetched list for a short window so bulk
+update/delete bursts share one upstream call; channel_group_names() caches
+the id -> name map; get_m3u_account() memoizes each account briefly. Writes
+through the client clear the matching memo.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config import DispatcharrSettings
+from dispatcharr_client import DispatcharrClient
+
+
+def _response(json_body):
+    resp = MagicMock()
+    resp.json.return_value = json_body
+    return resp
+
+
+@pytest.fixture
+async def client():
+    settings = DispatcharrSettings(
+        url="http://dispatcharr:8000",
+        auth_method="api_key",
+        api_key="key-abc",
+    )
+    c = DispatcharrClient(settings)
+    yield c
+    await c._client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_share_one_fetch(client):
+    request_mock = AsyncMock(return_value=_response([{"id": 1, "name": "A"}]))
+    with patch.object(client, "_request", request_mock):
+        first = await client.get_server_groups()
+        second = await client.get_server_groups()
+
+    assert first == second == [{"id": 1, "name": "A"}]
+    assert request_mock.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_refetches(client):
+    request_mock = AsyncMock(return_value=_response([]))
+    with patch.object(client, "_request", request_mock):
+        await client.get_server_groups()
+        await client.get_server_groups(use_cache=False)
+
+    assert request_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_memo_refetches(client):
+    request_mock = AsyncMock(return_value=_response([]))
+    with patch.object(client, "_request", request_mock), \
+         patch("dispatcharr_client.time.monotonic", side_effect=[100.0, 101.0]):
+        await client.get_server_groups()
+        await client.get_server_groups()
+
+    assert request_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+async def test_writes_invalidate_memo(client, write):
+    request_mock = AsyncMock(return_value=_response([]))
+    with patch.object(client, "_request", request_mock):
+        await client.get_server_groups()
+        if write == "create":
+            await client.create_server_group({"name": "B"})
+        elif write == "update":
+            await client.update_server_group(1, {"name": "B"})
+        else:
+            await client.delete_server_group(1)
+        await client.get_server_groups()
+
+    # read + write + re-read
+    assert request_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_channel_group_names_cached(client):
+    get_groups = AsyncMock(return_value=[{"id": 1, "name": "News"}, {"id": 2, "name": "Sports"}])
+    with patch.object(client, "get_channel_groups", get_groups):
+        first = await client.channel_group_names()
+        second = await client.channel_group_names()
+
+    assert first == second == {1: "News", 2: "Sports"}
+    assert get_groups.await_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+async def test_channel_group_writes_invalidate_names(client, write):
+    get_groups = AsyncMock(return_value=[])
+    request_mock = AsyncMock(return_value=_response({"id": 3}))
+    request_mock.return_value.status_code = 200
+    with patch.object(client, "get_channel_groups", get_groups), \
+         patch.object(client, "_request", request_mock):
+        await client.channel_group_names()
+        if write == "create":
+            await client.create_channel_group("New")
+        elif write == "update":
+            await client.update_channel_group(3, {"name": "Renamed"})
+        else:
+            await client.delete_channel_group(3)
+        await client.channel_group_names()
+
+    assert get_groups.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_m3u_account_memo_is_per_account(client):
+    request_mock = AsyncMock(side_effect=lambda method, path: _response({"path": path}))
+    with patch.object(client, "_request", request_mock):
+        first = await client.get_m3u_account(1)
+        again = await client.get_m3u_account(1)
+        other = await client.get_m3u_account(2)
+        fresh = await client.get_m3u_account(1, use_cache=False)
+
+    assert first == again == fresh == {"path": "/api/m3u/accounts/1/"}
+    assert other == {"path": "/api/m3u/accounts/2/"}
+    assert request_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", ["refresh", "group_settings", "delete_channel_group"])
+async def test_m3u_account_writes_invalidate_memo(client, write):
+    request_mock = AsyncMock(return_value=_response({"id": 1}))
+    with patch.object(client, "_request", request_mock):
+        await client.get_m3u_account(1)
+        if write == "refresh":
+            await client.refresh_m3u_account(1)
+        elif write == "group_settings":
+            await client.update_m3u_group_settings(1, {"group_settings": []})
+        else:
+            await client.delete_channel_group(5)
+        await client.get_m3u_account(1)
+
+    # read + write + re-read
+    assert request_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_m3u_account_patch_seeds_memo(client):
+    request_mock = AsyncMock(side_effect=[
+        _response({"id": 1, "is_active": True}),
+        _response({"id": 1, "is_active": False}),
+    ])
+    with patch.object(client, "_request", request_mock):
+        await client.get_m3u_account(1)
+        await client.patch_m3u_account(1, {"is_active": False})
+        after = await client.get_m3u_account(1)
+
+    assert after == {"id": 1, "is_active": False}
+    assert request_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_reads_share_one_fetch(client):
+    import asyncio
+
+    async def slow_groups():
+        await asyncio.sleep(0)
+        return [{"id": 1, "name": "News"}]
+
+    get_groups = AsyncMock(side_effect=slow_groups)
+    request_mock = AsyncMock(return_value=_response([]))
+    with patch.object(client, "get_channel_groups", get_groups), \
+         patch.object(client, "_request", request_mock):
+        names = await asyncio.gather(*(client.channel_group_names() for _ in range(5)))
+        await asyncio.gather(*(client.get_server_groups() for _ in range(5)))
+
+    assert all(n == {1: "News"} for n in names)
+    assert get_groups.await_count == 1
+    assert request_mock.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_server_group_uses_fresh_list_memo(client):
+    request_mock = AsyncMock(return_value=_response([{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]))
+    with patch.object(client, "_request", request_mock):
+        await client.get_server_groups()
+        group = await client.get_server_group(2)
+        missing = await client.get_server_group(9)
+
+    assert group == {"id": 2, "name": "B"}
+    assert missing == {}
+    assert request_mock.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_server_group_fetches_by_id_without_memo(client):
+    found = _response({"id": 2, "name": "B"})
+    found.status_code = 200
+    not_found = _response({})
+    not_found.status_code = 404
+    request_mock = AsyncMock(side_effect=[found, not_found])
+    with patch.object(client, "_request", request_mock):
+        group = await client.get_server_group(2)
+        missing = await client.get_server_group(9)
+
+    assert group == {"id": 2, "name": "B"}
+    assert missing == {}
+    assert request_mock.await_args_list[0].args == ("GET", "/api/m3u/server-groups/2/")
@@ -0,0 +1,54 @@
+"""
+Unit tests for the shared DispatcharrClient returned by get_client().
+
+The client and its connection pool are reused across calls, rebuilt only when
+the connection settings change. The superseded client is left open for
+callers that still hold it.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import dispatcharr_client
+from config import DispatcharrSettings
+
+
+@pytest.fixture(autouse=True)
+def fresh_singleton():
+    dispatcharr_client.reset_client()
+    yield
+    dispatcharr_client.reset_client()
+
+
+def _settings(url="http://dispatcharr:8000"):
+    return DispatcharrSettings(url=url, auth_method="api_key", api_key="key-abc")
+
+
+def test_same_settings_object_reuses_client():
+    settings = _settings()
+    with patch("dispatcharr_client.get_settings", return_value=settings), \
+         patch("dispatcharr_client._settings_hash", wraps=dispatcharr_client._settings_hash) as hash_mock:
+        first = dispatcharr_client.get_client()
+        second = dispatcharr_client.get_client()
+
+    assert first is second
+    assert hash_mock.call_count == 1
+
+
+def test_equal_settings_reload_reuses_client():
+    with patch("dispatcharr_client.get_settings", side_effect=[_settings(), _settings()]):
+        first = dispatcharr_client.get_client()
+        second = dispatcharr_client.get_client()
+
+    assert first is second
+
+
+def test_changed_settings_leave_replaced_client_open():
+    with patch("dispatcharr_client.get_settings", side_effect=[_settings(), _settings("http://other:9000")]):
+        first = dispatcharr_client.get_client()
+        with patch.object(first, "close", AsyncMock()) as close_mock:
+            second = dispatcharr_client.get_client()
+            dispatcharr_client.reset_client()
+
+    assert first is not second
+    close_mock.assert_not_called()
+    assert not first._client.is_closed
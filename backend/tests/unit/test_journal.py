@@ -64,8 +64,23 @@ class TestLogEntry:
                 after_value=after,
             )
 
-            assert result.before_value == json.dumps(before)
-            assert result.after_value == json.dumps(after)
+            assert json.loads(result.before_value) == before
+            assert json.loads(result.after_value) == after
+
+    def test_log_entry_stringifies_int_keys(self, test_session):
+        """Int dict keys are stored as strings, matching json.dumps."""
+        with patch("journal.get_session", return_value=test_session):
+            from journal import log_entry
+
+            result = log_entry(
+                category="m3u",
+                action_type="update",
+                entity_name="IPTV",
+                description="Updated group settings",
+                before_value={10: {"enabled": True, "name": "Café"}},
+            )
+
+            assert json.loads(result.before_value) == {"10": {"enabled": True, "name": "Café"}}
 
     def test_log_entry_stores_user_initiated_flag(self, test_session):
         """log_entry stores user_initiated flag."""
@@ -131,6 +146,82 @@ class TestLogEntry:
             assert result is None
 
 
+class TestLogEntryBackground:
+    """Tests for log_entry_background() and flush_background_entries()."""
+
+    async def test_background_entry_is_written_after_flush(self, test_session):
+        """A scheduled entry is committed once pending writes are flushed."""
+        from models import JournalEntry
+
+        with patch("journal.get_session", return_value=test_session):
+            from journal import flush_background_entries, log_entry_background
+
+            log_entry_background(
+                category="m3u",
+                action_type="update",
+                entity_name="IPTV",
+                description="M3U account disabled",
+                entity_id=7,
+            )
+            await flush_background_entries()
+
+        entry = test_session.query(JournalEntry).filter_by(entity_id=7).one()
+        assert entry.description == "M3U account disabled"
+
+    async def test_queued_entries_share_one_commit(self, test_session):
+        """Entries queued back-to-back are written in a single transaction."""
+        from models import JournalEntry
+
+        with patch("journal.get_session", return_value=test_session), \
+             patch.object(test_session, "commit", wraps=test_session.commit) as commit:
+            from journal import flush_background_entries, log_entry_background
+
+            for i in range(3):
+                log_entry_background(
+                    category="m3u",
+                    action_type="update",
+                    entity_name=f"IPTV {i}",
+                    description="Batched",
+                    entity_id=100 + i,
+                )
+            await flush_background_entries()
+
+        assert commit.call_count == 1
+        assert test_session.query(JournalEntry).filter_by(description="Batched").count() == 3
+
+    async def test_bad_entry_does_not_drop_batch(self, test_session):
+        """An entry that fails to serialize is skipped; the rest of the batch is kept."""
+        from models import JournalEntry
+
+        with patch("journal.get_session", return_value=test_session):
+            from journal import flush_background_entries, log_entry_background
+
+            log_entry_background(
+                category="m3u",
+                action_type="update",
+                entity_name="Bad",
+                description="Unserializable",
+                before_value={"value": object()},
+            )
+            log_entry_background(
+                category="m3u",
+                action_type="update",
+                entity_name="Good",
+                description="Kept",
+                entity_id=9,
+            )
+            await flush_background_entries()
+
+        assert test_session.query(JournalEntry).filter_by(entity_id=9).one().description == "Kept"
+        assert test_session.query(JournalEntry).filter_by(entity_name="Bad").count() == 0
+
+    async def test_flush_with_nothing_pending(self):
+        """Flushing with no pending writes returns immediately."""
+        from journal import flush_background_entries
+
+        await flush_background_entries()
+
+
 class TestGetEntries:
     """Tests for get_entries() function."""
 
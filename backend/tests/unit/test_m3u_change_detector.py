@@ -610,3 +610,27 @@ class TestM3UChangeDetector:
         assert summary["streams_added"] == 20
         assert summary["streams_removed"] == 8
         assert set(summary["accounts_affected"]) == {1, 2}
+
+    def test_get_change_summary_aggregates_repeats_per_account(self, test_session):
+        """Repeated change types sum per account; other types only count toward the total."""
+        detector = M3UChangeDetector(test_session)
+        now = datetime.utcnow()
+
+        test_session.add_all([
+            M3UChangeLog(m3u_account_id=1, change_time=now, change_type="streams_added", count=3),
+            M3UChangeLog(m3u_account_id=1, change_time=now, change_type="streams_added", count=4),
+            M3UChangeLog(m3u_account_id=1, change_time=now, change_type="group_added", count=9),
+            M3UChangeLog(m3u_account_id=1, change_time=now, change_type="group_added", count=9),
+            M3UChangeLog(m3u_account_id=1, change_time=now, change_type="streams_modified", count=2),
+            M3UChangeLog(m3u_account_id=2, change_time=now, change_type="streams_added", count=50),
+            M3UChangeLog(m3u_account_id=1, change_time=now - timedelta(days=2),
+                         change_type="streams_added", count=100),
+        ])
+        test_session.commit()
+
+        summary = detector.get_change_summary(now - timedelta(hours=1), m3u_account_id=1)
+
+        assert summary["total_changes"] == 5
+        assert summary["streams_added"] == 7
+        assert summary["groups_added"] == 2
+        assert summary["accounts_affected"] == [1]
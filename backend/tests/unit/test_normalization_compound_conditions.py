@@ -10,6 +10,8 @@ The fix captures the first *matching*, non-negated condition's span regardless o
 index, which also covers the analogous AND case where condition 1 is a negated guard.
 """
 import pytest
+from hypothesis import HealthCheck, given, settings as hyp_settings
+from hypothesis import strategies as st
 
 from normalization_engine import NormalizationEngine
 
@@ -73,3 +75,69 @@ def test_and_rule_negated_first_condition_uses_first_positive_match(engine):
     assert result["matched"] is True
     # Pre-fix: primary_match stayed None (the i == 0 condition was negated), match_end=len(text) → "".
     assert result["after"] == "Sports Channel"
+
+
+# ---------------------------------------------------------------------------
+# Short-circuit evaluation: same result and primary span as evaluating every
+# condition, with cheap conditions checked before regexes.
+# ---------------------------------------------------------------------------
+
+
+def _evaluate_all(engine, text, conditions, logic):
+    """Reference: evaluate every condition in order, then combine."""
+    results = []
+    primary = None
+    for cond in conditions:
+        match = engine._match_single_condition(
+            text, cond.get("type", "always"), cond.get("value", ""), cond.get("case_sensitive", False),
+        )
+        negate = cond.get("negate", False)
+        results.append(match.matched != negate)
+        if primary is None and match.matched and not negate:
+            primary = match
+    if not (any(results) if logic == "OR" else all(results)):
+        return (False, None, None)
+    if primary:
+        return (True, primary.match_start, primary.match_end)
+    return (True, 0, len(text))
+
+
+_CONDITION = st.fixed_dictionaries({
+    "type": st.sampled_from(["always", "contains", "starts_with", "ends_with", "regex"]),
+    "value": st.sampled_from(["UK", "HD", "News", "^UK", r"\bHD$", "x"]),
+    "negate": st.booleans(),
+})
+
+
+@given(
+    text=st.sampled_from(["UK | News HD", "US: Sports", "HD News", "UK HD", ""]),
+    conditions=st.lists(_CONDITION, min_size=1, max_size=4),
+    logic=st.sampled_from(["AND", "OR"]),
+)
+@hyp_settings(max_examples=300, suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_short_circuit_matches_full_evaluation(engine, text, conditions, logic):
+    match = engine._match_compound_conditions(text, conditions, logic)
+    expected = _evaluate_all(engine, text, conditions, logic)
+    if expected[0]:
+        assert (match.matched, match.match_start, match.match_end) == expected
+    else:
+        assert match.matched is False
+
+
+def test_and_skips_regex_when_cheap_condition_fails(engine):
+    calls = []
+    original = engine._match_single_condition
+
+    def spy(text, condition_type, pattern, case_sensitive=False):
+        calls.append(condition_type)
+        return original(text, condition_type, pattern, case_sensitive)
+
+    engine._match_single_condition = spy
+    match = engine._match_compound_conditions(
+        "US: Sports",
+        [{"type": "regex", "value": r"(\w+)+$"}, {"type": "starts_with", "value": "UK"}],
+        "AND",
+    )
+
+    assert match.matched is False
+    assert calls == ["starts_with"]
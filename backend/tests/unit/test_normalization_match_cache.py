@@ -0,0 +1,96 @@
+"""
+Per-rule memoization in NormalizationEngine's match path.
+
+A rule's condition pattern goes through the NormalizationPolicy, and its
+compound conditions JSON is parsed, once per engine rather than once per
+text the rule is matched against. count_matches_bulk() lowercases each text
+once for all case-insensitive rules.
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from models import NormalizationRule
+from normalization_engine import NormalizationEngine, NormalizationPolicy
+from tests.fixtures.factories import (
+    create_normalization_rule,
+    create_normalization_rule_group,
+)
+
+TEXTS = ["ESPN HD", "CNN HD", "Fox News", "BBC One HD"]
+
+
+@pytest.fixture
+def engine(test_session):
+    group = create_normalization_rule_group(test_session, name="quality", priority=0)
+    create_normalization_rule(
+        test_session, group.id, name="hd", condition_value="HD", priority=0,
+    )
+    create_normalization_rule(
+        test_session, group.id, name="news-or-one", condition_type=None, priority=1,
+        action_type="replace", action_value="X",
+        conditions=json.dumps([
+            {"type": "contains", "value": "News"},
+            {"type": "ends_with", "value": "One"},
+        ]),
+        condition_logic="OR",
+    )
+    return NormalizationEngine(test_session)
+
+
+def test_pattern_prepared_once_per_rule(engine):
+    apply_to_text = NormalizationPolicy.apply_to_text
+    seen = []
+
+    def spy(policy, text):
+        seen.append(text)
+        return apply_to_text(policy, text)
+
+    with patch.object(NormalizationPolicy, "apply_to_text", autospec=True, side_effect=spy):
+        engine.test_rules_batch(TEXTS)
+
+    assert seen.count("HD") == 1
+    assert seen.count("News") == 1
+    assert seen.count("One") == 1
+
+
+def test_conditions_parsed_once_per_rule(engine):
+    with patch.object(
+        NormalizationRule, "get_conditions", autospec=True,
+        side_effect=NormalizationRule.get_conditions,
+    ) as get_conditions:
+        results = engine.test_rules_batch(TEXTS)
+
+    compound_calls = [c for c in get_conditions.call_args_list if c.args[0].conditions]
+    assert len(compound_calls) == 1
+    assert [r.normalized for r in results] == ["ESPN", "CNN", "Fox X", "BBC X"]
+
+
+def test_invalidate_cache_drops_memoized_patterns(engine):
+    engine.test_rules_batch(TEXTS)
+    assert engine._pattern_cache and engine._conditions_cache
+
+    engine.invalidate_cache()
+
+    assert not engine._pattern_cache
+    assert not engine._conditions_cache
+
+
+def test_bulk_counts_mix_case_sensitive_and_insensitive(test_session):
+    group = create_normalization_rule_group(test_session, name="case", priority=0)
+    rules = [
+        create_normalization_rule(test_session, group.id, name="hd-any", condition_value="hd"),
+        create_normalization_rule(
+            test_session, group.id, name="hd-exact", condition_value="hd", case_sensitive=True,
+        ),
+        create_normalization_rule(
+            test_session, group.id, name="hd-suffix", condition_type="ends_with", condition_value="hd",
+        ),
+    ]
+    engine = NormalizationEngine(test_session)
+    texts = ["ESPN HD", "cnn hd", "HDTV", "Fox"]
+
+    counts = engine.count_matches_bulk(texts, rules)
+
+    assert [counts[r.id] for r in rules] == [3, 1, 2]
@@ -256,6 +256,26 @@ def test_full_pipeline_equivalence(engine, seeded_rules, fixture: NormalizationF
     )
 
 
+# =============================================================================
+# Variant C — bulk rule-stats counting
+# =============================================================================
+
+def test_count_matches_bulk_equals_per_pair_matching(engine, seeded_rules):
+    """Variant C: count_matches_bulk() agrees with _match_condition() per pair.
+
+    /rule-stats counts through the bulk path, which runs the policy once
+    per text instead of inside every match; the counts must not drift.
+    """
+    texts = [f.input for f in ALL_FIXTURES]
+    rules = [rule for _group, rule in seeded_rules]
+
+    bulk = engine.count_matches_bulk(texts, rules)
+
+    for rule in rules:
+        expected = sum(1 for text in texts if engine._match_condition(text, rule).matched)
+        assert bulk[rule.id] == expected, rule.name
+
+
 # =============================================================================
 # Pinned-regression spot checks — named, greppable, load-bearing.
 # These assert the *expected* normalized output, not just parity.
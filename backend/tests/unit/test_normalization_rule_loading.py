@@ -0,0 +1,129 @@
+"""
+Rule loading in NormalizationEngine.
+
+get_all_rules() (GET /api/normalization/rules) and _load_rules() (every
+normalize() call on a cold cache) load all rules in one query and bucket
+them by group, instead of one rules query per group. Engines from
+get_normalization_engine() share the loaded ruleset until
+invalidate_rules_cache().
+"""
+import pytest
+from sqlalchemy import event
+
+import normalization_engine
+from normalization_engine import (
+    NormalizationEngine,
+    get_normalization_engine,
+    invalidate_rules_cache,
+)
+from tests.fixtures.factories import (
+    create_normalization_rule,
+    create_normalization_rule_group,
+)
+
+
+@pytest.fixture
+def engine(test_session):
+    return NormalizationEngine(test_session)
+
+
+@pytest.fixture
+def three_groups(test_session):
+    """Three groups (one empty, one disabled rule) in non-id priority order."""
+    late = create_normalization_rule_group(test_session, name="late", priority=20)
+    early = create_normalization_rule_group(test_session, name="early", priority=10)
+    empty = create_normalization_rule_group(test_session, name="empty", priority=30)
+    create_normalization_rule(test_session, late.id, name="late-2", priority=2)
+    create_normalization_rule(test_session, late.id, name="late-1", priority=1)
+    create_normalization_rule(test_session, early.id, name="early-off", priority=0, enabled=False)
+    create_normalization_rule(test_session, early.id, name="early-1", priority=1)
+    return early, late, empty
+
+
+def _count_selects(test_engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_get_all_rules_uses_two_queries(engine, test_engine, three_groups):
+    statements, stop = _count_selects(test_engine)
+    try:
+        groups = engine.get_all_rules()
+    finally:
+        stop()
+
+    assert len(statements) == 2
+    assert [g["name"] for g in groups] == ["early", "late", "empty"]
+    assert [[r["name"] for r in g["rules"]] for g in groups] == [
+        ["early-off", "early-1"],
+        ["late-1", "late-2"],
+        [],
+    ]
+
+
+def test_load_rules_skips_disabled_rules(engine, three_groups):
+    loaded = engine._load_rules()
+
+    assert [(g.name, [r.name for r in rules]) for g, rules in loaded] == [
+        ("early", ["early-1"]),
+        ("late", ["late-1", "late-2"]),
+        ("empty", []),
+    ]
+
+
+def test_factory_engines_share_loaded_ruleset(test_engine, test_session, three_groups):
+    first = get_normalization_engine(test_session)
+    expected = first.normalize("ESPN HD")
+
+    statements, stop = _count_selects(test_engine)
+    try:
+        second = get_normalization_engine(test_session)
+        result = second.normalize("ESPN HD")
+    finally:
+        stop()
+
+    assert not any("normalization_rule" in s for s in statements)
+    assert result.normalized == expected.normalized
+    assert [(g.name, [r.name for r in rules]) for g, rules in second._load_rules()] == [
+        ("early", ["early-1"]),
+        ("late", ["late-1", "late-2"]),
+        ("empty", []),
+    ]
+
+
+def test_invalidation_reloads_shared_ruleset(test_session, three_groups):
+    early, _, _ = three_groups
+    get_normalization_engine(test_session).normalize("ESPN HD")
+
+    create_normalization_rule(test_session, early.id, name="early-2", priority=2)
+    stale = get_normalization_engine(test_session)._load_rules()
+    invalidate_rules_cache()
+    fresh = get_normalization_engine(test_session)._load_rules()
+
+    assert [r.name for r in stale[0][1]] == ["early-1"]
+    assert [r.name for r in fresh[0][1]] == ["early-1", "early-2"]
+
+
+def test_load_racing_invalidation_is_not_shared(test_engine, test_session, three_groups):
+    def invalidate_mid_load(*args):
+        invalidate_rules_cache()
+
+    event.listen(test_engine, "before_cursor_execute", invalidate_mid_load)
+    try:
+        get_normalization_engine(test_session)._load_rules()
+    finally:
+        event.remove(test_engine, "before_cursor_execute", invalidate_mid_load)
+
+    assert normalization_engine._ruleset_snapshot is None
+
+
+def test_plain_engines_do_not_share_ruleset(engine, three_groups):
+    engine._load_rules()
+
+    assert normalization_engine._ruleset_snapshot is None
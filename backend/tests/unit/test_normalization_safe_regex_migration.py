@@ -219,6 +219,37 @@ class TestMatchSingleConditionRegex:
         )
 
 
+# =========================================================================
+# Site 1b — count_matches_bulk regex branch (pre-compiled safe_regex.search).
+# =========================================================================
+
+
+class TestCountMatchesBulkRegex:
+    """count_matches_bulk() regex rules: compiled once, same contract as Site 1."""
+
+    def test_counts_match_per_pair_path(self, engine, test_session):
+        rule = _mk_regex_rule(test_session, pattern=r"\bhd\b")
+        texts = ["ESPN HD", "HDTV", "cnn hd", "Fox"]
+
+        counts = engine.count_matches_bulk(texts, [rule])
+
+        expected = sum(1 for t in texts if engine._match_condition(t, rule).matched)
+        assert counts[rule.id] == expected == 2
+
+    def test_invalid_pattern_counts_zero(self, engine, test_session):
+        rule = _mk_regex_rule(test_session, pattern="[unclosed")
+        assert engine.count_matches_bulk(["[unclosed", "x"], [rule]) == {rule.id: 0}
+
+    def test_adversarial_pattern_counts_zero(self, engine, test_session, caplog):
+        rule = _mk_regex_rule(test_session, pattern=_EVIL_PATTERN_ALT)
+        start = time.perf_counter()
+        with caplog.at_level(logging.WARNING, logger="safe_regex"):
+            counts = engine.count_matches_bulk([_EVIL_INPUT_ALT], [rule])
+        assert time.perf_counter() - start < _MAX_ADVERSARIAL_SECONDS
+        assert counts == {rule.id: 0}
+        assert any("[SAFE_REGEX]" in m for m in caplog.messages)
+
+
 # =========================================================================
 # Sites 2 & 3 — _match_tag_group contains branches (search + match).
 # =========================================================================
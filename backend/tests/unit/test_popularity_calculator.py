@@ -471,6 +471,47 @@ class TestCalculateAll:
         assert score.previous_score == 50.0
         assert score.previous_rank == 1
 
+    def test_calculate_all_loads_existing_records_in_one_query(self, test_session, test_engine):
+        """Existing score records are preloaded in one query, not looked up per channel."""
+        from sqlalchemy import event
+
+        today = date.today()
+        test_session.add(ChannelPopularityScore(
+            channel_id="channel-0",
+            channel_name="Channel 0",
+            score=50.0,
+            rank=1,
+            trend="stable",
+            trend_percent=0.0,
+            calculated_at=datetime.utcnow() - timedelta(hours=1),
+        ))
+        for i in range(4):
+            _seed_watch_session(
+                test_session,
+                channel_id=f"channel-{i}",
+                channel_name=f"Channel {i}",
+                poll_count=40 - i * 5,
+            )
+        test_session.commit()
+
+        score_selects = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT") and "channel_popularity_scores" in statement:
+                score_selects.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            with patch("popularity_calculator.get_session", return_value=test_session):
+                with patch("popularity_calculator.get_current_date", return_value=today):
+                    result = PopularityCalculator().calculate_all()
+        finally:
+            event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert len(score_selects) == 1
+        assert result["channels_updated"] == 1
+        assert result["channels_created"] == 3
+
     def test_calculate_all_assigns_correct_ranks(self, test_session):
         """Assigns ranks based on score (1 = highest).
 
@@ -705,6 +746,28 @@ class TestGetRankings:
 
         assert result["rankings"][0]["rank"] == 3
 
+    def test_get_rankings_page_past_end_reports_total(self, test_session):
+        """An offset past the last ranking is empty but still reports the total."""
+        now = datetime.utcnow()
+
+        for i in range(3):
+            test_session.add(ChannelPopularityScore(
+                channel_id=f"channel-{i}",
+                channel_name=f"Channel {i}",
+                score=100 - i * 10,
+                rank=i + 1,
+                trend="stable",
+                trend_percent=0.0,
+                calculated_at=now,
+            ))
+        test_session.commit()
+
+        with patch("popularity_calculator.get_session", return_value=test_session):
+            result = PopularityCalculator.get_rankings(limit=2, offset=4)
+
+        assert result["total"] == 3
+        assert result["rankings"] == []
+
     def test_get_rankings_empty_database(self, test_session):
         """Returns empty list for empty database."""
         with patch("popularity_calculator.get_session", return_value=test_session):
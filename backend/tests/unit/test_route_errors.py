@@ -0,0 +1,63 @@
+"""
+Unit tests for route_errors.InternalErrorRoute.
+
+Unhandled handler exceptions become a sanitized 500; HTTPException and
+request-validation errors keep their own status codes.
+"""
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from route_errors import InternalErrorRoute
+
+
+class _Body(BaseModel):
+    name: str
+
+
+def _make_app() -> FastAPI:
+    router = APIRouter(prefix="/t", route_class=InternalErrorRoute)
+
+    @router.get("/boom")
+    async def boom():
+        raise RuntimeError("secret internals")
+
+    @router.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="Not here")
+
+    @router.post("/validate")
+    async def validate(body: _Body):
+        return {"name": body.name}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=_make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_becomes_sanitized_500(client):
+    response = await client.get("/t/boom")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+
+
+@pytest.mark.asyncio
+async def test_http_exception_passes_through(client):
+    response = await client.get("/t/missing")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Not here"}
+
+
+@pytest.mark.asyncio
+async def test_validation_error_passes_through(client):
+    response = await client.post("/t/validate", json={})
+    assert response.status_code == 422
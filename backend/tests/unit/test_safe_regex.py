@@ -190,6 +190,20 @@ class TestCompiledPatternReuse:
         assert m1 is not None and m1.group(0) == "123"
         assert m2 is not None and m2.group(0) == "987"
 
+    def test_repeat_compile_returns_cached_pattern(self):
+        """Same pattern + flags is compiled once; different flags compile separately."""
+        import re
+
+        first = safe_regex.compile(r"^news\b")
+        assert safe_regex.compile(r"^news\b") is first
+        assert safe_regex.compile(r"^news\b", flags=re.IGNORECASE) is not first
+
+    def test_invalid_pattern_keeps_raising(self):
+        """Compile errors are not cached; every call raises."""
+        for _ in range(2):
+            with pytest.raises(safe_regex.SafeRegexError):
+                safe_regex.compile(r"[unclosed")
+
 
 class TestFlagPropagation:
     def test_flags_propagate_to_search(self):